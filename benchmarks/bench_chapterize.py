@@ -0,0 +1,356 @@
+"""
+Time whole-book chapterization on synthetic EPUBs and the example book.
+
+Synthetic books are assembled from sentences of the example text with a
+configurable chapter count, paragraph length, ruby density and nav layout
+(EPUB 3 nav document, EPUB 2 NCX, several chapters per spine file split by
+nav anchors, or no nav at all). Every conversion runs in a freshly spawned
+process so its peak RSS is its own, and the report holds wall time, peak
+RSS and these stages:
+
+    setup     NLPBackend construction
+    mapping   reading the book and building its ruby mapping
+    extract   splitting the spine into chapters (until ``chapter_prepare``)
+    finalize  ``chapter_start`` to ``chapter_done``, summed over chapters
+
+followed by the pipeline's own ``stage_timing``/``chapter_done`` timings
+(parse, tokenize, tokens, pitch, render) summed over the book. Each run
+also reports the backend's tokenization cache hits and misses.
+
+By default each book is converted once before timing so the corpus mapping
+and surface pitch caches are warm; ``--cache cold`` gives every run an
+empty ``NK_CACHE_DIR`` instead. Save a report with ``--output`` and pass it
+back as ``--baseline`` to get per-book ratios against it.
+
+    python benchmarks/bench_chapterize.py --chapters 40 --ruby-density 0.5 --nav shared
+    python benchmarks/bench_chapterize.py --output before.json
+    python benchmarks/bench_chapterize.py --baseline before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import html
+import json
+import multiprocessing
+import os
+import random
+import re
+import statistics
+import sys
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from nk.chars import is_kana_string
+from nk.core import _nk_version, event_stage_seconds, iter_epub_chapters
+from nk.nlp import NLPBackend
+
+_EXAMPLE_DIR = Path(__file__).resolve().parents[1] / "example"
+_EXAMPLE_EPUB = _EXAMPLE_DIR / "[夏目漱石] 夢十夜.epub"
+_EXAMPLE_TEXT_DIR = _EXAMPLE_DIR / "[夏目漱石] 夢十夜"
+_SENTENCE = re.compile(r"[^。！？\n]+[。！？]?")
+_KANJI_RUN = re.compile(r"[一-鿿々]+")
+_NAV_LAYOUTS = ("nav", "ncx", "shared", "none")
+_CHAPTERS_PER_SHARED_FILE = 4
+
+_CONTAINER_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+  <rootfiles>
+    <rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>
+  </rootfiles>
+</container>
+"""
+
+
+def _example_sentences() -> list[str]:
+    sentences: list[str] = []
+    for path in sorted(_EXAMPLE_TEXT_DIR.glob("*.original.txt")):
+        for line in path.read_text(encoding="utf-8").splitlines()[1:]:
+            sentences.extend(match.group(0).strip() for match in _SENTENCE.finditer(line))
+    return [sentence for sentence in sentences if len(sentence) > 1]
+
+
+def _to_hiragana(reading: str) -> str:
+    return "".join(chr(ord(ch) - 0x60) if "ァ" <= ch <= "ヶ" else ch for ch in reading)
+
+
+class _SyntheticBook:
+    """Chapter XHTML generated from example sentences with ruby on some kanji runs."""
+
+    def __init__(self, args: argparse.Namespace, backend: NLPBackend) -> None:
+        self.args = args
+        self.backend = backend
+        self.rng = random.Random(args.seed)
+        self.sentences = _example_sentences()
+        self.readings: dict[str, str | None] = {}
+        self.chars = 0
+
+    def _reading(self, run: str) -> str | None:
+        if run not in self.readings:
+            reading = _to_hiragana(self.backend.to_reading_text(run))
+            self.readings[run] = reading if reading != run and is_kana_string(reading) else None
+        return self.readings[run]
+
+    def _paragraph(self) -> str:
+        pieces: list[str] = []
+        length = 0
+        while length < self.args.paragraph_chars:
+            sentence = self.rng.choice(self.sentences)
+            pieces.append(sentence)
+            length += len(sentence)
+        text = "".join(pieces)
+        self.chars += len(text)
+        out: list[str] = []
+        cursor = 0
+        for match in _KANJI_RUN.finditer(text):
+            if self.rng.random() >= self.args.ruby_density:
+                continue
+            reading = self._reading(match.group(0))
+            if reading is None:
+                continue
+            out.append(html.escape(text[cursor : match.start()]))
+            out.append(f"<ruby>{match.group(0)}<rt>{reading}</rt></ruby>")
+            cursor = match.end()
+        out.append(html.escape(text[cursor:]))
+        return "<p>" + "".join(out) + "</p>"
+
+    def _chapter(self, number: int) -> str:
+        body = [f'<h2 id="c{number}">第{number}章</h2>']
+        body.extend(self._paragraph() for _ in range(self.args.paragraphs))
+        return "\n".join(body)
+
+    def write(self, path: Path) -> Path:
+        nav = self.args.nav
+        per_file = _CHAPTERS_PER_SHARED_FILE if nav == "shared" else 1
+        files: list[tuple[str, list[int]]] = []
+        for first in range(1, self.args.chapters + 1, per_file):
+            numbers = list(range(first, min(first + per_file, self.args.chapters + 1)))
+            files.append((f"text{len(files) + 1:04d}.xhtml", numbers))
+        manifest = [
+            f'<item id="t{index}" href="{name}" media-type="application/xhtml+xml"/>'
+            for index, (name, _) in enumerate(files)
+        ]
+        spine = [f'<itemref idref="t{index}"/>' for index in range(len(files))]
+        targets = [(f"{name}#c{number}", f"第{number}章") for name, numbers in files for number in numbers]
+        members: dict[str, str] = {}
+        spine_attrs = ""
+        if nav in ("nav", "shared"):
+            manifest.append('<item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>')
+            links = "\n".join(f'<li><a href="{href}">{title}</a></li>' for href, title in targets)
+            members["OEBPS/nav.xhtml"] = (
+                '<?xml version="1.0" encoding="utf-8"?>\n'
+                '<html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops">\n'
+                f'<head><title>目次</title></head><body><nav epub:type="toc"><ol>\n{links}\n</ol></nav></body></html>\n'
+            )
+        elif nav == "ncx":
+            manifest.append('<item id="ncx" href="toc.ncx" media-type="application/x-dtbncx+xml"/>')
+            spine_attrs = ' toc="ncx"'
+            points = "\n".join(
+                f'<navPoint id="p{order}" playOrder="{order + 1}"><navLabel><text>{title}</text></navLabel>'
+                f'<content src="{href}"/></navPoint>'
+                for order, (href, title) in enumerate(targets)
+            )
+            members["OEBPS/toc.ncx"] = (
+                '<?xml version="1.0" encoding="UTF-8"?>\n'
+                '<ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1">\n'
+                f"<navMap>\n{points}\n</navMap></ncx>\n"
+            )
+        for name, numbers in files:
+            chapters = "\n".join(self._chapter(number) for number in numbers)
+            members[f"OEBPS/{name}"] = (
+                '<?xml version="1.0" encoding="utf-8"?>\n'
+                '<html xmlns="http://www.w3.org/1999/xhtml" xml:lang="ja">\n'
+                f"<head><title>{name}</title></head><body>\n{chapters}\n</body></html>\n"
+            )
+        members["OEBPS/content.opf"] = (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<package version="3.0" unique-identifier="BookId" xmlns="http://www.idpf.org/2007/opf">\n'
+            '<metadata xmlns:dc="http://purl.org/dc/elements/1.1/">'
+            "<dc:title>合成書籍</dc:title><dc:creator>nk bench</dc:creator></metadata>\n"
+            f"<manifest>\n{chr(10).join(manifest)}\n</manifest>\n"
+            f"<spine{spine_attrs}>\n{chr(10).join(spine)}\n</spine>\n</package>\n"
+        )
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("mimetype", "application/epub+zip", compress_type=zipfile.ZIP_STORED)
+            zf.writestr("META-INF/container.xml", _CONTAINER_XML)
+            for member, content in members.items():
+                zf.writestr(member, content)
+        return path
+
+
+def _peak_rss_mb(who: int) -> float | None:
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - Windows
+        return None
+    peak = resource.getrusage(who).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS.
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _convert_once(epub_path: str, jobs: int, parser: str, cache_dir: str) -> dict[str, object]:
+    """Convert one book in this (fresh) process and report where the time went."""
+    import resource
+
+    os.environ["NK_CACHE_DIR"] = cache_dir
+    marks: dict[str, float] = {}
+    chapter_started: dict[int, float] = {}
+    finalize_seconds = 0.0
+    pipeline_seconds: dict[str, float] = {}
+
+    def _progress(event: dict[str, object]) -> None:
+        nonlocal finalize_seconds
+        now = time.perf_counter()
+        for stage, seconds in event_stage_seconds(event).items():
+            pipeline_seconds[stage] = pipeline_seconds.get(stage, 0.0) + seconds
+        kind = event.get("event")
+        if kind == "chapter_prepare":
+            marks.setdefault("prepared", now)
+        elif kind == "chapter_start":
+            chapter_started[int(event["index"])] = now
+        elif kind == "chapter_done":
+            finalize_seconds += now - chapter_started.pop(int(event["index"]), now)
+
+    started = time.perf_counter()
+    backend = NLPBackend()
+    ready = time.perf_counter()
+    with iter_epub_chapters(epub_path, backend, _progress, parser=parser, jobs=jobs) as stream:
+        mapped = time.perf_counter()
+        chapters = list(stream)
+    finished = time.perf_counter()
+    prepared = marks.get("prepared", finished)
+    return {
+        "wall_s": round(finished - started, 4),
+        "peak_rss_mb": _peak_rss_mb(resource.RUSAGE_SELF),
+        "worker_peak_rss_mb": _peak_rss_mb(resource.RUSAGE_CHILDREN) if jobs > 1 else None,
+        "chapters": len(chapters),
+        "token_cache": backend.token_cache_stats(),
+        "stages": {
+            "setup_s": round(ready - started, 4),
+            "mapping_s": round(mapped - ready, 4),
+            "extract_s": round(prepared - mapped, 4),
+            "finalize_s": round(finalize_seconds, 4),
+            **{
+                f"{stage}_s": round(seconds, 4)
+                for stage, seconds in pipeline_seconds.items()
+                if stage != "mapping"
+            },
+        },
+    }
+
+
+def _convert_in_fresh_process(epub_path: Path, args: argparse.Namespace, cache_dir: str) -> dict[str, object]:
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        return pool.submit(_convert_once, str(epub_path), args.jobs, args.parser, cache_dir).result()
+
+
+def _median(runs: list[dict[str, object]]) -> dict[str, object]:
+    def _mid(values: list[object]) -> float | None:
+        numbers = [value for value in values if isinstance(value, (int, float))]
+        return round(statistics.median(numbers), 4) if numbers else None
+
+    summary: dict[str, object] = {
+        key: _mid([run[key] for run in runs]) for key in ("wall_s", "peak_rss_mb", "worker_peak_rss_mb")
+    }
+    stages = runs[0]["stages"]
+    assert isinstance(stages, dict)
+    summary["stages"] = {stage: _mid([run["stages"].get(stage) for run in runs]) for stage in stages}
+    return summary
+
+
+def _bench_book(epub_path: Path, args: argparse.Namespace, scratch: Path) -> dict[str, object]:
+    warm_dir = tempfile.mkdtemp(prefix="cache-", dir=scratch)
+    if args.cache == "warm":
+        _convert_in_fresh_process(epub_path, args, warm_dir)
+    runs = []
+    for _ in range(args.repeat):
+        cache_dir = warm_dir if args.cache == "warm" else tempfile.mkdtemp(prefix="cache-", dir=scratch)
+        runs.append(_convert_in_fresh_process(epub_path, args, cache_dir))
+    return {
+        "epub_bytes": epub_path.stat().st_size,
+        "chapters": runs[0]["chapters"],
+        "median": _median(runs),
+        "runs": runs,
+    }
+
+
+def _compare(report: dict[str, object], baseline_path: Path) -> dict[str, object]:
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    ratios: dict[str, object] = {}
+    for name, book in report["books"].items():
+        before = baseline.get("books", {}).get(name)
+        if not before:
+            continue
+        now, then = book["median"], before["median"]
+        ratios[name] = {
+            key: round(now[key] / then[key], 3) if now.get(key) and then.get(key) else None
+            for key in ("wall_s", "peak_rss_mb")
+        }
+        ratios[name]["stages"] = {
+            stage: round(value / then["stages"][stage], 3) if value and then["stages"].get(stage) else None
+            for stage, value in now["stages"].items()
+        }
+        if book.get("config") != before.get("config"):
+            ratios[name]["config_differs"] = True
+    return {"path": str(baseline_path), "ratio": ratios}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--chapters", type=int, default=20, help="Chapters in the synthetic book.")
+    parser.add_argument("--paragraphs", type=int, default=30, help="Paragraphs per synthetic chapter.")
+    parser.add_argument("--paragraph-chars", type=int, default=200, help="Approximate characters per paragraph.")
+    parser.add_argument("--ruby-density", type=float, default=0.3, help="Share of kanji runs glossed with ruby (0-1).")
+    parser.add_argument("--nav", choices=_NAV_LAYOUTS, default="nav", help="Table of contents layout.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic text.")
+    parser.add_argument(
+        "--books",
+        choices=("all", "synthetic", "example"),
+        default="all",
+        help="Which books to convert.",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timed conversions per book.")
+    parser.add_argument("--jobs", type=int, default=1, help="Passed to iter_epub_chapters.")
+    parser.add_argument("--parser", default="fast", help="HTML parser passed to iter_epub_chapters.")
+    parser.add_argument("--cache", choices=("warm", "cold"), default="warm", help="NK_CACHE_DIR state per run.")
+    parser.add_argument("--output", type=Path, help="Also write the JSON report here.")
+    parser.add_argument("--baseline", type=Path, help="Earlier report to compute median ratios against.")
+    args = parser.parse_args()
+
+    report: dict[str, object] = {
+        "nk_version": _nk_version(),
+        "python": sys.version.split()[0],
+        "repeat": args.repeat,
+        "jobs": args.jobs,
+        "parser": args.parser,
+        "cache": args.cache,
+        "books": {},
+    }
+    with tempfile.TemporaryDirectory(prefix="nk-bench-") as scratch_name:
+        scratch = Path(scratch_name)
+        books: dict[str, object] = {}
+        if args.books in ("all", "synthetic"):
+            book = _SyntheticBook(args, NLPBackend())
+            epub_path = book.write(scratch / "synthetic.epub")
+            config = {
+                key: getattr(args, key)
+                for key in ("chapters", "paragraphs", "paragraph_chars", "ruby_density", "nav", "seed")
+            }
+            books["synthetic"] = {"config": config, "chars": book.chars, **_bench_book(epub_path, args, scratch)}
+        if args.books in ("all", "example"):
+            books["example"] = _bench_book(_EXAMPLE_EPUB, args, scratch)
+        report["books"] = books
+    if args.baseline:
+        report["baseline"] = _compare(report, args.baseline)
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n", encoding="utf-8")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
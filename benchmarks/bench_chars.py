@@ -0,0 +1,146 @@
+"""
+Compare nk.chars against the per-character ord() loops it replaced.
+
+Every function runs over the example book's chapter texts split into
+short pieces, which is how the pipeline calls them (token surfaces, ruby
+readings, single characters). The reference implementations are copies
+of the removed helpers, kept here only for the comparison.
+
+    python benchmarks/bench_chars.py --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import time
+import unicodedata
+from pathlib import Path
+from typing import Callable
+
+from nk.chars import (
+    contains_cjk,
+    hiragana_to_katakana,
+    is_cjk_char,
+    is_kana_string,
+    normalize_katakana,
+)
+
+_EXAMPLE_DIR = Path(__file__).resolve().parents[1] / "example" / "[夏目漱石] 夢十夜"
+_PIECE = re.compile(r"[^\s、。「」]+")
+
+
+def _reference_is_cjk_char(ch: str) -> bool:
+    if not ch:
+        return False
+    code = ord(ch)
+    return (
+        0x4E00 <= code <= 0x9FFF
+        or 0x3400 <= code <= 0x4DBF
+        or 0x20000 <= code <= 0x2A6DF
+        or 0x2A700 <= code <= 0x2B73F
+        or 0x2B740 <= code <= 0x2B81F
+        or 0x2B820 <= code <= 0x2CEAF
+        or 0x2CEB0 <= code <= 0x2EBEF
+        or 0x30000 <= code <= 0x3134F
+        or 0xF900 <= code <= 0xFAFF
+        or 0x2F800 <= code <= 0x2FA1F
+        or ch in "々〆ヵヶ"
+    )
+
+
+def _reference_contains_cjk(text: str) -> bool:
+    return any(_reference_is_cjk_char(ch) for ch in text)
+
+
+def _reference_hiragana_to_katakana(text: str) -> str:
+    result = []
+    for ch in text:
+        code = ord(ch)
+        if 0x3041 <= code <= 0x3096:
+            result.append(chr(code + 0x60))
+        elif ch == "ゝ":
+            result.append("ヽ")
+        elif ch == "ゞ":
+            result.append("ヾ")
+        elif ch == "ゟ":
+            result.append("ヿ")
+        else:
+            result.append(ch)
+    return "".join(result)
+
+
+def _reference_normalize_katakana(text: str) -> str:
+    text = unicodedata.normalize("NFKC", text)
+    text = text.replace("ヂ", "ジ").replace("ヅ", "ズ")
+    text = text.replace("ヮ", "ワ").replace("ヵ", "カ").replace("ヶ", "ケ")
+    text = text.replace("ゕ", "カ").replace("ゖ", "ケ")
+    return text
+
+
+def _reference_is_kana_string(text: str) -> bool:
+    for ch in text:
+        if ch.isspace():
+            continue
+        code = ord(ch)
+        if 0x3041 <= code <= 0x309F or 0x30A1 <= code <= 0x30FF or ch == "・":
+            continue
+        return False
+    return True
+
+
+def _time(func: Callable[[str], object], inputs: list[str], repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for value in inputs:
+            func(value)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=10, help="Passes over the example text per function.")
+    args = parser.parse_args()
+
+    original = "\n".join(
+        path.read_text(encoding="utf-8") for path in sorted(_EXAMPLE_DIR.glob("*.original.txt"))
+    )
+    transformed = "\n".join(
+        path.read_text(encoding="utf-8")
+        for path in sorted(_EXAMPLE_DIR.glob("*.txt"))
+        if not path.name.endswith(".original.txt")
+    )
+    surfaces = _PIECE.findall(original)
+    readings = _PIECE.findall(transformed)
+    characters = list(original)
+
+    cases = [
+        ("is_cjk_char", _reference_is_cjk_char, is_cjk_char, characters),
+        ("contains_cjk", _reference_contains_cjk, contains_cjk, surfaces),
+        ("hiragana_to_katakana", _reference_hiragana_to_katakana, hiragana_to_katakana, surfaces),
+        ("normalize_katakana", _reference_normalize_katakana, normalize_katakana, readings),
+        ("is_kana_string", _reference_is_kana_string, is_kana_string, readings),
+    ]
+    report: dict[str, object] = {
+        "chars": len(original),
+        "surfaces": len(surfaces),
+        "readings": len(readings),
+        "repeat": args.repeat,
+    }
+    for name, reference, current, inputs in cases:
+        mismatches = sum(1 for value in inputs if reference(value) != current(value))
+        if mismatches:
+            raise SystemExit(f"{name}: {mismatches} results differ from the reference")
+        before = _time(reference, inputs, args.repeat)
+        after = _time(current, inputs, args.repeat)
+        report[name] = {
+            "ord_loop_s": round(before, 4),
+            "table_s": round(after, 4),
+            "speedup": round(before / after, 2) if after else None,
+        }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Time chapter token construction on a synthetically enlarged chapter.
+
+The example book's original chapter texts are repeated until the chapter
+reaches ``--chars`` characters, every kanji run gets a ruby span, and
+``_build_chapter_tokens_from_original`` runs with a stub backend that
+returns one token per character. Skipping MeCab keeps the timing focused
+on the coverage bookkeeping and surface lookups.
+
+    python benchmarks/bench_token_coverage.py --chars 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from nk.core import (
+    _align_tokens_to_original_text,
+    _build_chapter_tokens_from_original,
+    _RubySpan,
+)
+from nk.pitch import PitchToken
+
+_EXAMPLE_DIR = Path(__file__).resolve().parents[1] / "example" / "[夏目漱石] 夢十夜"
+_KANJI_RUN = re.compile(r"[一-鿿々]+")
+
+
+@dataclass
+class _StubToken:
+    surface: str
+    reading: str
+    start: int
+    end: int
+    accent_type: int | None = None
+    accent_connection: str | None = None
+    pos: str | None = None
+
+
+class _StubBackend:
+    def tokenize(self, text: str) -> list[_StubToken]:
+        return [
+            _StubToken(surface=ch, reading="カ", start=idx, end=idx + 1, accent_type=0, pos="名詞")
+            for idx, ch in enumerate(text)
+        ]
+
+    def to_reading_text(self, text: str) -> str:
+        return "カ" * len(text)
+
+
+def _enlarged_chapter(chars: int) -> str:
+    parts = [path.read_text(encoding="utf-8") for path in sorted(_EXAMPLE_DIR.glob("*.original.txt"))]
+    base = "\n\n".join(parts)
+    repeats = max(1, -(-chars // len(base)))
+    return ("\n\n".join([base] * repeats))[:chars]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--chars", type=int, default=100_000, help="Chapter length in characters.")
+    parser.add_argument("--ruby-every", type=int, default=2, help="Gloss every Nth kanji run with ruby.")
+    args = parser.parse_args()
+
+    text = _enlarged_chapter(args.chars)
+    spans = [
+        _RubySpan(start=match.start(), end=match.end(), base=match.group(0), reading="カ" * len(match.group(0)))
+        for idx, match in enumerate(_KANJI_RUN.finditer(text))
+        if idx % args.ruby_every == 0
+    ]
+    backend = _StubBackend()
+
+    started = time.perf_counter()
+    tokens = _build_chapter_tokens_from_original(text, backend, spans, {}, {}, {}, {}, {})
+    build_seconds = time.perf_counter() - started
+
+    pitch_tokens = [
+        PitchToken(surface=token.surface, reading=token.reading or "", accent_type=None, start=0, end=0)
+        for token in tokens
+    ]
+    started = time.perf_counter()
+    _align_tokens_to_original_text(text, pitch_tokens)
+    align_seconds = time.perf_counter() - started
+
+    print(
+        json.dumps(
+            {
+                "chars": len(text),
+                "ruby_spans": len(spans),
+                "tokens": len(tokens),
+                "build_tokens_s": round(build_seconds, 4),
+                "align_surfaces_s": round(align_seconds, 4),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
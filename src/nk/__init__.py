@@ -1,4 +1,4 @@
-from .core import ChapterText, epub_to_chapter_texts
+from .core import ChapterStream, ChapterText, EpubContainer, epub_to_chapter_texts, iter_epub_chapters
 from .tts import (
     FFmpegError,
     TTSTarget,
@@ -12,8 +12,11 @@ from .tts import (
 )
 
 __all__ = [
+    "ChapterStream",
     "ChapterText",
+    "EpubContainer",
     "epub_to_chapter_texts",
+    "iter_epub_chapters",
     "TTSTarget",
     "resolve_text_targets",
     "synthesize_texts_to_mp3",
@@ -3,9 +3,9 @@ from __future__ import annotations
 import hashlib
 import json
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path, PurePosixPath
-from typing import Iterable, Mapping
+from typing import Iterable, Iterator, Mapping
 
 try:
     from PIL import Image
@@ -48,6 +48,8 @@ def is_original_text_file(path: Path) -> bool:
 
 @dataclass
 class ChapterFileRecord:
+    # The chapter's text, original text and tokens live in the written files;
+    # the record keeps only its titles and source so packages stay small.
     chapter: ChapterText
     path: Path
     index: int
@@ -70,6 +72,8 @@ class ChapterMetadata:
     index: int | None
     title: str | None
     original_title: str | None
+    source: str | None = None
+    fingerprint: str | None = None
 
 
 @dataclass
@@ -80,6 +84,7 @@ class LoadedBookMetadata:
     chapters: dict[str, ChapterMetadata]
     tts_defaults: "BookTTSDefaults | None"
     source_epub: str | None = None
+    overrides_sha1: str | None = None
 
 
 @dataclass
@@ -184,7 +189,9 @@ def _chapter_basename(index: int, chapter: ChapterText, used_names: set[str]) ->
 
 
 def _write_chapter_texts(
-    output_dir: Path, chapters: Iterable[ChapterText]
+    output_dir: Path,
+    chapters: Iterable[ChapterText],
+    previous: Mapping[str, ChapterMetadata] | None = None,
 ) -> list[ChapterFileRecord]:
     output_dir.mkdir(parents=True, exist_ok=True)
     used_names: set[str] = set()
@@ -192,6 +199,17 @@ def _write_chapter_texts(
     for index, chapter in enumerate(chapters):
         basename = _chapter_basename(index, chapter, used_names)
         path = output_dir / f"{basename}.txt"
+        summary = replace(chapter, text="", original_text=None, pitch_data=None, tokens=None)
+        previous_entry = previous.get(path.name) if previous else None
+        if (
+            chapter.fingerprint
+            and previous_entry is not None
+            and previous_entry.fingerprint == chapter.fingerprint
+            and path.exists()
+        ):
+            # Carried over unchanged: leave the files (and their MP3) alone.
+            records.append(ChapterFileRecord(chapter=summary, path=path, index=index + 1))
+            continue
         path.write_text(chapter.text, encoding="utf-8")
         original_path = output_dir / f"{basename}.original.txt"
         if chapter.original_text is not None:
@@ -202,7 +220,7 @@ def _write_chapter_texts(
         legacy_partial_path = path.with_name(f"{path.stem}.partial.txt")
         legacy_partial_path.unlink(missing_ok=True)
         _token_metadata_path(legacy_partial_path).unlink(missing_ok=True)
-        records.append(ChapterFileRecord(chapter=chapter, path=path, index=index + 1))
+        records.append(ChapterFileRecord(chapter=summary, path=path, index=index + 1))
     return records
 
 
@@ -526,18 +544,20 @@ def _build_metadata_payload(
     source_epub: Path | None,
     cover_path: Path | None,
     tts_defaults: BookTTSDefaults | None = None,
+    overrides_sha1: str | None = None,
 ) -> dict:
     chapters_payload = []
     for record in records:
-        chapters_payload.append(
-            {
-                "index": record.index,
-                "file": record.path.name,
-                "title": record.chapter.title,
-                "original_title": record.chapter.original_title,
-                "source": record.chapter.source,
-            }
-        )
+        entry: dict[str, object] = {
+            "index": record.index,
+            "file": record.path.name,
+            "title": record.chapter.title,
+            "original_title": record.chapter.original_title,
+            "source": record.chapter.source,
+        }
+        if record.chapter.fingerprint:
+            entry["fingerprint"] = record.chapter.fingerprint
+        chapters_payload.append(entry)
     payload: dict[str, object] = {
         "version": 1,
         "title": book_title,
@@ -549,6 +569,8 @@ def _build_metadata_payload(
         payload["cover"] = cover_path.name
     if source_epub is not None:
         payload["epub"] = source_epub.name
+    if overrides_sha1:
+        payload["overrides_sha1"] = overrides_sha1
     if tts_defaults:
         defaults_payload = tts_defaults.as_payload()
         if defaults_payload:
@@ -558,18 +580,33 @@ def _build_metadata_payload(
 
 def write_book_package(
     output_dir: Path,
-    chapters: list[ChapterText],
+    chapters: Iterable[ChapterText],
     *,
     source_epub: Path | None = None,
     cover_image: CoverImage | None = None,
     ruby_evidence: list[dict[str, object]] | None = None,
     apply_overrides: bool = True,
 ) -> BookPackage:
+    """
+    Write a chapterized book into ``output_dir``.
+
+    ``chapters`` may be any iterable, such as the stream from
+    ``iter_epub_chapters``; each chapter's files are written as it arrives
+    and the book-level metadata once the iterable is exhausted. Chapters
+    whose fingerprint matches the one already recorded for their file are
+    left untouched on disk.
+    """
     previous_metadata = load_book_metadata(output_dir)
-    records = _write_chapter_texts(output_dir, chapters)
-    book_title = _resolve_book_title(chapters, output_dir)
-    book_author = _resolve_book_author(chapters)
+    records = _write_chapter_texts(
+        output_dir,
+        chapters,
+        previous_metadata.chapters if previous_metadata else None,
+    )
+    written = [record.chapter for record in records]
+    book_title = _resolve_book_title(written, output_dir)
+    book_author = _resolve_book_author(written)
     cover_path = _write_cover_image(output_dir, cover_image) if cover_image else None
+    _ensure_custom_token_template(output_dir)
     metadata_payload = _build_metadata_payload(
         book_title,
         book_author,
@@ -577,6 +614,7 @@ def write_book_package(
         source_epub=source_epub,
         cover_path=cover_path,
         tts_defaults=previous_metadata.tts_defaults if previous_metadata else None,
+        overrides_sha1=_overrides_sha1(output_dir),
     )
     metadata_path = output_dir / BOOK_METADATA_FILENAME
     metadata_path.write_text(
@@ -591,7 +629,6 @@ def write_book_package(
         cover_path,
     )
     ruby_evidence_path = _write_ruby_evidence(output_dir, ruby_evidence)
-    _ensure_custom_token_template(output_dir)
     if apply_overrides:
         from .refine import load_override_config, refine_book
 
@@ -739,9 +776,16 @@ def load_book_metadata(book_dir: Path) -> LoadedBookMetadata | None:
                 original_title=entry.get("original_title")
                 if isinstance(entry.get("original_title"), str)
                 else None,
+                source=entry.get("source")
+                if isinstance(entry.get("source"), str)
+                else None,
+                fingerprint=entry.get("fingerprint")
+                if isinstance(entry.get("fingerprint"), str)
+                else None,
             )
 
     tts_defaults = BookTTSDefaults.from_payload(payload.get("tts_defaults"))
+    overrides_sha1 = payload.get("overrides_sha1")
 
     return LoadedBookMetadata(
         title=title if isinstance(title, str) else None,
@@ -750,6 +794,7 @@ def load_book_metadata(book_dir: Path) -> LoadedBookMetadata | None:
         chapters=chapters,
         tts_defaults=tts_defaults,
         source_epub=epub_name,
+        overrides_sha1=overrides_sha1 if isinstance(overrides_sha1, str) else None,
     )
 
 
@@ -773,6 +818,83 @@ def load_token_metadata(chapter_path: Path) -> ChapterTokenMetadata | None:
     return ChapterTokenMetadata(text_sha1=text_sha1, tokens=tokens)
 
 
+def _overrides_sha1(book_dir: Path) -> str | None:
+    for name in (_CUSTOM_TOKEN_FILENAME, _LEGACY_CUSTOM_PITCH_FILENAME):
+        try:
+            return hashlib.sha1((book_dir / name).read_bytes()).hexdigest()
+        except OSError:
+            continue
+    return None
+
+
+class _PreviousChapters(Mapping[str, ChapterText]):
+    """Chapters of an existing package by fingerprint, read from disk on lookup."""
+
+    def __init__(self, book_dir: Path, metadata: LoadedBookMetadata | None) -> None:
+        self._book_dir = book_dir
+        self._metadata = metadata
+        self._files: dict[str, str] = {}
+        if metadata is not None:
+            for file_name, chapter in metadata.chapters.items():
+                if chapter.fingerprint:
+                    self._files.setdefault(chapter.fingerprint, file_name)
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._files)
+
+    def __contains__(self, fingerprint: object) -> bool:
+        return fingerprint in self._files
+
+    def __getitem__(self, fingerprint: str) -> ChapterText:
+        file_name = self._files[fingerprint]
+        assert self._metadata is not None
+        chapter = self._metadata.chapters[file_name]
+        path = self._book_dir / file_name
+        try:
+            text = path.read_text(encoding="utf-8")
+        except OSError:
+            raise KeyError(fingerprint) from None
+        original_path = path.with_name(f"{path.stem}.original.txt")
+        try:
+            original_text: str | None = original_path.read_text(encoding="utf-8")
+        except OSError:
+            original_text = None
+        token_metadata = load_token_metadata(path)
+        tokens = None
+        if token_metadata is not None and token_metadata.text_sha1 == hashlib.sha1(
+            text.encode("utf-8")
+        ).hexdigest():
+            tokens = token_metadata.tokens
+        return ChapterText(
+            source=chapter.source or file_name,
+            title=chapter.title,
+            text=text,
+            original_text=original_text,
+            original_title=chapter.original_title,
+            book_title=self._metadata.title,
+            book_author=self._metadata.author,
+            tokens=tokens,
+            fingerprint=fingerprint,
+        )
+
+
+def load_previous_chapters(book_dir: Path) -> Mapping[str, ChapterText]:
+    """
+    Finished chapters of the package in ``book_dir``, keyed by fingerprint,
+    for ``iter_epub_chapters(previous=...)``.
+
+    Nothing is offered when the book's override config changed since the
+    package was written, because carried text already has overrides applied.
+    """
+    metadata = load_book_metadata(book_dir)
+    if metadata is not None and metadata.overrides_sha1 != _overrides_sha1(book_dir):
+        metadata = None
+    return _PreviousChapters(book_dir, metadata)
+
+
 def update_book_tts_defaults(
     book_dir: Path,
     updates: Mapping[str, float | int | None],
@@ -844,6 +966,7 @@ __all__ = [
     "ensure_cover_is_square",
     "regenerate_m4b_manifest",
     "load_book_metadata",
+    "load_previous_chapters",
     "load_token_metadata",
     "update_book_tts_defaults",
     "write_book_package",
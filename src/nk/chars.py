@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import re
+import unicodedata
+
+__all__ = [
+    "contains_cjk",
+    "contains_hiragana",
+    "contains_ideograph",
+    "hiragana_to_katakana",
+    "is_cjk_char",
+    "is_kana_char",
+    "is_kana_string",
+    "normalize_katakana",
+]
+
+# Han ideograph blocks (unified, extensions A–G, compatibility).
+_IDEOGRAPH_RANGES = (
+    (0x4E00, 0x9FFF),  # CJK Unified Ideographs
+    (0x3400, 0x4DBF),  # Extension A
+    (0x20000, 0x2A6DF),  # Extension B
+    (0x2A700, 0x2B73F),  # Extension C
+    (0x2B740, 0x2B81F),  # Extension D
+    (0x2B820, 0x2CEAF),  # Extension E
+    (0x2CEB0, 0x2EBEF),  # Extension F
+    (0x30000, 0x3134F),  # Extension G
+    (0xF900, 0xFAFF),  # Compatibility Ideographs
+    (0x2F800, 0x2FA1F),  # Compatibility Supplement
+)
+# Marks that stand in for kanji inside a word (々, 〆, small ヵ/ヶ counters).
+_KANJI_MARKS = "々〆ヵヶ"
+
+_IDEOGRAPH_CLASS = "".join(f"{chr(lo)}-{chr(hi)}" for lo, hi in _IDEOGRAPH_RANGES)
+_CJK_CHAR_RE = re.compile(f"[{_IDEOGRAPH_CLASS}{_KANJI_MARKS}]")
+_IDEOGRAPH_RE = re.compile(f"[{_IDEOGRAPH_CLASS}]")
+
+
+def _bmp_table() -> bytes:
+    table = bytearray(0x10000)
+    for lo, hi in _IDEOGRAPH_RANGES:
+        if hi < 0x10000:
+            table[lo : hi + 1] = b"\x01" * (hi - lo + 1)
+    for ch in _KANJI_MARKS:
+        table[ord(ch)] = 1
+    return bytes(table)
+
+
+# One byte per BMP code point; astral ideographs fall back to the regex.
+_CJK_BMP_TABLE = _bmp_table()
+
+_HIRAGANA_RE = re.compile("[\u3040-\u309f]")
+_KANA_CHAR_RE = re.compile("[\u3041-\u309f\u30a1-\u30ff]")
+# Kana readings may carry spaces and the middle dot between words.
+_KANA_STRING_RE = re.compile("[\u3041-\u309f\u30a1-\u30ff・\\s]*")
+
+_HIRAGANA_TO_KATAKANA = {code: code + 0x60 for code in range(0x3041, 0x3097)}
+_HIRAGANA_TO_KATAKANA.update(str.maketrans("ゝゞゟ", "ヽヾヿ"))
+# Spellings that read the same once voiced/small kana are folded.
+_KATAKANA_FOLD = str.maketrans("ヂヅヮヵヶゕゖ", "ジズワカケカケ")
+_KATAKANA_FOLD_RE = re.compile("[ヂヅヮヵヶゕゖ]")
+
+
+def is_cjk_char(ch: str) -> bool:
+    """Return True when ``ch`` is a Han ideograph or a kanji stand-in mark."""
+    if not ch:
+        return False
+    code = ord(ch)
+    if code < 0x10000:
+        return _CJK_BMP_TABLE[code] == 1
+    return _CJK_CHAR_RE.match(ch) is not None
+
+
+def contains_cjk(text: str) -> bool:
+    """Return True when any character of ``text`` satisfies :func:`is_cjk_char`."""
+    return _CJK_CHAR_RE.search(text) is not None
+
+
+def contains_ideograph(text: str | None) -> bool:
+    """Return True when ``text`` contains a Han ideograph (marks excluded)."""
+    return bool(text) and _IDEOGRAPH_RE.search(text) is not None
+
+
+def contains_hiragana(text: str) -> bool:
+    return _HIRAGANA_RE.search(text) is not None
+
+
+def is_kana_char(ch: str) -> bool:
+    """Return True for hiragana (ぁ–ゟ) and katakana (ァ–ヿ, including ー)."""
+    return bool(ch) and _KANA_CHAR_RE.match(ch) is not None
+
+
+def is_kana_string(text: str) -> bool:
+    """Return True when ``text`` holds only kana, ``・`` and whitespace."""
+    return _KANA_STRING_RE.fullmatch(text) is not None
+
+
+def hiragana_to_katakana(text: str) -> str:
+    return text.translate(_HIRAGANA_TO_KATAKANA)
+
+
+def normalize_katakana(text: str) -> str:
+    """NFKC-normalize ``text`` and fold ヂ/ヅ/ヮ and small ヵ/ヶ to their plain forms."""
+    text = unicodedata.normalize("NFKC", text)
+    if _KATAKANA_FOLD_RE.search(text) is None:
+        return text
+    return text.translate(_KATAKANA_FOLD)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
+import io
 import json
+import multiprocessing
 import os
 import shutil
 import socket
@@ -11,6 +14,7 @@ import threading
 import time
 import tomllib
 import webbrowser
+from concurrent.futures import as_completed
 from importlib import metadata
 from multiprocessing import Process
 from pathlib import Path
@@ -34,17 +38,22 @@ from .book_io import (
     BOOK_METADATA_FILENAME,
     M4B_MANIFEST_FILENAME,
     load_book_metadata,
+    load_previous_chapters,
     regenerate_m4b_manifest,
     update_book_tts_defaults,
     write_book_package,
 )
 from .core import (
-    _apply_mapping_with_pattern,
-    _build_mapping_pattern,
-    _load_corpus_reading_accumulators,
-    _select_reading_mapping,
-    epub_to_chapter_texts,
-    get_epub_cover,
+    DEFAULT_HTML_PARSER,
+    HTML_PARSERS,
+    _apply_mapping_with_matcher,
+    _build_mapping_matcher,
+    _corpus_reading_mapping,
+    _process_pool,
+    _resolve_jobs,
+    EpubContainer,
+    event_stage_seconds,
+    iter_epub_chapters,
 )
 from .deps import (
     DependencyInstallError,
@@ -54,7 +63,7 @@ from .deps import (
     uninstall_dependencies,
 )
 from .logging_utils import build_uvicorn_log_config
-from .nlp import NLPBackend, NLPBackendUnavailableError
+from .nlp import NLPBackend, NLPBackendUnavailableError, load_backend, shared_backend_pool
 from .player import PlayerConfig, create_app
 from .reader import create_reader_app
 from .refine import OverrideRule, load_override_config, load_refine_config, refine_book, refine_chapter
@@ -94,6 +103,7 @@ _SUBCOMMAND_HELP = """Subcommands:
   nk play ...     Launch the audio player
   nk dav ...      Serve a WebDAV endpoint for books
   nk convert ...  Convert arbitrary text to kana
+  nk nlpd ...     Share one warm tokenizer between nk processes
   nk deps ...     Check or install runtime dependencies
   nk samples ...  Generate VoiceVox voice samples
   nk refine ...   Apply pitch overrides to chapterized text
@@ -116,6 +126,13 @@ def _set_reader_reload_config(root: Path) -> None:
     os.environ[_READER_RELOAD_ENV] = json.dumps(payload)
 
 
+def _prewarm_backend_pool() -> None:
+    # Uploads, /api/epubs/chapterize and /reprocess borrow backends from the
+    # shared pool. Loading one tagger now spares the first job the wait;
+    # further ones are built when concurrent jobs need them.
+    shared_backend_pool().warm_in_background(1)
+
+
 def _reader_reload_app():
     raw_value = os.environ.get(_READER_RELOAD_ENV)
     if not raw_value:
@@ -129,6 +146,7 @@ def _reader_reload_app():
         payload = None
     if isinstance(payload, dict) and payload.get("root"):
         root_value = payload["root"]
+    _prewarm_backend_pool()
     return create_reader_app(Path(root_value))
 
 
@@ -203,6 +221,7 @@ def _player_reload_app():
         keep_cache=bool(data.get("keep_cache", True)),
     )
     reader_url = data.get("reader_url")
+    _prewarm_backend_pool()
     return create_app(config, reader_url=reader_url)
 
 
@@ -295,6 +314,25 @@ def build_parser() -> argparse.ArgumentParser:
             "'full' converts everything to kana."
         ),
     )
+    ap.add_argument(
+        "--parser",
+        choices=HTML_PARSERS,
+        default=DEFAULT_HTML_PARSER,
+        help=(
+            "HTML extraction engine: 'fast' reads lxml trees directly (default), "
+            "'bs4' uses BeautifulSoup. Both produce the same text."
+        ),
+    )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Parallel worker processes (default: 1; use 0 for auto). A directory input "
+            "chapterizes that many books at once; a single book uses them for ruby "
+            "evidence and chapters."
+        ),
+    )
     return ap
 
 
@@ -311,20 +349,39 @@ def build_convert_parser() -> argparse.ArgumentParser:
     return ap
 
 
+def build_nlpd_parser() -> argparse.ArgumentParser:
+    ap = argparse.ArgumentParser(
+        description=(
+            "Run a local tokenization service that other nk processes use "
+            "instead of loading their own UniDic tagger."
+        ),
+    )
+    _add_version_flag(ap)
+    ap.add_argument(
+        "--socket",
+        help="Unix socket path (default: $NK_NLPD_SOCKET or nlpd.sock in the nk cache dir).",
+    )
+    ap.add_argument(
+        "--pool-size",
+        type=int,
+        default=None,
+        help="Number of warm taggers serving requests (default: $NK_NLP_POOL_SIZE or 2).",
+    )
+    return ap
+
+
 def _apply_dictionary_mapping(
     text: str,
     mapping: dict[str, str],
     context_rules: dict[str, object],
 ) -> str:
-    if not mapping:
-        return text
-    pattern = _build_mapping_pattern(mapping)
-    if pattern is None:
+    matcher = _build_mapping_matcher(mapping)
+    if matcher is None:
         return text
-    return _apply_mapping_with_pattern(
+    return _apply_mapping_with_matcher(
         text,
         mapping,
-        pattern,
+        matcher,
         source_labels=None,
         context_rules=context_rules,
     )
@@ -768,6 +825,25 @@ def _engine_thread_overrides(
     return env, clamped
 
 
+def _run_nlpd(args: argparse.Namespace) -> int:
+    from .nlpd import start_service
+
+    path = Path(args.socket).expanduser() if args.socket else None
+    try:
+        service = start_service(path, pool_size=args.pool_size)
+    except (NLPBackendUnavailableError, RuntimeError) as exc:
+        raise SystemExit(str(exc)) from exc
+    print(f"Serving nk nlpd on {service.path} ({service.pool.size} tagger(s))", flush=True)
+    print("Press Ctrl+C to stop.\n", flush=True)
+    try:
+        service.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+    return 0
+
+
 def _run_convert(args: argparse.Namespace) -> int:
     try:
         backend = NLPBackend()
@@ -776,10 +852,8 @@ def _run_convert(args: argparse.Namespace) -> int:
     text = " ".join(args.text).strip()
     if not text:
         raise SystemExit("No text provided for conversion.")
-    accumulators = _load_corpus_reading_accumulators()
-    tier3, tier2, context_rules = _select_reading_mapping(accumulators, backend)
-    processed = _apply_dictionary_mapping(text, tier3, context_rules)
-    processed = _apply_dictionary_mapping(processed, tier2, context_rules)
+    corpus = _corpus_reading_mapping(backend)
+    processed = _apply_dictionary_mapping(text, corpus.tier3, corpus.context_rules)
     converted = backend.to_reading_text(processed)
     print(converted)
     return 0
@@ -899,22 +973,22 @@ def _ensure_tts_source_ready(
             backend = nlp
             if backend is None:
                 try:
-                    backend = NLPBackend()
+                    backend = load_backend()
                 except NLPBackendUnavailableError as exc:
                     raise SystemExit(str(exc)) from exc
-            chapters, ruby_evidence = epub_to_chapter_texts(
-                str(input_path),
+            with EpubContainer(input_path) as epub, iter_epub_chapters(
+                epub,
                 nlp=backend,
                 transform="partial",
-            )
-            cover = get_epub_cover(str(input_path))
-            write_book_package(
-                target_dir,
-                chapters,
-                source_epub=input_path,
-                cover_image=cover,
-                ruby_evidence=ruby_evidence,
-            )
+                previous=load_previous_chapters(target_dir),
+            ) as chapters:
+                write_book_package(
+                    target_dir,
+                    chapters,
+                    source_epub=input_path,
+                    cover_image=epub.cover,
+                    ruby_evidence=chapters.ruby_evidence,
+                )
         else:
             regenerate_m4b_manifest(target_dir)
         return target_dir
@@ -940,6 +1014,15 @@ def _format_chapter_progress_label(
     return " · ".join(parts)
 
 
+_STAGE_ORDER = ("mapping", "parse", "tokenize", "tokens", "pitch", "render")
+
+
+def _format_stage_timings(totals: Mapping[str, float]) -> str:
+    stages = [stage for stage in _STAGE_ORDER if stage in totals]
+    stages.extend(sorted(stage for stage in totals if stage not in _STAGE_ORDER))
+    return " · ".join(f"{stage} {totals[stage]:.2f}s" for stage in stages)
+
+
 def _chapterize_epub(
     epub_path: Path,
     backend: NLPBackend,
@@ -947,11 +1030,16 @@ def _chapterize_epub(
     progress_display: Progress | None,
     console: Console,
     transform: str,
+    parser: str = DEFAULT_HTML_PARSER,
+    jobs: int = 1,
 ) -> None:
     book_label = epub_path.name
     output_dir = epub_path.with_suffix("")
     task_id: int | None = None
     override_progress_step = 1.0
+    stage_totals: dict[str, float] = {}
+    cache_stats = getattr(backend, "token_cache_stats", None)
+    cache_before = cache_stats() if cache_stats else None
 
     def _format_override_label(
         path_value: object, index_value: object, total_value: object
@@ -977,6 +1065,10 @@ def _chapterize_epub(
 
     def _progress_callback(event: dict[str, object]) -> None:
         event_type = event.get("event")
+        for stage, seconds in event_stage_seconds(event).items():
+            stage_totals[stage] = stage_totals.get(stage, 0.0) + seconds
+        if event_type == "stage_timing":
+            return
         total = event.get("total")
         if isinstance(total, int) and total <= 0:
             total = None
@@ -1018,13 +1110,28 @@ def _chapterize_epub(
             if event_type == "chapter_done":
                 console.print(f"  {description}")
 
-    chapters, ruby_evidence = epub_to_chapter_texts(
-        str(epub_path),
+    # Chapters are written as they finish; only the book metadata is left
+    # for the final "writing" step.
+    # The package is parsed once; the cover and the chapters share it.
+    with EpubContainer(epub_path) as epub, iter_epub_chapters(
+        epub,
         nlp=backend,
         progress=_progress_callback,
         transform=transform,
-    )
-    base_total = len(chapters) or 1
+        parser=parser,
+        jobs=jobs,
+        previous=load_previous_chapters(output_dir),
+    ) as chapters:
+        package = write_book_package(
+            output_dir,
+            chapters,
+            source_epub=epub_path,
+            cover_image=epub.cover,
+            ruby_evidence=chapters.ruby_evidence,
+            apply_overrides=False,
+        )
+    chapter_count = len(package.chapter_records)
+    base_total = chapter_count or 1
     if progress_display and task_id is not None:
         task = progress_display.tasks[task_id]
         base_total = task.total or base_total
@@ -1035,21 +1142,12 @@ def _chapterize_epub(
             description=f"{book_label} · writing…",
         )
     else:
-        console.print(f"[nk] Writing {book_label}…", style="dim")
+        console.print(f"[nk] Wrote {book_label}", style="dim")
     if progress_display and task_id is not None:
         task = progress_display.tasks[task_id]
         base_completed = min(task.completed, base_total)
     else:
         base_completed = base_total
-    cover = get_epub_cover(str(epub_path))
-    write_book_package(
-        output_dir,
-        chapters,
-        source_epub=epub_path,
-        cover_image=cover,
-        ruby_evidence=ruby_evidence,
-        apply_overrides=False,
-    )
     overrides: list[OverrideRule] = []
     removals = []
     try:
@@ -1070,7 +1168,7 @@ def _chapterize_epub(
             description=f"{book_label} · writing…",
         )
         if has_refinements:
-            override_total = len(chapters)
+            override_total = chapter_count
             if override_total > 0:
                 override_progress_step = 1.0 / override_total
             progress_display.update(
@@ -1149,6 +1247,165 @@ def _chapterize_epub(
                 style="dim",
             )
         console.print(f"  → {output_dir}", style="dim")
+    if stage_totals:
+        summary = _format_stage_timings(stage_totals)
+        if cache_stats and cache_before is not None:
+            cache_after = cache_stats()
+            hits = cache_after["hits"] - cache_before["hits"]
+            lookups = hits + cache_after["misses"] - cache_before["misses"]
+            if lookups:
+                summary += f" · tokenize cache {hits / lookups:.0%} of {lookups}"
+        console.print(f"[nk] {book_label} stages: {summary}", style="dim")
+
+
+class _RelayProgress(Progress):
+    """
+    Worker-side Progress that renders nothing and forwards each task's
+    description/total/completed to the parent's display.
+    """
+
+    def __init__(self, queue: "multiprocessing.Queue", book_index: int) -> None:
+        super().__init__(console=Console(file=io.StringIO()), auto_refresh=False)
+        self._queue = queue
+        self._book_index = book_index
+
+    def _relay(self, task_id: int) -> None:
+        task = next(task for task in self.tasks if task.id == task_id)
+        self._queue.put((self._book_index, task.description, task.total, task.completed, False))
+
+    def add_task(self, *args, **kwargs) -> int:  # type: ignore[override]
+        task_id = super().add_task(*args, **kwargs)
+        self._relay(task_id)
+        return task_id
+
+    def update(self, task_id: int, **kwargs) -> None:  # type: ignore[override]
+        super().update(task_id, **kwargs)
+        self._relay(task_id)
+
+    def advance(self, task_id: int, advance: float = 1) -> None:
+        super().advance(task_id, advance)
+        self._relay(task_id)
+
+
+_BOOK_WORKER_BACKEND: NLPBackend | None = None
+_BOOK_WORKER_QUEUE: "multiprocessing.Queue | None" = None
+
+
+def _init_book_worker(queue: "multiprocessing.Queue | None") -> None:
+    global _BOOK_WORKER_BACKEND, _BOOK_WORKER_QUEUE
+    # Book workers keep their own tagger, like chapter workers.
+    _BOOK_WORKER_BACKEND = NLPBackend()
+    _BOOK_WORKER_QUEUE = queue
+
+
+def _chapterize_epub_in_worker(
+    book_index: int,
+    epub_path: Path,
+    transform: str,
+    parser: str,
+    jobs: int,
+) -> tuple[str, str | None]:
+    """Chapterize one book; return its console output and any error message."""
+    assert _BOOK_WORKER_BACKEND is not None
+    output = io.StringIO()
+    console = Console(file=output, width=120)
+    relay = (
+        _RelayProgress(_BOOK_WORKER_QUEUE, book_index)
+        if _BOOK_WORKER_QUEUE is not None
+        else None
+    )
+    try:
+        _chapterize_epub(
+            epub_path,
+            _BOOK_WORKER_BACKEND,
+            progress_display=relay,
+            console=console,
+            transform=transform,
+            parser=parser,
+            jobs=jobs,
+        )
+    except Exception as exc:
+        return output.getvalue(), f"{exc.__class__.__name__}: {exc}"
+    return output.getvalue(), None
+
+
+def _chapterize_books_in_parallel(
+    epubs: list[Path],
+    *,
+    workers: int,
+    progress_display: Progress | None,
+    console: Console,
+    transform: str,
+    parser: str,
+    chapter_jobs: int,
+) -> list[tuple[Path, str]]:
+    """
+    Chapterize ``epubs`` in ``workers`` processes, one book per task.
+
+    Each book gets its own row in ``progress_display``; a book that fails is
+    reported and the rest carry on. Returns the failed books with errors.
+    """
+    queue = multiprocessing.get_context("spawn").Queue() if progress_display else None
+    rows: dict[int, int] = {}
+
+    def _drain_progress() -> None:
+        assert queue is not None and progress_display is not None
+        while True:
+            message = queue.get()
+            if message is None:
+                return
+            book_index, description, total, completed, failed = message
+            task_id = rows.get(book_index)
+            if task_id is None:
+                task_id = rows[book_index] = progress_display.add_task(
+                    description, total=total, completed=completed or 0
+                )
+            elif failed:
+                progress_display.update(task_id, description=description)
+            else:
+                progress_display.update(
+                    task_id, description=description, total=total, completed=completed
+                )
+            if failed:
+                progress_display.stop_task(task_id)
+
+    drainer: threading.Thread | None = None
+    if queue is not None:
+        drainer = threading.Thread(target=_drain_progress, name="nk-book-progress", daemon=True)
+        drainer.start()
+    failures: list[tuple[Path, str]] = []
+    try:
+        with _process_pool(workers, _init_book_worker, queue) as executor:
+            futures = {
+                executor.submit(
+                    _chapterize_epub_in_worker,
+                    index,
+                    epub_path,
+                    transform,
+                    parser,
+                    chapter_jobs,
+                ): (index, epub_path)
+                for index, epub_path in enumerate(epubs)
+            }
+            for future in as_completed(futures):
+                index, epub_path = futures[future]
+                try:
+                    output, error = future.result()
+                except Exception as exc:  # worker crashed or could not start
+                    output, error = "", f"{exc.__class__.__name__}: {exc}"
+                if output:
+                    console.print(output, end="", markup=False, highlight=False)
+                if error is not None:
+                    failures.append((epub_path, error))
+                    console.print(f"[nk] Failed {epub_path.name}: {error}", style="red")
+                    if queue is not None:
+                        # Through the queue so it lands after the book's own updates.
+                        queue.put((index, f"{epub_path.name} · failed", None, None, True))
+    finally:
+        if queue is not None and drainer is not None:
+            queue.put(None)
+            drainer.join()
+    return failures
 
 
 def _run_tts(args: argparse.Namespace) -> int:
@@ -2084,6 +2341,7 @@ def _run_play(args: argparse.Namespace) -> None:
                 factory=True,
             )
         else:
+            _prewarm_backend_pool()
             app = create_app(config, reader_url=reader_url)
             uvicorn.run(
                 app,
@@ -2130,6 +2388,7 @@ def _run_read(args: argparse.Namespace) -> int:
             factory=True,
         )
     else:
+        _prewarm_backend_pool()
         app = create_reader_app(root)
         uvicorn.run(
             app,
@@ -2166,6 +2425,10 @@ def main(argv: list[str] | None = None) -> int:
         convert_parser = build_convert_parser()
         convert_args = convert_parser.parse_args(argv[1:])
         return _run_convert(convert_args)
+    if argv and argv[0] == "nlpd":
+        nlpd_parser = build_nlpd_parser()
+        nlpd_args = nlpd_parser.parse_args(argv[1:])
+        return _run_nlpd(nlpd_args)
     if argv and argv[0] == "deps":
         deps_parser = build_deps_parser()
         deps_args = deps_parser.parse_args(argv[1:])
@@ -2191,7 +2454,7 @@ def main(argv: list[str] | None = None) -> int:
         raise FileNotFoundError(f"Input path not found: {inp_path}")
 
     try:
-        backend = NLPBackend()
+        backend = load_backend()
     except NLPBackendUnavailableError as exc:
         raise SystemExit(str(exc)) from exc
 
@@ -2205,6 +2468,7 @@ def main(argv: list[str] | None = None) -> int:
             raise ValueError(f"Input must be an .epub file or directory: {inp_path}")
         epubs = [inp_path]
 
+    chapter_progress: Progress | None = None
     if console.is_terminal:
         chapter_progress = Progress(
             SpinnerColumn(),
@@ -2215,24 +2479,47 @@ def main(argv: list[str] | None = None) -> int:
             console=console,
             transient=False,
         )
-        with chapter_progress:
-            for epub_path in epubs:
-                _chapterize_epub(
-                    epub_path,
-                    backend,
-                    progress_display=chapter_progress,
-                    console=console,
-                    transform=args.transform,
-                )
-    else:
-        for epub_path in epubs:
-            _chapterize_epub(
-                epub_path,
-                backend,
-                progress_display=None,
+    # Several books split the workers between them; a single book keeps them
+    # all for its own evidence and chapter pools.
+    total_jobs = _resolve_jobs(args.jobs)
+    book_workers = min(total_jobs, len(epubs)) if inp_path.is_dir() else 1
+    failures: list[tuple[Path, str]] = []
+    with chapter_progress if chapter_progress is not None else contextlib.nullcontext():
+        if book_workers > 1:
+            failures = _chapterize_books_in_parallel(
+                epubs,
+                workers=book_workers,
+                progress_display=chapter_progress,
                 console=console,
                 transform=args.transform,
+                parser=args.parser,
+                chapter_jobs=max(1, total_jobs // book_workers),
             )
+        else:
+            for epub_path in epubs:
+                try:
+                    _chapterize_epub(
+                        epub_path,
+                        backend,
+                        progress_display=chapter_progress,
+                        console=console,
+                        transform=args.transform,
+                        parser=args.parser,
+                        jobs=args.jobs,
+                    )
+                except Exception as exc:
+                    if not inp_path.is_dir():
+                        raise
+                    error = f"{exc.__class__.__name__}: {exc}"
+                    failures.append((epub_path, error))
+                    console.print(f"[nk] Failed {epub_path.name}: {error}", style="red")
+    if failures:
+        console.print(
+            f"[nk] {len(failures)} of {len(epubs)} book(s) failed: "
+            + ", ".join(path.name for path, _ in failures),
+            style="red",
+        )
+        return 1
     return 0
 
 
@@ -1,18 +1,32 @@
 from __future__ import annotations
 
+import hashlib
+import importlib.util
+import io
 import json
+import mmap
+import multiprocessing
+import os
 import re
+import sqlite3
+import struct
+import threading
+import time
 import warnings
 import unicodedata
 import xml.etree.ElementTree as ET
 import zipfile
-from bisect import bisect_right
+from bisect import bisect_left, bisect_right
 from collections import Counter, defaultdict
+from contextlib import nullcontext
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass, field, replace
+from functools import cached_property
 import json
-from pathlib import PurePosixPath
-from typing import TYPE_CHECKING, Callable, Mapping
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Mapping, Sequence
 from urllib.parse import unquote
+from importlib import metadata
 try:
     from importlib import resources
 except ImportError:  # pragma: no cover
@@ -20,13 +34,25 @@ except ImportError:  # pragma: no cover
 
 from bs4 import (
     BeautifulSoup,
-    Doctype,
+    CData,
     FeatureNotFound,
     NavigableString,
+    PageElement,
     Tag,
     XMLParsedAsHTMLWarning,
 )  # type: ignore
 
+from lxml import etree
+
+from .chars import (
+    contains_cjk,
+    contains_hiragana,
+    hiragana_to_katakana,
+    is_cjk_char,
+    is_kana_char,
+    is_kana_string,
+    normalize_katakana,
+)
 from .pitch import PitchToken
 from .tokens import ChapterToken, tokens_to_pitch_tokens
 
@@ -193,13 +219,20 @@ class _ReadingAccumulator:
             self.prefix_samples.extend(other.prefix_samples[:remaining])
 
 
-_CORPUS_READING_CACHE: dict[str, _ReadingAccumulator] | None = None
+_CORPUS_READINGS_JSON = "nhk_easy_readings.json"
+_CORPUS_READINGS_INDEX = "nhk_easy_readings.idx"
+_CORPUS_READING_CACHE: Mapping[str, _ReadingAccumulator] | None = None
+_CORPUS_READING_DIGEST: str | None = None
 _MAX_SUFFIX_SAMPLES = 12
 _MAX_SUFFIX_CONTEXTS = 8
 _MAX_PREFIX_SAMPLES = 12
 _MAX_PREFIX_CONTEXTS = 6
 _NUMERIC_PREFIX_CHARS = set("0123456789０１２３４５６７８９一二三四五六七八九十百千〇零")
 _SURFACE_PITCH_CACHE_ATTR = "_nk_surface_pitch_cache"
+_SURFACE_PITCH_CACHE_FORMAT = 1
+_SURFACE_PITCH_CACHE_FILE = "surface-pitch.sqlite3"
+_SURFACE_PITCH_CACHE_MAX_ENTRIES = 200_000
+_SURFACE_PITCH_PRUNE_INTERVAL = 1024
 _SURFACE_PITCH_SKIP_SOURCES = {"unidic"}
 
 
@@ -269,6 +302,7 @@ class ChapterText:
     pitch_data: list[PitchToken] | None = None
     book_author: str | None = None
     tokens: list[ChapterToken] | None = None
+    fingerprint: str | None = None
 
 
 @dataclass
@@ -307,6 +341,7 @@ class _PendingChapter:
     title_hint: str | None
     tokens: list[PitchToken] = field(default_factory=list)
     ruby_spans: list[_RubySpan] = field(default_factory=list)
+    members: tuple[str, ...] = ()
 
 
 @dataclass
@@ -318,6 +353,11 @@ class _TextFragment:
 
 
 
+_ANCHOR_SPAN_OPEN = 0
+_ANCHOR_SPAN_CLOSE = 1
+_ANCHOR_NAV = 2
+
+
 @dataclass
 class _RubySpanRecord:
     base: str
@@ -333,100 +373,95 @@ class _RubySpan:
 
 
 class _RubySpanTracker:
-    _START_PREFIX = "[[NKR:"
-    _END_PREFIX = "[[/NKR:"
-    _SUFFIX = "]]"
+    """
+    Collect the original-text view of a document together with its ruby
+    spans and nav boundaries.
+
+    The renderer appends text to ``parts`` and drops anchors (the current
+    part count) where a ruby opens or closes and where a nav point starts.
+    ``finish`` cleans the text between anchors piece by piece and turns the
+    anchors into offsets, so nothing is injected into the text and the
+    result never has to be re-scanned.
+    """
 
     def __init__(self) -> None:
-        self._next_id = 1
-        self._records: dict[str, _RubySpanRecord] = {}
-
-    def wrap_ruby(self, ruby: Tag) -> None:
-        token_id = str(self._next_id)
-        self._next_id += 1
-        base_raw = _normalize_ws(_ruby_base_text(ruby))
-        reading_raw = _normalize_ws(_ruby_reading_text(ruby))
+        self.parts: list[str] = []
+        self._records: list[_RubySpanRecord] = []
+        # (part index, kind, span index or nav order)
+        self._anchors: list[tuple[int, int, int]] = []
+
+    def register_span(self, base_text: str, reading_text: str) -> int | None:
+        """
+        Register a ruby by its raw base/reading text and return its span id,
+        or None when there is no usable pair.
+        """
+        base_raw = _normalize_ws(base_text)
+        reading_raw = _normalize_ws(reading_text)
         if not base_raw or not reading_raw:
-            return
+            return None
         base_norm = unicodedata.normalize("NFKC", base_raw)
-        reading_norm = _normalize_katakana(_hiragana_to_katakana(reading_raw))
+        reading_norm = normalize_katakana(hiragana_to_katakana(reading_raw))
         if not reading_norm:
-            return
-        self._records[token_id] = _RubySpanRecord(base=base_norm, reading=reading_norm)
-        start_marker = NavigableString(f"{self._START_PREFIX}{token_id}{self._SUFFIX}")
-        end_marker = NavigableString(f"{self._END_PREFIX}{token_id}{self._SUFFIX}")
-        ruby.insert_before(start_marker)
-        ruby.insert_after(end_marker)
-
-    def mark_soup(self, soup: BeautifulSoup) -> None:
-        for ruby in list(soup.find_all("ruby")):
-            self.wrap_ruby(ruby)
-
-    def extract(self, text: str) -> tuple[str, list[_RubySpan]]:
-        if not text:
-            return "", []
-        result_chars: list[str] = []
+            return None
+        self._records.append(_RubySpanRecord(base=base_norm, reading=reading_norm))
+        return len(self._records) - 1
+
+    def open_span(self, span_id: int) -> None:
+        self._anchors.append((len(self.parts), _ANCHOR_SPAN_OPEN, span_id))
+
+    def close_span(self, span_id: int) -> None:
+        self._anchors.append((len(self.parts), _ANCHOR_SPAN_CLOSE, span_id))
+
+    def nav(self, order: int) -> None:
+        # Nav points keep the line breaks the chapter markers carried.
+        self.parts.append("\n")
+        self._anchors.append((len(self.parts), _ANCHOR_NAV, order))
+        self.parts.append("\n")
+
+    def finish(self) -> tuple[str, list[_RubySpan], list[tuple[int, int]]]:
+        """Return the cleaned text, its ruby spans and (nav order, offset) pairs."""
+        parts = self.parts
+        anchors = self._anchors
+        pieces: list[str] = []
         spans: list[_RubySpan] = []
-        idx = 0
-        length = len(text)
-        while idx < length:
-            if text.startswith(self._START_PREFIX, idx):
-                id_start = idx + len(self._START_PREFIX)
-                id_end = text.find(self._SUFFIX, id_start)
-                if id_end == -1:
-                    result_chars.append(text[idx])
-                    idx += 1
-                    continue
-                token_id = text[id_start:id_end]
-                idx = id_end + len(self._SUFFIX)
-                start_pos = len(result_chars)
-                close_marker = f"{self._END_PREFIX}{token_id}{self._SUFFIX}"
-                close_idx = text.find(close_marker, idx)
-                if close_idx == -1:
-                    # Marker not closed; re-emit the literal marker text.
-                    literal = f"{self._START_PREFIX}{token_id}{self._SUFFIX}"
-                    result_chars.append(literal)
-                    continue
-                # Consume everything between markers.
-                while idx < close_idx:
-                    result_chars.append(text[idx])
-                    idx += 1
-                end_pos = len(result_chars)
-                idx += len(close_marker)
-                record = self._records.get(token_id)
-                if record is None:
-                    continue
-                spans.append(
-                    _RubySpan(
-                        start=start_pos,
-                        end=end_pos,
-                        base=record.base,
-                        reading=record.reading,
-                    )
-                )
+        open_span: _RubySpan | None = None
+        depth = 0
+        nav_offsets: list[tuple[int, int]] = []
+        offset = 0
+        part_start = 0
+        last_index = len(anchors)
+        for index in range(last_index + 1):
+            part_end = anchors[index][0] if index < last_index else len(parts)
+            if part_end > part_start or index in (0, last_index):
+                # Cleanup never reaches across an anchor (a ruby edge keeps
+                # ｶ and ﾞ apart), and only the outer ends are stripped.
+                piece = _clean_extracted_segment("".join(parts[part_start:part_end]))
+                if index == 0:
+                    piece = piece.lstrip()
+                if index == last_index:
+                    piece = piece.rstrip()
+                pieces.append(piece)
+                offset += len(piece)
+                part_start = part_end
+            if index == last_index:
+                break
+            _, kind, value = anchors[index]
+            if kind == _ANCHOR_NAV:
+                nav_offsets.append((value, offset))
+            elif kind == _ANCHOR_SPAN_OPEN:
+                depth += 1
+                if depth == 1:
+                    # A ruby nested in another is covered by the outer span.
+                    record = self._records[value]
+                    open_span = _RubySpan(start=offset, end=offset, base=record.base, reading=record.reading)
+                    spans.append(open_span)
             else:
-                result_chars.append(text[idx])
-                idx += 1
-        return "".join(result_chars), spans
-
-
-def _is_cjk_char(ch: str) -> bool:
-    if not ch:
-        return False
-    code = ord(ch)
-    return (
-        0x4E00 <= code <= 0x9FFF  # CJK Unified Ideographs
-        or 0x3400 <= code <= 0x4DBF  # Extension A
-        or 0x20000 <= code <= 0x2A6DF  # Extension B
-        or 0x2A700 <= code <= 0x2B73F  # Extension C
-        or 0x2B740 <= code <= 0x2B81F  # Extension D
-        or 0x2B820 <= code <= 0x2CEAF  # Extension E
-        or 0x2CEB0 <= code <= 0x2EBEF  # Extension F
-        or 0x30000 <= code <= 0x3134F  # Extension G
-        or 0xF900 <= code <= 0xFAFF  # Compatibility Ideographs
-        or 0x2F800 <= code <= 0x2FA1F  # Compatibility Supplement
-        or ch in "々〆ヵヶ"
-    )
+                depth -= 1
+                if depth == 0 and open_span is not None:
+                    open_span.end = offset
+                    open_span = None
+        self.parts = []
+        return "".join(pieces), spans, nav_offsets
 
 
 def _is_numeric_string(value: str) -> bool:
@@ -435,13 +470,77 @@ def _is_numeric_string(value: str) -> bool:
     return all(ch.isdigit() for ch in value)
 
 
-def _build_mapping_pattern(mapping: dict[str, str]) -> re.Pattern[str] | None:
+class _MappingMatcher:
+    """
+    Precompiled leftmost-longest matcher over the bases of a reading mapping.
+
+    Matches exactly like a regex alternation of the bases sorted longest
+    first: at each position the longest base wins, and scanning resumes after
+    it whether or not the caller accepts the match. Build it once per mapping
+    and reuse it for every text the mapping is applied to.
+    """
+
+    def __init__(self, bases: Iterable[str]) -> None:
+        # Nested dicts keyed by character; the "" key marks a complete base.
+        self._root: dict[str, dict] = {}
+        for base in bases:
+            if not base:
+                continue
+            node = self._root
+            for ch in base:
+                node = node.setdefault(ch, {})
+            node[""] = base
+        # Positions that cannot start a base are skipped by the regex engine.
+        first_chars = "".join(re.escape(ch) for ch in sorted(self._root))
+        self._starts = re.compile(f"[{first_chars}]") if first_chars else None
+
+    def finditer(self, text: str) -> Iterator[tuple[int, int, str]]:
+        """Yield non-overlapping ``(start, end, base)`` matches left to right."""
+        if self._starts is None:
+            return
+        root = self._root
+        search = self._starts.search
+        length = len(text)
+        pos = 0
+        while (found := search(text, pos)) is not None:
+            start = found.start()
+            node = root
+            idx = start
+            best: str | None = None
+            best_end = start
+            while idx < length:
+                node = node.get(text[idx])
+                if node is None:
+                    break
+                idx += 1
+                base = node.get("")
+                if base is not None:
+                    best = base
+                    best_end = idx
+            if best is None:
+                pos = start + 1
+                continue
+            yield start, best_end, best
+            pos = best_end
+
+    def sub(self, repl: Callable[[int, int, str], str], text: str) -> str:
+        """Replace each match with ``repl(start, end, base)``."""
+        pieces: list[str] = []
+        last = 0
+        for start, end, base in self.finditer(text):
+            pieces.append(text[last:start])
+            pieces.append(repl(start, end, base))
+            last = end
+        if not pieces:
+            return text
+        pieces.append(text[last:])
+        return "".join(pieces)
+
+
+def _build_mapping_matcher(mapping: Mapping[str, str]) -> _MappingMatcher | None:
     if not mapping:
         return None
-    keys = sorted(mapping.keys(), key=len, reverse=True)
-    if not keys:
-        return None
-    return re.compile("|".join(re.escape(k) for k in keys))
+    return _MappingMatcher(mapping.keys())
 
 
 def _extract_numeric_prefix_context(text: str, start: int, max_len: int) -> str:
@@ -465,15 +564,15 @@ def _extract_numeric_prefix_context(text: str, start: int, max_len: int) -> str:
     return _normalize_numeric_prefix("".join(reversed(chars)))
 
 
-def _apply_mapping_with_pattern(
+def _apply_mapping_with_matcher(
     text: str,
-    mapping: dict[str, str],
-    pattern: re.Pattern[str],
+    mapping: Mapping[str, str],
+    matcher: _MappingMatcher | None,
     source_labels: dict[str, str] | None = None,
     context_rules: dict[str, _ContextRule] | None = None,
     skip_chapter_markers: bool = False,
 ) -> str:
-    if pattern is None:
+    if matcher is None:
         return text
     protected_spans: list[tuple[int, int]] = []
     if skip_chapter_markers:
@@ -481,9 +580,7 @@ def _apply_mapping_with_pattern(
     protected_spans = sorted(protected_spans)
     protected_starts: list[int] = [span[0] for span in protected_spans] if protected_spans else []
 
-    def repl(match: re.Match[str]) -> str:
-        base = match.group(0)
-        start, end = match.span()
+    def repl(start: int, end: int, base: str) -> str:
         if protected_spans:
             idx = bisect_right(protected_starts, start) - 1
             if idx >= 0:
@@ -498,7 +595,7 @@ def _apply_mapping_with_pattern(
             if base[-1].isdigit() and next_ch and next_ch.isdigit():
                 return base
         if len(base) == 1:
-            if (_is_cjk_char(prev_ch) and prev_ch != "\n") or _is_cjk_char(next_ch):
+            if (is_cjk_char(prev_ch) and prev_ch != "\n") or is_cjk_char(next_ch):
                 return base
             if base.isascii() and base.isalnum():
                 if (prev_ch.isascii() and prev_ch.isalnum()) or (
@@ -516,7 +613,7 @@ def _apply_mapping_with_pattern(
         replacement = mapping[base]
         return replacement
 
-    return pattern.sub(repl, text)
+    return matcher.sub(repl, text)
 
 
 def _mapping_match_allowed(text: str, start: int, end: int, base: str) -> bool:
@@ -528,7 +625,7 @@ def _mapping_match_allowed(text: str, start: int, end: int, base: str) -> bool:
         if base[-1].isdigit() and next_ch.isdigit():
             return False
     if len(base) == 1:
-        if (_is_cjk_char(prev_ch) and prev_ch != "\n") or _is_cjk_char(next_ch):
+        if (is_cjk_char(prev_ch) and prev_ch != "\n") or is_cjk_char(next_ch):
             return False
         if base.isascii() and base.isalnum():
             if (prev_ch.isascii() and prev_ch.isalnum()) or (next_ch.isascii() and next_ch.isalnum()):
@@ -543,14 +640,14 @@ def _iter_mapping_matches(
     text: str,
     mapping: Mapping[str, str],
     context_rules: Mapping[str, _ContextRule] | None = None,
+    matcher: _MappingMatcher | None = None,
 ) -> list[tuple[int, int, str, str]]:
-    pattern = _build_mapping_pattern(mapping)
-    if pattern is None:
-        return []
+    if matcher is None:
+        matcher = _build_mapping_matcher(mapping)
+        if matcher is None:
+            return []
     matches: list[tuple[int, int, str, str]] = []
-    for match in pattern.finditer(text):
-        start, end = match.span()
-        base = match.group(0)
+    for start, end, base in matcher.finditer(text):
         reading = mapping.get(base)
         if not reading:
             continue
@@ -565,11 +662,9 @@ def _iter_mapping_matches(
     return matches
 
 
-def _get_book_title(zf: zipfile.ZipFile) -> str | None:
+def _get_book_title(epub: EpubContainer) -> str | None:
     try:
-        opf_path = _find_opf_path(zf)
-        opf_xml = _zip_read_text(zf, opf_path)
-        root = ET.fromstring(opf_xml)
+        _, root = epub.package()
         for title_el in root.findall(".//{http://purl.org/dc/elements/1.1/}title"):
             title_text = "".join(title_el.itertext()).strip()
             if title_text:
@@ -579,11 +674,9 @@ def _get_book_title(zf: zipfile.ZipFile) -> str | None:
     return None
 
 
-def _get_book_author(zf: zipfile.ZipFile) -> str | None:
+def _get_book_author(epub: EpubContainer) -> str | None:
     try:
-        opf_path = _find_opf_path(zf)
-        opf_xml = _zip_read_text(zf, opf_path)
-        root = ET.fromstring(opf_xml)
+        _, root = epub.package()
         authors: list[str] = []
         for creator_el in root.findall(".//{http://purl.org/dc/elements/1.1/}creator"):
             raw_name = "".join(creator_el.itertext()).strip()
@@ -612,40 +705,37 @@ def _get_book_author(zf: zipfile.ZipFile) -> str | None:
 
 def _apply_mapping_to_plain_text(
     text: str,
-    mapping: dict[str, str],
-    context_rules: dict[str, _ContextRule] | None = None,
-    source_labels: dict[str, str] | None = None,
+    mapping: Mapping[str, str],
+    context_rules: Mapping[str, _ContextRule] | None = None,
+    source_labels: Mapping[str, str] | None = None,
+    matcher: _MappingMatcher | None = None,
 ) -> str:
-    pattern = _build_mapping_pattern(mapping)
-    if pattern is None:
-        return text
-    return _apply_mapping_with_pattern(
+    if matcher is None:
+        matcher = _build_mapping_matcher(mapping)
+        if matcher is None:
+            return text
+    return _apply_mapping_with_matcher(
         text,
         mapping,
-        pattern,
+        matcher,
         source_labels=source_labels,
         context_rules=context_rules,
         skip_chapter_markers=True,
     )
 
 
-def _lookup_surface_pitch(
+def _surface_pitch_from_backend(
     surface: str,
     backend: "NLPBackend",
 ) -> tuple[str, PitchToken] | None:
-    if not surface:
-        return None
-    try:
-        reading_text, tokens = backend.to_reading_with_pitch(surface)
-    except Exception:
-        return None
+    reading_text, tokens = backend.to_reading_with_pitch(surface)
     if len(tokens) != 1:
         return None
     token = tokens[0]
     if token.accent_type is None or not token.reading:
         return None
-    normalized_token_reading = _normalize_katakana(token.reading)
-    normalized_surface_reading = _normalize_katakana(reading_text.strip())
+    normalized_token_reading = normalize_katakana(token.reading)
+    normalized_surface_reading = normalize_katakana(reading_text.strip())
     if not normalized_surface_reading:
         return None
     if normalized_token_reading != normalized_surface_reading:
@@ -653,28 +743,213 @@ def _lookup_surface_pitch(
     return normalized_surface_reading, token
 
 
+class _SurfacePitchCache:
+    """
+    Surface -> (reading, accent, connection, pos) lookups for one backend.
+
+    Results live in memory for the backend's lifetime and in a SQLite file
+    under ``NK_CACHE_DIR`` shared by every book and process. Rows are keyed
+    by the backend's dictionary and the nk version, and the least recently
+    used rows are dropped once the file holds more than
+    ``_SURFACE_PITCH_CACHE_MAX_ENTRIES``. Surfaces the backend cannot give a
+    single accented token for are stored too, as rows without a reading.
+    Any SQLite failure leaves the cache memory-only.
+    """
+
+    def __init__(
+        self,
+        path: Path | None,
+        dictionary_key: str | None,
+        *,
+        max_entries: int = _SURFACE_PITCH_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self.path = path if dictionary_key else None
+        self.dictionary_key = dictionary_key
+        self.max_entries = max_entries
+        self._memo: dict[str, tuple[str, PitchToken] | None] = {}
+        self._connection: sqlite3.Connection | None = None
+        self._pending: dict[str, tuple[str | None, int | None, str | None, str | None]] = {}
+        self._touched: set[str] = set()
+        self._inserted_since_prune = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_backend(cls, backend: "NLPBackend") -> _SurfacePitchCache:
+        cache = getattr(backend, _SURFACE_PITCH_CACHE_ATTR, None)
+        if cache is None:
+            dictionary_id = getattr(backend, "dictionary_id", None)
+            key = None
+            if isinstance(dictionary_id, str) and dictionary_id:
+                key = f"{dictionary_id}:{_nk_version()}"
+            cache = cls(_nk_cache_dir() / _SURFACE_PITCH_CACHE_FILE, key)
+            setattr(backend, _SURFACE_PITCH_CACHE_ATTR, cache)
+        return cache
+
+    def lookup(self, surface: str, backend: "NLPBackend") -> tuple[str, PitchToken] | None:
+        if not surface:
+            return None
+        memo = self._memo
+        if surface in memo:
+            return memo[surface]
+        with self._lock:
+            found, result = self._load(surface)
+            if not found:
+                try:
+                    result = _surface_pitch_from_backend(surface, backend)
+                except Exception:
+                    # Not persisted: the next run may get an answer.
+                    memo[surface] = None
+                    return None
+                self._store(surface, result)
+            memo[surface] = result
+        return result
+
+    def flush(self) -> None:
+        """Write new rows and refresh the use time of rows read this run."""
+        with self._lock:
+            if not self._pending and not self._touched:
+                return
+            connection = self._connect()
+            pending, touched = self._pending, self._touched
+            self._pending, self._touched = {}, set()
+            if connection is None:
+                return
+            now = int(time.time())
+            try:
+                with connection:
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO surface_pitch VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        [
+                            (self.dictionary_key, surface, *row, now)
+                            for surface, row in pending.items()
+                        ],
+                    )
+                    connection.executemany(
+                        "UPDATE surface_pitch SET used = ? WHERE dictionary = ? AND surface = ?",
+                        [(now, self.dictionary_key, surface) for surface in touched],
+                    )
+                self._inserted_since_prune += len(pending)
+                if self._inserted_since_prune >= _SURFACE_PITCH_PRUNE_INTERVAL:
+                    self._prune(connection)
+            except sqlite3.Error:
+                self._disable()
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _load(self, surface: str) -> tuple[bool, tuple[str, PitchToken] | None]:
+        connection = self._connect()
+        if connection is None:
+            return False, None
+        try:
+            row = connection.execute(
+                "SELECT reading, accent, connection, pos FROM surface_pitch "
+                "WHERE dictionary = ? AND surface = ?",
+                (self.dictionary_key, surface),
+            ).fetchone()
+        except sqlite3.Error:
+            self._disable()
+            return False, None
+        if row is None:
+            return False, None
+        self._touched.add(surface)
+        reading, accent_type, accent_connection, pos = row
+        if reading is None:
+            return True, None
+        token = PitchToken(
+            surface=surface,
+            reading=reading,
+            accent_type=accent_type,
+            accent_connection=accent_connection,
+            pos=pos,
+            sources=("unidic",),
+        )
+        return True, (reading, token)
+
+    def _store(self, surface: str, result: tuple[str, PitchToken] | None) -> None:
+        if self.path is None:
+            return
+        if result is None:
+            self._pending[surface] = (None, None, None, None)
+        else:
+            reading, token = result
+            self._pending[surface] = (reading, token.accent_type, token.accent_connection, token.pos)
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self._connection is not None or self.path is None:
+            return self._connection
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            (version,) = connection.execute("PRAGMA user_version").fetchone()
+            if version != _SURFACE_PITCH_CACHE_FORMAT:
+                with connection:
+                    connection.execute("DROP TABLE IF EXISTS surface_pitch")
+                    connection.execute(f"PRAGMA user_version = {_SURFACE_PITCH_CACHE_FORMAT}")
+            connection.execute("PRAGMA journal_mode = WAL")
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS surface_pitch ("
+                    "dictionary TEXT NOT NULL, surface TEXT NOT NULL, reading TEXT, "
+                    "accent INTEGER, connection TEXT, pos TEXT, used INTEGER NOT NULL, "
+                    "PRIMARY KEY (dictionary, surface)) WITHOUT ROWID"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS surface_pitch_used ON surface_pitch (used)"
+                )
+            self._prune(connection)
+        except (OSError, sqlite3.Error):
+            self._disable()
+            return None
+        self._connection = connection
+        return connection
+
+    def _prune(self, connection: sqlite3.Connection) -> None:
+        self._inserted_since_prune = 0
+        (count,) = connection.execute("SELECT COUNT(*) FROM surface_pitch").fetchone()
+        excess = count - self.max_entries
+        if excess <= 0:
+            return
+        with connection:
+            connection.execute(
+                "DELETE FROM surface_pitch WHERE (dictionary, surface) IN "
+                "(SELECT dictionary, surface FROM surface_pitch ORDER BY used LIMIT ?)",
+                (excess,),
+            )
+
+    def _disable(self) -> None:
+        self.path = None
+        self._pending.clear()
+        self._touched.clear()
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+def _lookup_surface_pitch(
+    surface: str,
+    backend: "NLPBackend",
+) -> tuple[str, PitchToken] | None:
+    return _SurfacePitchCache.for_backend(backend).lookup(surface, backend)
+
+
 def _fill_missing_pitch_from_surface(tokens: list[PitchToken], backend: "NLPBackend") -> None:
     if not tokens:
         return
-    cache = getattr(backend, _SURFACE_PITCH_CACHE_ATTR, None)
-    if cache is None:
-        cache = {}
-        setattr(backend, _SURFACE_PITCH_CACHE_ATTR, cache)
-    sentinel = object()
     for token in tokens:
         if token.accent_type is not None or not token.reading or not token.surface:
             continue
         sources = token.sources or ()
         if any((source or "").lower() in _SURFACE_PITCH_SKIP_SOURCES for source in sources):
             continue
-        normalized_reading = _normalize_katakana(token.reading)
+        normalized_reading = normalize_katakana(token.reading)
         if not normalized_reading:
             continue
-        cache_key = unicodedata.normalize("NFKC", token.surface)
-        cached = cache.get(cache_key, sentinel)
-        if cached is sentinel:
-            cached = _lookup_surface_pitch(token.surface, backend)
-            cache[cache_key] = cached
+        cached = _lookup_surface_pitch(token.surface, backend)
         if not cached:
             continue
         cached_reading, source_token = cached
@@ -691,11 +966,6 @@ def _fill_missing_pitch_from_surface(tokens: list[PitchToken], backend: "NLPBack
 def _fill_missing_accent_on_chapter_tokens(tokens: list[ChapterToken], backend: "NLPBackend") -> None:
     if not tokens:
         return
-    cache = getattr(backend, _SURFACE_PITCH_CACHE_ATTR, None)
-    if cache is None:
-        cache = {}
-        setattr(backend, _SURFACE_PITCH_CACHE_ATTR, cache)
-    sentinel = object()
     for token in tokens:
         surface = token.surface
         reading = token.reading or token.fallback_reading
@@ -705,14 +975,10 @@ def _fill_missing_accent_on_chapter_tokens(tokens: list[ChapterToken], backend:
         if source in _SURFACE_PITCH_SKIP_SOURCES:
             token.reading_validated = True
             continue
-        normalized_reading = _normalize_katakana(reading)
+        normalized_reading = normalize_katakana(reading)
         if not normalized_reading:
             continue
-        cache_key = unicodedata.normalize("NFKC", surface)
-        cached = cache.get(cache_key, sentinel)
-        if cached is sentinel:
-            cached = _lookup_surface_pitch(surface, backend)
-            cache[cache_key] = cached
+        cached = _lookup_surface_pitch(surface, backend)
         if not cached:
             continue
         cached_reading, source_token = cached
@@ -799,33 +1065,56 @@ def _remap_tokens_to_text(text: str, tokens: list[PitchToken]) -> None:
         cursor = end
 
 
-def _find_surface_positions(text: str, surface: str) -> list[int]:
-    positions: list[int] = []
-    if not text or not surface:
-        return positions
-    start = 0
-    while True:
-        idx = text.find(surface, start)
-        if idx == -1:
-            break
-        positions.append(idx)
-        start = idx + max(1, len(surface))
-    return positions
+class _SurfaceOccurrences:
+    """
+    Per-text index of where each surface occurs.
 
+    Positions of each leading character are collected once per text, so a
+    surface lookup only checks the places its first character appears
+    instead of rescanning the whole text.
+    """
 
-def _range_is_free(ranges: list[tuple[int, int]], start: int, end: int) -> bool:
-    for existing_start, existing_end in ranges:
-        if end <= existing_start:
-            continue
-        if start >= existing_end:
-            continue
-        return False
-    return True
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self._char_positions: dict[str, list[int]] = {}
+
+    def positions(self, surface: str) -> list[int]:
+        """Non-overlapping occurrences of ``surface``, left to right."""
+        if not self.text or not surface:
+            return []
+        first = surface[0]
+        candidates = self._char_positions.get(first)
+        if candidates is None:
+            candidates = [match.start() for match in re.finditer(re.escape(first), self.text)]
+            self._char_positions[first] = candidates
+        if len(surface) == 1:
+            return list(candidates)
+        found: list[int] = []
+        next_free = 0
+        text = self.text
+        for idx in candidates:
+            if idx >= next_free and text.startswith(surface, idx):
+                found.append(idx)
+                next_free = idx + len(surface)
+        return found
+
+
+class _CoverageIndex:
+    """Disjoint claimed ranges kept sorted for O(log n) overlap checks."""
 
+    def __init__(self) -> None:
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+
+    def is_free(self, start: int, end: int) -> bool:
+        # Only the last range starting before ``end`` can reach past ``start``.
+        idx = bisect_left(self._starts, end)
+        return idx == 0 or self._ends[idx - 1] <= start
 
-def _add_coverage_range(ranges: list[tuple[int, int]], start: int, end: int) -> None:
-    ranges.append((start, end))
-    ranges.sort(key=lambda item: item[0])
+    def add(self, start: int, end: int) -> None:
+        idx = bisect_left(self._starts, start)
+        self._starts.insert(idx, start)
+        self._ends.insert(idx, end)
 
 
 def _slice_ruby_spans(spans: list[_RubySpan], start: int, end: int) -> list[_RubySpan]:
@@ -851,13 +1140,14 @@ def _align_tokens_to_original_text(original_text: str | None, tokens: list[Pitch
         return
     cursor = 0
     text_len = len(original_text)
+    occurrences = _SurfaceOccurrences(original_text)
     surface_positions: dict[str, list[int]] = {}
     surface_indices: dict[str, int] = {}
     for token in tokens:
         surface = (token.surface or "").strip()
         if not surface or surface in surface_positions:
             continue
-        surface_positions[surface] = _find_surface_positions(original_text, surface)
+        surface_positions[surface] = occurrences.positions(surface)
         surface_indices[surface] = 0
     for token in tokens:
         token.original_start = None
@@ -929,8 +1219,13 @@ def _build_chapter_tokens_from_original(
     unique_sources: Mapping[str, str],
     common_sources: Mapping[str, str],
     context_rules: Mapping[str, _ContextRule],
+    *,
+    unique_matcher: _MappingMatcher | None = None,
+    common_matcher: _MappingMatcher | None = None,
+    timings: dict[str, float] | None = None,
 ) -> list[ChapterToken]:
-    coverage: list[tuple[int, int]] = []
+    started = time.perf_counter()
+    coverage = _CoverageIndex()
     tokens: list[ChapterToken] = []
     propagation_mapping: dict[str, str] = {}
     propagation_mapping.update(common_mapping)
@@ -940,7 +1235,7 @@ def _build_chapter_tokens_from_original(
     compound_prefixes: set[str] = set()
     if propagation_mapping:
         def _is_compound_candidate(base: str) -> bool:
-            return bool(base) and len(base) > 1 and any(_contains_cjk(ch) for ch in base)
+            return bool(base) and len(base) > 1 and contains_cjk(base)
 
         for base, reading in propagation_mapping.items():
             if not _is_compound_candidate(base):
@@ -966,9 +1261,9 @@ def _build_chapter_tokens_from_original(
             surface=surface,
             start=start,
             end=end,
-            reading=_normalize_katakana(reading),
+            reading=normalize_katakana(reading),
             reading_source=source,
-            fallback_reading=_normalize_katakana(fallback or reading),
+            fallback_reading=normalize_katakana(fallback or reading),
             context_prefix=text[max(0, start - 3) : start],
             context_suffix=text[end : end + 3],
             accent_type=accent_type,
@@ -976,7 +1271,7 @@ def _build_chapter_tokens_from_original(
             pos=pos,
         )
         tokens.append(token)
-        _add_coverage_range(coverage, start, end)
+        coverage.add(start, end)
 
     if ruby_spans:
         idx = 0
@@ -984,7 +1279,7 @@ def _build_chapter_tokens_from_original(
             span = ruby_spans[idx]
             start = max(0, min(len(text), span.start))
             end = max(start, min(len(text), span.end))
-            if not _range_is_free(coverage, start, end):
+            if not coverage.is_free(start, end):
                 idx += 1
                 continue
             consumed = False
@@ -1011,7 +1306,7 @@ def _build_chapter_tokens_from_original(
                     last_index = next_index
                 if best_combo:
                     last_idx, _, combo_reading, combo_end = best_combo
-                    if _range_is_free(coverage, start, combo_end):
+                    if coverage.is_free(start, combo_end):
                         _append_token(start, combo_end, combo_reading, "ruby")
                         idx = last_idx + 1
                         consumed = True
@@ -1019,7 +1314,7 @@ def _build_chapter_tokens_from_original(
                 continue
             reading = span.reading
             fallback_reading: str | None = None
-            if _contains_cjk(reading):
+            if contains_cjk(reading):
                 base = span.base or ""
                 canonical = None
                 if base:
@@ -1028,41 +1323,44 @@ def _build_chapter_tokens_from_original(
                         canonical = lookup[0]
                     else:
                         try:
-                            canonical = _normalize_katakana(backend.to_reading_text(base).strip())
+                            canonical = normalize_katakana(backend.to_reading_text(base).strip())
                         except Exception:
                             canonical = None
                 if not canonical:
-                    canonical = _normalize_katakana(_hiragana_to_katakana(reading))
+                    canonical = normalize_katakana(hiragana_to_katakana(reading))
                 fallback_reading = canonical
             _append_token(start, end, reading, "ruby", fallback=fallback_reading)
             idx += 1
 
-    for mapping, sources in (
-        (unique_mapping, unique_sources),
-        (common_mapping, common_sources),
+    for mapping, sources, matcher in (
+        (unique_mapping, unique_sources, unique_matcher),
+        (common_mapping, common_sources, common_matcher),
     ):
         if not mapping:
             continue
-        matches = _iter_mapping_matches(text, mapping, context_rules)
+        matches = _iter_mapping_matches(text, mapping, context_rules, matcher)
         if not matches:
             continue
         matches.sort(key=lambda item: (item[0], -(item[1] - item[0])))
         for start, end, base, reading in matches:
-            if not _range_is_free(coverage, start, end):
+            if not coverage.is_free(start, end):
                 continue
             source_label = sources.get(base, "propagation")
             _append_token(start, end, reading, source_label)
 
-    raw_tokens = backend.tokenize(text)
-    for raw in raw_tokens:
+    tokenize_started = time.perf_counter()
+    # Long chapters are tagged window by window; only the CJK tokens kept
+    # below outlive the loop.
+    iter_tokens = getattr(backend, "iter_tokens", backend.tokenize)
+    for raw in iter_tokens(text):
         start = raw.start
         end = raw.end
-        if not _range_is_free(coverage, start, end):
+        if not coverage.is_free(start, end):
             continue
         surface = raw.surface
-        if not surface or not _contains_cjk(surface):
+        if not surface or not contains_cjk(surface):
             continue
-        reading = _normalize_katakana(raw.reading)
+        reading = normalize_katakana(raw.reading)
         if not reading:
             continue
         _append_token(
@@ -1075,6 +1373,7 @@ def _build_chapter_tokens_from_original(
             accent_connection=raw.accent_connection,
             pos=raw.pos,
         )
+    tokenize_seconds = time.perf_counter() - tokenize_started
 
     tokens.sort(key=lambda token: (token.start, token.end))
 
@@ -1086,12 +1385,12 @@ def _build_chapter_tokens_from_original(
         for raw in raw_gap_tokens:
             seg_start = start_idx + raw.start
             seg_end = start_idx + raw.end
-            if not _range_is_free(coverage, seg_start, seg_end):
+            if not coverage.is_free(seg_start, seg_end):
                 continue
             surface = segment[raw.start:raw.end]
-            if not surface or not _contains_cjk(surface):
+            if not surface or not contains_cjk(surface):
                 continue
-            reading = _normalize_katakana(raw.reading)
+            reading = normalize_katakana(raw.reading)
             if not reading:
                 continue
             _append_token(
@@ -1113,34 +1412,39 @@ def _build_chapter_tokens_from_original(
     if last_end < len(text):
         _fill_gaps_with_backend(last_end, len(text))
 
+    pitch_started = time.perf_counter()
     _harmonize_small_kana(tokens, backend)
     _flag_unidic_ambiguous_tokens(tokens)
     _flag_surface_reading_conflicts(tokens)
     _fill_missing_accent_on_chapter_tokens(tokens, backend)
+    _SurfacePitchCache.for_backend(backend).flush()
     tokens.sort(key=lambda token: (token.start, token.end))
+    _add_stage_time(timings, "tokenize", tokenize_seconds)
+    _add_stage_time(timings, "tokens", pitch_started - started - tokenize_seconds)
+    _add_stage_time(timings, "pitch", time.perf_counter() - pitch_started)
     return tokens
 
 
 def _harmonize_small_kana(tokens: list[ChapterToken], backend: "NLPBackend") -> None:
     if not tokens:
         return
+    canonical: list[tuple[ChapterToken, str | None]] = []
+    unresolved: list[int] = []
     for token in tokens:
-        surface = token.surface
-        reading = token.reading
-        if not surface or not reading:
+        if not token.surface or not token.reading:
             continue
-        canonical_reading: str | None = None
-        lookup = _lookup_surface_pitch(surface, backend)
-        if lookup:
-            canonical_reading = lookup[0]
-        if not canonical_reading:
-            try:
-                canonical_reading = _normalize_katakana(backend.to_reading_text(surface).strip())
-            except Exception:
-                canonical_reading = None
+        lookup = _lookup_surface_pitch(token.surface, backend)
+        canonical_reading = lookup[0] if lookup else None
         if not canonical_reading:
-            continue
-        if _differs_only_by_small_kana(reading, canonical_reading):
+            unresolved.append(len(canonical))
+        canonical.append((token, canonical_reading))
+    if unresolved:
+        surfaces = [canonical[index][0].surface for index in unresolved]
+        for index, reading in zip(unresolved, _reading_texts(backend, surfaces)):
+            if reading is not None:
+                canonical[index] = (canonical[index][0], normalize_katakana(reading.strip()))
+    for token, canonical_reading in canonical:
+        if canonical_reading and _differs_only_by_small_kana(token.reading, canonical_reading):
             token.reading = canonical_reading
             token.fallback_reading = canonical_reading
 
@@ -1171,7 +1475,7 @@ def _render_text_from_tokens(
                 output.append(chunk)
                 out_pos += len(chunk)
         reading = token.reading or token.fallback_reading or token.surface
-        normalized_reading = _normalize_katakana(reading)
+        normalized_reading = normalize_katakana(reading)
         token.reading = normalized_reading
         render_segment = normalized_reading
         if preserve_unambiguous and _token_should_preserve_surface(token):
@@ -1201,7 +1505,7 @@ def _flag_unidic_ambiguous_tokens(tokens: list[ChapterToken]) -> None:
         if not reading:
             continue
         normalized_surface = unicodedata.normalize("NFKC", token.surface)
-        normalized_reading = _normalize_katakana(reading)
+        normalized_reading = normalize_katakana(reading)
         reading_key = _strip_small_kana_variants(normalized_reading)
         readings_by_surface[normalized_surface].add(reading_key)
     ambiguous_surfaces = {surface for surface, variants in readings_by_surface.items() if len(variants) > 1}
@@ -1232,7 +1536,7 @@ def _flag_surface_reading_conflicts(tokens: list[ChapterToken]) -> None:
         if not surface or not reading:
             continue
         normalized_surface = unicodedata.normalize("NFKC", surface)
-        normalized_reading = _normalize_katakana(reading)
+        normalized_reading = normalize_katakana(reading)
         if not normalized_reading:
             continue
         reading_key = _strip_small_kana_variants(normalized_reading)
@@ -1251,33 +1555,11 @@ def _flag_surface_reading_conflicts(tokens: list[ChapterToken]) -> None:
             token.block_surface_preservation = True
 
 
-def _hiragana_to_katakana(text: str) -> str:
-    result_chars: list[str] = []
-    for ch in text:
-        code = ord(ch)
-        if 0x3041 <= code <= 0x3096:
-            result_chars.append(chr(code + 0x60))
-        elif ch == "ゝ":
-            result_chars.append("ヽ")
-        elif ch == "ゞ":
-            result_chars.append("ヾ")
-        elif ch == "ゟ":
-            result_chars.append("ヿ")
-        else:
-            result_chars.append(ch)
-    return "".join(result_chars)
-
-
-def _normalize_katakana(text: str) -> str:
-    text = unicodedata.normalize("NFKC", text)
-    text = text.replace("ヂ", "ジ").replace("ヅ", "ズ")
-    text = text.replace("ヮ", "ワ").replace("ヵ", "カ").replace("ヶ", "ケ")
-    text = text.replace("ゕ", "カ").replace("ゖ", "ケ")
-    return text
+def _zip_read_text(zf: zipfile.ZipFile, name: str) -> str:
+    return _decode_member_bytes(zf.read(name))
 
 
-def _zip_read_text(zf: zipfile.ZipFile, name: str) -> str:
-    raw = zf.read(name)
+def _decode_member_bytes(raw: bytes) -> str:
     for enc in ("utf-8", "utf-16", "cp932", "shift_jis", "euc_jp"):
         try:
             return raw.decode(enc)
@@ -1291,10 +1573,10 @@ def _zip_read_bytes(zf: zipfile.ZipFile, name: str) -> bytes:
         return handle.read()
 
 
-def _find_opf_path(zf: zipfile.ZipFile) -> str:
+def _find_opf_path(epub: EpubContainer) -> str:
     # Per spec: META-INF/container.xml -> rootfiles/rootfile@full-path
     try:
-        container = _zip_read_text(zf, "META-INF/container.xml")
+        container = _zip_read_text(epub.zf, "META-INF/container.xml")
         root = ET.fromstring(container)
         ns = {"c": "urn:oasis:names:tc:opendocument:xmlns:container"}
         for rf in root.findall(".//c:rootfile", ns):
@@ -1304,16 +1586,90 @@ def _find_opf_path(zf: zipfile.ZipFile) -> str:
     except Exception:
         pass
     # Fallback: first *.opf found
-    for n in zf.namelist():
+    for n in epub.names:
         if n.lower().endswith(".opf"):
             return n
     raise FileNotFoundError("OPF file not found in EPUB")
 
 
-def _spine_items(zf: zipfile.ZipFile) -> list[str]:
-    opf_path = _find_opf_path(zf)
-    opf_xml = _zip_read_text(zf, opf_path)
-    root = ET.fromstring(opf_xml)
+class EpubContainer:
+    """
+    An open EPUB whose package document is read once.
+
+    The OPF is located and parsed on first use; the spine, nav points,
+    title, author and cover all come from that one tree and are cached.
+    Member lookups go through a name set instead of ``namelist()``. Pass
+    the container to ``iter_epub_chapters`` and read ``cover`` from it so
+    a conversion opens and parses the book a single time.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = os.fspath(path)
+        self.zf = zipfile.ZipFile(self.path, "r")
+        self.names: tuple[str, ...] = tuple(self.zf.namelist())
+        self._name_set = frozenset(self.names)
+        self._resolved: dict[str, str | None] = {}
+        self._package: tuple[str, ET.Element] | Exception | None = None
+
+    def __enter__(self) -> EpubContainer:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.zf.close()
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._name_set
+
+    def resolve(self, name: str) -> str | None:
+        """Return ``name`` if it is a member, else the first member ending with it."""
+        if name in self._name_set:
+            return name
+        if name not in self._resolved:
+            self._resolved[name] = next((n for n in self.names if n.endswith(name)), None)
+        return self._resolved[name]
+
+    def package(self) -> tuple[str, ET.Element]:
+        """The OPF path and parsed root; re-raises the first failure to read it."""
+        if self._package is None:
+            try:
+                opf_path = _find_opf_path(self)
+                self._package = (opf_path, ET.fromstring(_zip_read_text(self.zf, opf_path)))
+            except Exception as exc:
+                self._package = exc
+        if isinstance(self._package, Exception):
+            raise self._package
+        return self._package
+
+    @cached_property
+    def html_names(self) -> list[str]:
+        return [name for name in self.names if name.lower().endswith(HTML_EXTS)]
+
+    @cached_property
+    def spine(self) -> list[str]:
+        return _spine_items(self)
+
+    @cached_property
+    def nav_points(self) -> list[_NavPoint]:
+        return _toc_nav_points(self, self.spine)
+
+    @cached_property
+    def title(self) -> str | None:
+        return _get_book_title(self)
+
+    @cached_property
+    def author(self) -> str | None:
+        return _get_book_author(self)
+
+    @cached_property
+    def cover(self) -> CoverImage | None:
+        return _extract_cover_image(self)
+
+
+def _spine_items(epub: EpubContainer) -> list[str]:
+    opf_path, root = epub.package()
     # Resolve namespaces loosely
     nsmap = {"opf": root.tag.split("}")[0].strip("{")}
     # manifest id -> href
@@ -1337,7 +1693,7 @@ def _spine_items(zf: zipfile.ZipFile) -> list[str]:
         fixed.append(str(PurePosixPath(p).as_posix()))
     # If spine is empty, fall back to all HTML files in zip order
     if not fixed:
-        fixed = [n for n in zf.namelist() if n.lower().endswith(HTML_EXTS)]
+        fixed = list(epub.html_names)
     return fixed
 
 
@@ -1429,11 +1785,9 @@ def _parse_ncx_document(xml_text: str) -> list[tuple[str, str]]:
     return entries
 
 
-def _toc_nav_points(zf: zipfile.ZipFile, spine: list[str]) -> list[_NavPoint]:
+def _toc_nav_points(epub: EpubContainer, spine: list[str]) -> list[_NavPoint]:
     try:
-        opf_path = _find_opf_path(zf)
-        opf_xml = _zip_read_text(zf, opf_path)
-        root = ET.fromstring(opf_xml)
+        opf_path, root = epub.package()
     except Exception:
         return []
     ns = {"opf": root.tag.split("}")[0].strip("{")}
@@ -1463,7 +1817,7 @@ def _toc_nav_points(zf: zipfile.ZipFile, spine: list[str]) -> list[_NavPoint]:
     entries: list[tuple[str, str]] = []
     for nav_path in nav_candidates:
         try:
-            html = _zip_read_text(zf, nav_path)
+            html = _zip_read_text(epub.zf, nav_path)
         except KeyError:
             continue
         entries = _parse_nav_document(html)
@@ -1477,7 +1831,7 @@ def _toc_nav_points(zf: zipfile.ZipFile, spine: list[str]) -> list[_NavPoint]:
     if not entries:
         for ncx_path in ncx_candidates:
             try:
-                xml_text = _zip_read_text(zf, ncx_path)
+                xml_text = _zip_read_text(epub.zf, ncx_path)
             except KeyError:
                 continue
             entries = _parse_ncx_document(xml_text)
@@ -1514,24 +1868,17 @@ def _toc_nav_points(zf: zipfile.ZipFile, spine: list[str]) -> list[_NavPoint]:
     return nav_points
 
 
-def _insert_nav_markers(soup: BeautifulSoup, entries: list[_NavPoint]) -> None:
-    if not entries:
-        return
-    for entry in entries:
-        marker_text = f"\n{CHAPTER_MARKER_PREFIX}{entry.order}{CHAPTER_MARKER_SUFFIX}\n"
-        marker = NavigableString(marker_text)
-        target = None
-        if entry.fragment:
-            target = soup.find(id=entry.fragment)
-            if target is None:
-                target = soup.find(attrs={"name": entry.fragment})
-        if target is None:
-            body = soup.find("body")
-            if body and body.contents:
-                target = body.contents[0]
-            else:
-                target = soup
-        target.insert_before(marker)
+def _split_text_at_nav_offsets(
+    text: str, nav_offsets: list[tuple[int, int]]
+) -> tuple[str, list[tuple[int, str, int, int]]]:
+    """Offset-based counterpart of _split_text_by_markers for the original view."""
+    if not nav_offsets:
+        return text, []
+    segments: list[tuple[int, str, int, int]] = []
+    for index, (order, start) in enumerate(nav_offsets):
+        end = nav_offsets[index + 1][1] if index + 1 < len(nav_offsets) else len(text)
+        segments.append((order, text[start:end], start, end))
+    return text[: nav_offsets[0][1]], segments
 
 
 def _split_text_by_markers(text: str) -> tuple[str, list[tuple[int, str, int, int]]]:
@@ -1619,33 +1966,6 @@ def _trim_text_and_tokens(
     return trimmed, adjusted
 
 
-def _trim_transformed_text_and_tokens(
-    text: str,
-    tokens: list[ChapterToken] | None,
-) -> tuple[str, list[ChapterToken] | None]:
-    if not text:
-        return "", tokens
-    left = 0
-    right = len(text)
-    while left < right and text[left] in "\r\n":
-        left += 1
-    while right > left and text[right - 1] in "\r\n":
-        right -= 1
-    if left == 0 and right == len(text):
-        return text, tokens
-    trimmed = text[left:right]
-    if not tokens:
-        return trimmed, tokens
-    for token in tokens:
-        start = token.transformed_start if token.transformed_start is not None else 0
-        end = token.transformed_end if token.transformed_end is not None else start
-        start = max(left, min(start, right))
-        end = max(start, min(end, right))
-        token.transformed_start = max(0, start - left)
-        token.transformed_end = max(token.transformed_start, end - left)
-    return trimmed, tokens
-
-
 def _combine_text_fragments(fragments: list[_TextFragment]) -> tuple[str, list[PitchToken], list[_RubySpan]]:
     if not fragments:
         return "", [], []
@@ -1720,7 +2040,7 @@ def _line_looks_like_title_or_author(line: str) -> bool:
         if ch in allowed_punct:
             continue
         code = ord(ch)
-        if _is_cjk_char(ch):
+        if is_cjk_char(ch):
             continue
         if 0x3040 <= code <= 0x30FF:
             continue
@@ -1764,11 +2084,21 @@ def _finalize_segment_text(
     context_rules: Mapping[str, _ContextRule] | None = None,
     *,
     transform: str = "partial",
+    unique_matcher: _MappingMatcher | None = None,
+    common_matcher: _MappingMatcher | None = None,
+    timings: dict[str, float] | None = None,
 ) -> tuple[
     str,
     list[PitchToken] | None,
     list[ChapterToken] | None,
 ]:
+    """
+    Tokenize, render and pitch-annotate one chapter.
+
+    When ``timings`` is given, seconds spent in the ``tokenize`` (MeCab),
+    ``tokens`` (ruby and mapping tokens), ``pitch`` (surface reading and
+    accent lookups) and ``render`` stages are added to it.
+    """
     del preset_tokens  # legacy parameter
     token_basis = original_text if original_text is not None else raw_text
     if not token_basis:
@@ -1777,7 +2107,7 @@ def _finalize_segment_text(
     if normalized_transform not in {"partial", "full"}:
         raise ValueError("transform must be 'partial' or 'full'")
     if backend is None:
-        normalized = _normalize_ellipsis(_normalize_katakana(_hiragana_to_katakana(token_basis)))
+        normalized = _normalize_ellipsis(normalize_katakana(hiragana_to_katakana(token_basis)))
         return normalized, None, None
     tokens = _build_chapter_tokens_from_original(
         token_basis,
@@ -1788,30 +2118,210 @@ def _finalize_segment_text(
         unique_sources or {},
         common_sources or {},
         context_rules or {},
+        unique_matcher=unique_matcher,
+        common_matcher=common_matcher,
+        timings=timings,
     )
-    render_tokens = [replace(token) for token in tokens]
+    render_started = time.perf_counter()
     preserve_surface = normalized_transform == "partial"
+    # The freshly built tokens are not used past rendering; render them in place.
     rendered_text, finalized_tokens = _render_text_from_tokens(
         token_basis,
-        render_tokens,
+        tokens,
         preserve_unambiguous=preserve_surface,
     )
-    rendered_text, finalized_tokens = _trim_transformed_text_and_tokens(rendered_text, finalized_tokens)
-    rendered_text, finalized_tokens = _ensure_title_author_break_with_tokens(rendered_text, finalized_tokens)
-    rendered_text, finalized_tokens = _ensure_paragraph_spacing_with_tokens(rendered_text, finalized_tokens)
-    rendered_text = _normalize_ellipsis(rendered_text)
+    rendered_text, finalized_tokens = _finalize_rendered_text(rendered_text, finalized_tokens)
     pitch_tokens = tokens_to_pitch_tokens(finalized_tokens or [])
+    _add_stage_time(timings, "render", time.perf_counter() - render_started)
     return rendered_text, pitch_tokens, finalized_tokens
 
 
-def _extract_cover_image(zf: zipfile.ZipFile) -> CoverImage | None:
-    try:
-        opf_path = _find_opf_path(zf)
-    except FileNotFoundError:
+@dataclass(frozen=True)
+class _ChapterFinalizer:
+    """Read-only book mapping state needed to finalize any chapter."""
+
+    unique_mapping: dict[str, str]
+    common_mapping: dict[str, str]
+    unique_sources: dict[str, str]
+    common_sources: dict[str, str]
+    context_rules: dict[str, _ContextRule]
+    transform: str
+    unique_matcher: _MappingMatcher | None = None
+    common_matcher: _MappingMatcher | None = None
+
+    def finalize(
+        self,
+        backend: "NLPBackend" | None,
+        raw_text: str,
+        original_text: str,
+        ruby_spans: list[_RubySpan],
+        timings: dict[str, float] | None = None,
+    ) -> tuple[str, list[PitchToken] | None, list[ChapterToken] | None]:
+        return _finalize_segment_text(
+            raw_text,
+            backend,
+            original_text=original_text,
+            ruby_spans=ruby_spans,
+            unique_mapping=self.unique_mapping,
+            common_mapping=self.common_mapping,
+            unique_sources=self.unique_sources,
+            common_sources=self.common_sources,
+            context_rules=self.context_rules,
+            transform=self.transform,
+            unique_matcher=self.unique_matcher,
+            common_matcher=self.common_matcher,
+            timings=timings,
+        )
+
+
+def _add_stage_time(timings: dict[str, float] | None, stage: str, seconds: float) -> None:
+    if timings is not None:
+        timings[stage] = timings.get(stage, 0.0) + seconds
+
+
+def event_stage_seconds(event: Mapping[str, object]) -> dict[str, float]:
+    """
+    Stage -> seconds carried by an :func:`iter_epub_chapters` progress event.
+
+    Reads both ``stage_timing`` events and the ``timings`` attached to
+    chapter events; other events yield an empty dict.
+    """
+    if event.get("event") == "stage_timing":
+        stage = event.get("stage")
+        seconds = event.get("seconds")
+        if isinstance(stage, str) and isinstance(seconds, (int, float)):
+            return {stage: float(seconds)}
+        return {}
+    timings = event.get("timings")
+    if not isinstance(timings, Mapping):
+        return {}
+    return {
+        str(stage): float(seconds)
+        for stage, seconds in timings.items()
+        if isinstance(seconds, (int, float))
+    }
+
+
+def _resolve_jobs(jobs: int | None) -> int:
+    """Worker count for a ``jobs`` setting: None means 1, <= 0 means all CPUs."""
+    if jobs is None:
+        return 1
+    if jobs <= 0:
+        if hasattr(os, "sched_getaffinity"):
+            return len(os.sched_getaffinity(0)) or 1
+        return os.cpu_count() or 1
+    return jobs
+
+
+def _process_pool(
+    workers: int,
+    initializer: Callable[..., None] | None = None,
+    *initargs: object,
+) -> ProcessPoolExecutor:
+    # Spawned workers avoid forking a parent that may already run threads
+    # (web uploads, MeCab); each worker builds its own NLPBackend.
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=initializer,
+        initargs=initargs,
+    )
+
+
+_WORKER_FINALIZER: _ChapterFinalizer | None = None
+_WORKER_BACKEND: "NLPBackend" | None = None
+
+
+def _init_chapter_worker(finalizer: _ChapterFinalizer) -> None:
+    global _WORKER_FINALIZER, _WORKER_BACKEND
+    from .nlp import NLPBackend
+
+    _WORKER_FINALIZER = finalizer
+    # Each worker tags in-process; routing --jobs workers through nk nlpd
+    # would cap them at the service's tagger pool.
+    _WORKER_BACKEND = NLPBackend()
+
+
+def _finalize_chapter_in_worker(
+    raw_text: str,
+    original_text: str,
+    ruby_spans: list[_RubySpan],
+) -> tuple[tuple[str, list[PitchToken] | None, list[ChapterToken] | None], dict[str, float]]:
+    assert _WORKER_FINALIZER is not None
+    timings: dict[str, float] = {}
+    result = _WORKER_FINALIZER.finalize(
+        _WORKER_BACKEND, raw_text, original_text, ruby_spans, timings
+    )
+    return result, timings
+
+
+def _chapter_processing_basis(pending: _PendingChapter, *, first: bool) -> str:
+    basis = pending.raw_original if pending.raw_original is not None else pending.raw_text
+    if first:
+        basis = _ensure_title_author_break(basis)
+    return _ensure_paragraph_spacing_plain(basis)
+
+
+_CHAPTER_FINGERPRINT_FORMAT = 1
+
+
+def _book_fingerprint_key(backend: "NLPBackend" | None, finalizer: _ChapterFinalizer) -> str | None:
+    """
+    Digest of the book-wide inputs to every chapter: the book mapping, the
+    transform mode, the dictionary and the nk version. Backends without a
+    ``dictionary_id`` get no key, so their chapters are never carried over.
+    """
+    dictionary_id = getattr(backend, "dictionary_id", None)
+    if not isinstance(dictionary_id, str) or not dictionary_id:
         return None
+    mapping_payload = [
+        sorted(finalizer.unique_mapping.items()),
+        sorted(finalizer.common_mapping.items()),
+        sorted(finalizer.unique_sources.items()),
+        sorted(finalizer.common_sources.items()),
+        sorted(
+            [base, list(rule.prefixes), rule.max_prefix]
+            for base, rule in finalizer.context_rules.items()
+        ),
+    ]
+    digest = hashlib.sha256()
+    for part in (
+        str(_CHAPTER_FINGERPRINT_FORMAT),
+        json.dumps(mapping_payload, ensure_ascii=False),
+        finalizer.transform,
+        dictionary_id,
+        _nk_version(),
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _chapter_fingerprint(
+    book_key: str,
+    pending: _PendingChapter,
+    member_digests: Mapping[str, str],
+    basis: str,
+) -> str:
+    # The extracted text is hashed along with the members because title-line
+    # dedup and nav splitting can move text between chapters.
+    digest = hashlib.sha256()
+    for part in (
+        book_key,
+        *(f"{name}:{member_digests.get(name, '')}" for name in pending.members),
+        pending.source,
+        pending.title_hint or "",
+        pending.raw_text,
+        basis,
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _extract_cover_image(epub: EpubContainer) -> CoverImage | None:
     try:
-        opf_xml = _zip_read_text(zf, opf_path)
-        root = ET.fromstring(opf_xml)
+        opf_path, root = epub.package()
     except Exception:
         return None
 
@@ -1879,10 +2389,10 @@ def _extract_cover_image(zf: zipfile.ZipFile) -> CoverImage | None:
         if resolved in seen:
             continue
         seen.add(resolved)
-        if resolved not in zf.namelist():
+        if resolved not in epub:
             continue
         try:
-            data = _zip_read_bytes(zf, resolved)
+            data = _zip_read_bytes(epub.zf, resolved)
         except KeyError:
             continue
         return CoverImage(
@@ -1896,9 +2406,12 @@ def _extract_cover_image(zf: zipfile.ZipFile) -> CoverImage | None:
 def get_epub_cover(inp_epub: str) -> CoverImage | None:
     """
     Extract the declared cover image from an EPUB, if present.
+
+    Callers that also convert the book should read ``EpubContainer.cover``
+    from the container they pass to ``iter_epub_chapters`` instead.
     """
-    with zipfile.ZipFile(inp_epub, "r") as zf:
-        return _extract_cover_image(zf)
+    with EpubContainer(inp_epub) as epub:
+        return epub.cover
 
 
 def _normalize_ws(s: str) -> str:
@@ -1969,7 +2482,7 @@ _SINGLE_NEWLINE_PATTERN = re.compile(r"(?<=\S)\n(?=\S)")
 def _token_should_preserve_surface(token: ChapterToken) -> bool:
     if not token.surface:
         return False
-    if not _contains_cjk(token.surface):
+    if not contains_cjk(token.surface):
         return False
     if getattr(token, "block_surface_preservation", False):
         return False
@@ -1979,15 +2492,6 @@ def _token_should_preserve_surface(token: ChapterToken) -> bool:
     return token.reading_validated
 
 
-def _contains_cjk(s: str) -> bool:
-    # Heuristic: any Han or iteration mark suggests kanji content
-    for ch in s:
-        code = ord(ch)
-        if (0x4E00 <= code <= 0x9FFF) or ch in "々〆ヵヶ":
-            return True
-    return False
-
-
 def _looks_like_ascii_word(text: str) -> bool:
     stripped = text.strip()
     if not stripped:
@@ -2009,17 +2513,21 @@ def _is_single_kanji_base(text: str) -> bool:
     stripped = text.strip()
     if not stripped:
         return False
-    cjk_chars = [ch for ch in stripped if _is_cjk_char(ch)]
+    cjk_chars = [ch for ch in stripped if is_cjk_char(ch)]
     return len(cjk_chars) == 1 and len(stripped) == len(cjk_chars)
 
 
-def _soup_from_html(html: str) -> BeautifulSoup:
+def _looks_like_xhtml(html: str) -> bool:
     stripped = html.lstrip()
     lower_head = stripped[:200].lower()
-    xmlish = stripped.startswith("<?xml") or (
+    return stripped.startswith("<?xml") or (
         "<html" in lower_head and "xmlns" in lower_head
     )
 
+
+def _soup_from_html(html: str) -> BeautifulSoup:
+    xmlish = _looks_like_xhtml(html)
+
     if xmlish:
         for parser in ("lxml-xml", "xml"):
             try:
@@ -2072,46 +2580,32 @@ def _ruby_reading_text(ruby: Tag) -> str:
     return "".join(ruby.stripped_strings)
 
 
-def _is_hiragana_or_katakana(ch: str) -> bool:
-    if not ch:
-        return False
-    code = ord(ch)
-    return (
-        0x3041 <= code <= 0x309F  # Hiragana
-        or 0x30A1 <= code <= 0x30FF  # Katakana
-        or ch in "ー"
-    )
-
-
-def _is_kana_string(text: str) -> bool:
-    for ch in text:
-        if ch.isspace():
-            continue
-        if _is_hiragana_or_katakana(ch) or ch in {"・"}:
-            continue
-        return False
-    return True
-
-
 def _collect_kana_suffix(ruby: Tag) -> str:
     """
     Capture contiguous kana characters immediately following a <ruby>.
     Used to provide additional context (okurigana) when validating readings.
     """
+
+    def _following_texts() -> Iterator[str]:
+        node = ruby.next_sibling
+        while node is not None:
+            if isinstance(node, NavigableString):
+                yield str(node)
+            elif isinstance(node, Tag):
+                if node.name == "ruby":
+                    return
+                if node.name not in ("rt", "rp"):
+                    yield "".join(node.stripped_strings)
+            else:
+                return
+            node = node.next_sibling
+
+    return _leading_kana(_following_texts())
+
+
+def _leading_kana(texts: Iterator[str]) -> str:
     suffix_chars: list[str] = []
-    node = ruby.next_sibling
-    while node is not None:
-        if isinstance(node, NavigableString):
-            text = str(node)
-        elif isinstance(node, Tag):
-            if node.name in ("rt", "rp"):
-                node = node.next_sibling
-                continue
-            if node.name == "ruby":
-                break
-            text = "".join(node.stripped_strings)
-        else:
-            break
+    for text in texts:
         idx = 0
         while idx < len(text):
             ch = text[idx]
@@ -2120,25 +2614,16 @@ def _collect_kana_suffix(ruby: Tag) -> str:
                     return "".join(suffix_chars)
                 idx += 1
                 continue
-            if _is_hiragana_or_katakana(ch):
+            if is_kana_char(ch):
                 suffix_chars.append(ch)
                 idx += 1
                 continue
             return "".join(suffix_chars)
-        node = node.next_sibling
     return "".join(suffix_chars)
 
 
-def _load_corpus_reading_accumulators() -> dict[str, _ReadingAccumulator]:
-    global _CORPUS_READING_CACHE
-    if _CORPUS_READING_CACHE is not None:
-        return _CORPUS_READING_CACHE
+def _corpus_accumulators_from_entries(data: list[dict[str, object]]) -> dict[str, _ReadingAccumulator]:
     cache: dict[str, _ReadingAccumulator] = {}
-    try:
-        data_path = resources.files("nk.data").joinpath("nhk_easy_readings.json")
-        data = json.loads(data_path.read_text("utf-8"))
-    except (FileNotFoundError, ModuleNotFoundError, OSError, json.JSONDecodeError):
-        data = []
     for entry in data:
         base_raw = entry.get("base", "")
         reading_raw = entry.get("reading", "")
@@ -2151,11 +2636,11 @@ def _load_corpus_reading_accumulators() -> dict[str, _ReadingAccumulator]:
         if not base_raw or not reading_raw or count <= 0:
             continue
         base_norm = unicodedata.normalize("NFKC", base_raw)
-        reading_norm = _normalize_katakana(_hiragana_to_katakana(reading_raw))
+        reading_norm = normalize_katakana(hiragana_to_katakana(reading_raw))
         if not reading_norm:
             continue
-        suffix_norm = _normalize_katakana(_hiragana_to_katakana(suffix_raw or ""))
-        has_hira = any(0x3040 <= ord(ch) <= 0x309F for ch in reading_raw)
+        suffix_norm = normalize_katakana(hiragana_to_katakana(suffix_raw or ""))
+        has_hira = contains_hiragana(reading_raw)
         flags = _ReadingFlags(
             has_hiragana=has_hira,
             has_latin=any("LATIN" in unicodedata.name(ch, "") for ch in reading_raw),
@@ -2181,7 +2666,7 @@ def _load_corpus_reading_accumulators() -> dict[str, _ReadingAccumulator]:
                     suffix_count_int = 0
                 if suffix_count_int <= 0:
                     continue
-                normalized_suffix = _normalize_katakana(_hiragana_to_katakana(suffix_value))
+                normalized_suffix = normalize_katakana(hiragana_to_katakana(suffix_value))
                 accumulator.suffix_counts[normalized_suffix] += suffix_count_int
                 if (
                     normalized_suffix
@@ -2219,89 +2704,395 @@ def _load_corpus_reading_accumulators() -> dict[str, _ReadingAccumulator]:
                     accumulator.prefix_samples.append(prefix_norm)
         accumulator.single_kanji_only = _is_single_kanji_base(base_norm)
         cache[base_norm] = accumulator
-    _CORPUS_READING_CACHE = cache
     return cache
 
 
-def _collect_reading_counts_from_soup(soup: BeautifulSoup) -> dict[str, _ReadingAccumulator]:
-    accumulators: dict[str, _ReadingAccumulator] = defaultdict(_ReadingAccumulator)
-    def _previous_significant_sibling(tag: Tag):
-        prev = tag.previous_sibling
-        while isinstance(prev, NavigableString) and not prev.strip():
-            prev = prev.previous_sibling
-        return prev
-
-    def _next_significant_sibling(tag: Tag):
-        nxt = tag.next_sibling
-        while isinstance(nxt, NavigableString) and not nxt.strip():
-            nxt = nxt.next_sibling
-        return nxt
-
-    for ruby in soup.find_all("ruby"):
-        base_raw = _normalize_ws(_ruby_base_text(ruby))
-        if not base_raw:
-            continue
-        base_norm = unicodedata.normalize("NFKC", base_raw)
-        if not (_contains_cjk(base_norm) or _looks_like_ascii_word(base_norm)):
-            continue
-        reading_raw = _ruby_reading_text(ruby)
-        reading_norm = _normalize_ws(reading_raw)
-        reading_norm = unicodedata.normalize("NFKC", reading_norm)
-        reading_norm = _hiragana_to_katakana(reading_norm)
-        reading_norm = _normalize_katakana(reading_norm)
-        if not reading_norm or not _is_kana_string(reading_norm):
-            continue
-        has_hira = any(0x3040 <= ord(ch) <= 0x309F for ch in reading_raw)
-        suffix = _collect_kana_suffix(ruby)
-        accumulator = accumulators[base_norm]
-        accumulator.register(base_norm, reading_norm, reading_raw, has_hira, suffix, "")
+# Binary corpus index (``nhk_easy_readings.idx``), little-endian:
+#   header   magic, format version, record/pair counts, size and sha256 of
+#            the JSON it was built from, and the offsets of each section
+#   records  one fixed-width record per base, in corpus order
+#   order    record numbers sorted by UTF-8 base, for binary search
+#   pairs    (string, count) entries referenced by the records' suffix and
+#            prefix count/sample lists (samples carry a zero count)
+#   strings  UTF-8 string table, deduplicated
+_CORPUS_INDEX_MAGIC = b"NKRI"
+_CORPUS_INDEX_VERSION = 1
+_CORPUS_INDEX_HEADER = struct.Struct("<4sHHIIQ32sIIIII")
+_CORPUS_INDEX_RECORD = struct.Struct("<IIIIII8I")
+_CORPUS_INDEX_PAIR = struct.Struct("<III")
+_CORPUS_INDEX_ORDER = struct.Struct("<I")
+_FLAG_HIRAGANA = 1
+_FLAG_LATIN = 2
+_FLAG_MIDDLE_DOT = 4
+_FLAG_LONG_MARK = 8
+_FLAG_SINGLE_KANJI = 16
+_FLAG_SINGLE_KANJI_UNSET = 32
+
+
+def _write_corpus_reading_index(
+    accumulators: Mapping[str, _ReadingAccumulator],
+    path: Path,
+    *,
+    source: bytes,
+) -> None:
+    """Write ``accumulators`` (one reading per base) as a binary corpus index."""
+    strings = bytearray()
+    string_refs: dict[str, tuple[int, int]] = {}
+
+    def _string(value: str) -> tuple[int, int]:
+        ref = string_refs.get(value)
+        if ref is None:
+            encoded = value.encode("utf-8")
+            ref = (len(strings), len(encoded))
+            strings.extend(encoded)
+            string_refs[value] = ref
+        return ref
+
+    pairs: list[tuple[int, int, int]] = []
+
+    def _pairs(items: Iterable[tuple[str, int]]) -> tuple[int, int]:
+        first = len(pairs)
+        for value, count in items:
+            pairs.append((*_string(value), count))
+        return first, len(pairs) - first
+
+    records: list[bytes] = []
+    bases: list[bytes] = []
+    for base, accumulator in accumulators.items():
+        if len(accumulator.counts) != 1:
+            raise ValueError(f"Corpus entry {base!r} must have exactly one reading.")
+        ((reading, count),) = accumulator.counts.items()
+        if count != accumulator.total:
+            raise ValueError(f"Corpus entry {base!r} has inconsistent totals.")
+        flags = accumulator.flags.get(reading, _ReadingFlags())
+        bits = (
+            (_FLAG_HIRAGANA if flags.has_hiragana else 0)
+            | (_FLAG_LATIN if flags.has_latin else 0)
+            | (_FLAG_MIDDLE_DOT if flags.has_middle_dot else 0)
+            | (_FLAG_LONG_MARK if flags.has_long_mark else 0)
+            | (_FLAG_SINGLE_KANJI if accumulator.single_kanji_only else 0)
+            | (_FLAG_SINGLE_KANJI_UNSET if accumulator.single_kanji_only is None else 0)
+        )
+        records.append(
+            _CORPUS_INDEX_RECORD.pack(
+                *_string(base),
+                *_string(reading),
+                accumulator.total,
+                bits,
+                *_pairs(accumulator.suffix_counts.items()),
+                *_pairs((value, 0) for value in accumulator.suffix_samples),
+                *_pairs(accumulator.prefix_counts.items()),
+                *_pairs((value, 0) for value in accumulator.prefix_samples),
+            )
+        )
+        bases.append(base.encode("utf-8"))
+    order = sorted(range(len(bases)), key=bases.__getitem__)
+    records_off = _CORPUS_INDEX_HEADER.size
+    order_off = records_off + len(records) * _CORPUS_INDEX_RECORD.size
+    pairs_off = order_off + len(order) * _CORPUS_INDEX_ORDER.size
+    strings_off = pairs_off + len(pairs) * _CORPUS_INDEX_PAIR.size
+    header = _CORPUS_INDEX_HEADER.pack(
+        _CORPUS_INDEX_MAGIC,
+        _CORPUS_INDEX_VERSION,
+        0,
+        len(records),
+        len(pairs),
+        len(source),
+        hashlib.sha256(source).digest(),
+        records_off,
+        order_off,
+        pairs_off,
+        strings_off,
+        len(strings),
+    )
+    with open(path, "wb") as fh:
+        fh.write(header)
+        fh.writelines(records)
+        fh.writelines(_CORPUS_INDEX_ORDER.pack(index) for index in order)
+        fh.writelines(_CORPUS_INDEX_PAIR.pack(*pair) for pair in pairs)
+        fh.write(strings)
 
-        if not _is_single_kanji_base(base_norm):
-            continue
 
-        prev = _previous_significant_sibling(ruby)
-        if isinstance(prev, Tag) and prev.name == "ruby":
-            prev_base = _normalize_ws(_ruby_base_text(prev))
-            prev_base_norm = unicodedata.normalize("NFKC", prev_base)
-            if prev_base and _is_single_kanji_base(prev_base_norm):
-                continue
+class _CorpusReadingIndex(Mapping[str, _ReadingAccumulator]):
+    """
+    Read-only view over a binary corpus index.
 
-        group: list[Tag] = [ruby]
-        next_tag = _next_significant_sibling(ruby)
-        while isinstance(next_tag, Tag) and next_tag.name == "ruby":
-            next_base_raw = _normalize_ws(_ruby_base_text(next_tag))
-            if not next_base_raw:
-                break
-            next_base_norm = unicodedata.normalize("NFKC", next_base_raw)
-            if not _is_single_kanji_base(next_base_norm):
-                break
-            group.append(next_tag)
-            next_tag = _next_significant_sibling(next_tag)
+    Bases are found by binary search over the sorted order section and their
+    accumulators are only built the first time they are looked up.
+    """
+
+    def __init__(self, buffer: bytes | mmap.mmap) -> None:
+        (
+            magic,
+            version,
+            _,
+            self._count,
+            pair_count,
+            self.source_size,
+            digest,
+            self._records_off,
+            self._order_off,
+            self._pairs_off,
+            self._strings_off,
+            strings_size,
+        ) = _CORPUS_INDEX_HEADER.unpack_from(buffer, 0)
+        if magic != _CORPUS_INDEX_MAGIC or version != _CORPUS_INDEX_VERSION:
+            raise ValueError("Unsupported corpus index.")
+        if self._strings_off + strings_size > len(buffer):
+            raise ValueError("Truncated corpus index.")
+        self.source_digest = digest.hex()
+        self._buffer = buffer
+        self._materialized: dict[str, _ReadingAccumulator] = {}
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[str]:
+        for number in range(self._count):
+            yield self._base(number)
+
+    def __contains__(self, base: object) -> bool:
+        return isinstance(base, str) and self._find(base) is not None
+
+    def __getitem__(self, base: str) -> _ReadingAccumulator:
+        accumulator = self._materialized.get(base)
+        if accumulator is None:
+            number = self._find(base) if isinstance(base, str) else None
+            if number is None:
+                raise KeyError(base)
+            accumulator = self._materialize(number)
+            self._materialized[base] = accumulator
+        return accumulator
+
+    def _record(self, number: int) -> tuple[int, ...]:
+        return _CORPUS_INDEX_RECORD.unpack_from(
+            self._buffer, self._records_off + number * _CORPUS_INDEX_RECORD.size
+        )
+
+    def _bytes(self, offset: int, length: int) -> bytes:
+        start = self._strings_off + offset
+        return self._buffer[start : start + length]
+
+    def _string(self, offset: int, length: int) -> str:
+        return self._bytes(offset, length).decode("utf-8")
+
+    def _base(self, number: int) -> str:
+        return self._string(*self._record(number)[:2])
+
+    def _sorted_base(self, position: int) -> bytes:
+        (number,) = _CORPUS_INDEX_ORDER.unpack_from(
+            self._buffer, self._order_off + position * _CORPUS_INDEX_ORDER.size
+        )
+        return self._bytes(*self._record(number)[:2])
+
+    def _find(self, base: str) -> int | None:
+        key = base.encode("utf-8")
+        position = bisect_left(range(self._count), key, key=self._sorted_base)
+        if position >= self._count or self._sorted_base(position) != key:
+            return None
+        (number,) = _CORPUS_INDEX_ORDER.unpack_from(
+            self._buffer, self._order_off + position * _CORPUS_INDEX_ORDER.size
+        )
+        return number
+
+    def _pairs(self, first: int, length: int) -> Iterator[tuple[str, int]]:
+        for pair in range(first, first + length):
+            offset, size, count = _CORPUS_INDEX_PAIR.unpack_from(
+                self._buffer, self._pairs_off + pair * _CORPUS_INDEX_PAIR.size
+            )
+            yield self._string(offset, size), count
+
+    def _materialize(self, number: int) -> _ReadingAccumulator:
+        (
+            _,
+            _,
+            reading_off,
+            reading_len,
+            total,
+            bits,
+            *lists,
+        ) = self._record(number)
+        reading = self._string(reading_off, reading_len)
+        accumulator = _ReadingAccumulator()
+        accumulator.counts[reading] = total
+        accumulator.total = total
+        accumulator.flags[reading] = _ReadingFlags(
+            has_hiragana=bool(bits & _FLAG_HIRAGANA),
+            has_latin=bool(bits & _FLAG_LATIN),
+            has_middle_dot=bool(bits & _FLAG_MIDDLE_DOT),
+            has_long_mark=bool(bits & _FLAG_LONG_MARK),
+        )
+        if not bits & _FLAG_SINGLE_KANJI_UNSET:
+            accumulator.single_kanji_only = bool(bits & _FLAG_SINGLE_KANJI)
+        for value, count in self._pairs(lists[0], lists[1]):
+            accumulator.suffix_counts[value] = count
+        accumulator.suffix_samples.extend(value for value, _ in self._pairs(lists[2], lists[3]))
+        for value, count in self._pairs(lists[4], lists[5]):
+            accumulator.prefix_counts[value] = count
+        accumulator.prefix_samples.extend(value for value, _ in self._pairs(lists[6], lists[7]))
+        return accumulator
+
+
+def _open_corpus_reading_index() -> _CorpusReadingIndex | None:
+    data_dir = resources.files("nk.data")
+    resource = data_dir.joinpath(_CORPUS_READINGS_INDEX)
+    try:
+        with resource.open("rb") as fh:
+            try:
+                buffer: bytes | mmap.mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError, io.UnsupportedOperation):
+                buffer = fh.read()
+        index = _CorpusReadingIndex(buffer)
+    except (FileNotFoundError, OSError, ValueError, struct.error):
+        return None
+    # A JSON edited after the index was built takes precedence over it.
+    # Edits such as a changed count keep the size, so compare the digest.
+    source = data_dir.joinpath(_CORPUS_READINGS_JSON)
+    if isinstance(source, Path) and source.is_file():
+        if source.stat().st_size != index.source_size:
+            return None
+        if hashlib.sha256(source.read_bytes()).hexdigest() != index.source_digest:
+            return None
+    return index
+
+
+def _load_corpus_reading_accumulators() -> Mapping[str, _ReadingAccumulator]:
+    global _CORPUS_READING_CACHE, _CORPUS_READING_DIGEST
+    if _CORPUS_READING_CACHE is not None:
+        return _CORPUS_READING_CACHE
+    index = _open_corpus_reading_index()
+    if index is not None:
+        _CORPUS_READING_CACHE = index
+        _CORPUS_READING_DIGEST = index.source_digest
+        return index
+    raw = b""
+    try:
+        raw = resources.files("nk.data").joinpath(_CORPUS_READINGS_JSON).read_bytes()
+        data = json.loads(raw.decode("utf-8"))
+    except (FileNotFoundError, ModuleNotFoundError, OSError, UnicodeDecodeError, json.JSONDecodeError):
+        data = []
+    _CORPUS_READING_CACHE = _corpus_accumulators_from_entries(data)
+    _CORPUS_READING_DIGEST = hashlib.sha256(raw).hexdigest()
+    return _CORPUS_READING_CACHE
+
+
+def _corpus_readings_digest() -> str:
+    """Return the sha256 of the corpus JSON the loaded readings came from."""
+    _load_corpus_reading_accumulators()
+    return _CORPUS_READING_DIGEST or hashlib.sha256(b"").hexdigest()
+
+
+@dataclass(eq=False)
+class _RubyEvidenceNode:
+    """
+    Parser-independent view of one <ruby> for reading-evidence collection.
+
+    ``prev_ruby``/``next_ruby`` link to the nearest sibling <ruby> when only
+    whitespace separates the two.
+    """
+
+    base: str
+    reading: str
+    suffix: str
+    prev_ruby: _RubyEvidenceNode | None = None
+    next_ruby: _RubyEvidenceNode | None = None
+
+
+def _significant_sibling(tag: Tag, *, forward: bool) -> PageElement | None:
+    node = tag.next_sibling if forward else tag.previous_sibling
+    while isinstance(node, NavigableString) and not node.strip():
+        node = node.next_sibling if forward else node.previous_sibling
+    return node
+
+
+def _soup_ruby_nodes(soup: BeautifulSoup) -> list[_RubyEvidenceNode]:
+    rubies = soup.find_all("ruby")
+    nodes = [
+        _RubyEvidenceNode(
+            base=_normalize_ws(_ruby_base_text(ruby)),
+            reading=_ruby_reading_text(ruby),
+            suffix=_collect_kana_suffix(ruby),
+        )
+        for ruby in rubies
+    ]
+    by_id = {id(ruby): node for ruby, node in zip(rubies, nodes)}
+    for ruby, node in zip(rubies, nodes):
+        prev = _significant_sibling(ruby, forward=False)
+        if isinstance(prev, Tag) and prev.name == "ruby":
+            node.prev_ruby = by_id.get(id(prev))
+        nxt = _significant_sibling(ruby, forward=True)
+        if isinstance(nxt, Tag) and nxt.name == "ruby":
+            node.next_ruby = by_id.get(id(nxt))
+    return nodes
+
+
+def _collect_reading_counts_from_soup(soup: BeautifulSoup) -> dict[str, _ReadingAccumulator]:
+    return _collect_reading_counts(_soup_ruby_nodes(soup))
+
+
+def _collect_reading_counts(nodes: list[_RubyEvidenceNode]) -> dict[str, _ReadingAccumulator]:
+    accumulators: dict[str, _ReadingAccumulator] = defaultdict(_ReadingAccumulator)
+    for ruby in nodes:
+        base_raw = ruby.base
+        if not base_raw:
+            continue
+        base_norm = unicodedata.normalize("NFKC", base_raw)
+        if not (contains_cjk(base_norm) or _looks_like_ascii_word(base_norm)):
+            continue
+        reading_raw = ruby.reading
+        reading_norm = _normalize_ws(reading_raw)
+        reading_norm = unicodedata.normalize("NFKC", reading_norm)
+        reading_norm = hiragana_to_katakana(reading_norm)
+        reading_norm = normalize_katakana(reading_norm)
+        if not reading_norm or not is_kana_string(reading_norm):
+            continue
+        has_hira = contains_hiragana(reading_raw)
+        accumulator = accumulators[base_norm]
+        accumulator.register(base_norm, reading_norm, reading_raw, has_hira, ruby.suffix, "")
+
+        if not _is_single_kanji_base(base_norm):
+            continue
+
+        prev = ruby.prev_ruby
+        if prev is not None:
+            prev_base_norm = unicodedata.normalize("NFKC", prev.base)
+            if prev.base and _is_single_kanji_base(prev_base_norm):
+                continue
+
+        group: list[_RubyEvidenceNode] = [ruby]
+        next_ruby = ruby.next_ruby
+        while next_ruby is not None:
+            if not next_ruby.base:
+                break
+            next_base_norm = unicodedata.normalize("NFKC", next_ruby.base)
+            if not _is_single_kanji_base(next_base_norm):
+                break
+            group.append(next_ruby)
+            next_ruby = next_ruby.next_ruby
 
         if len(group) <= 1:
             continue
 
-        combined_base_raw = "".join(_normalize_ws(_ruby_base_text(tag)) for tag in group)
+        combined_base_raw = "".join(node.base for node in group)
         combined_base_norm = unicodedata.normalize("NFKC", combined_base_raw)
-        combined_reading_raw = "".join(_ruby_reading_text(tag) for tag in group)
+        combined_reading_raw = "".join(node.reading for node in group)
         combined_reading_norm = _normalize_ws(combined_reading_raw)
         combined_reading_norm = unicodedata.normalize("NFKC", combined_reading_norm)
-        combined_reading_norm = _hiragana_to_katakana(combined_reading_norm)
-        combined_reading_norm = _normalize_katakana(combined_reading_norm)
-        if not combined_reading_norm or not _is_kana_string(combined_reading_norm):
+        combined_reading_norm = hiragana_to_katakana(combined_reading_norm)
+        combined_reading_norm = normalize_katakana(combined_reading_norm)
+        if not combined_reading_norm or not is_kana_string(combined_reading_norm):
             continue
         combined_has_hira = any(
-            any(0x3040 <= ord(ch) <= 0x309F for ch in _ruby_reading_text(tag))
-            for tag in group
+            contains_hiragana(node.reading)
+            for node in group
         )
-        suffix = _collect_kana_suffix(group[-1])
         compound_acc = accumulators[combined_base_norm]
         compound_acc.register(
             combined_base_norm,
             combined_reading_norm,
             combined_reading_raw,
             combined_has_hira,
-            suffix,
+            group[-1].suffix,
             "",
         )
     return accumulators
@@ -2321,7 +3112,7 @@ def _is_likely_name_candidate(base: str, flags: _ReadingFlags) -> bool:
         return False
     if flags.has_latin or flags.has_middle_dot:
         return False
-    cjk_chars = [ch for ch in stripped if _is_cjk_char(ch)]
+    cjk_chars = [ch for ch in stripped if is_cjk_char(ch)]
     if len(cjk_chars) < 2 or len(cjk_chars) > 4:
         return False
     if len(cjk_chars) != len(stripped):
@@ -2334,9 +3125,9 @@ def _is_likely_name_candidate(base: str, flags: _ReadingFlags) -> bool:
 def _reading_matches(candidate: str, variants: set[str]) -> bool:
     if not variants:
         return False
-    target = _normalize_katakana(candidate)
+    target = normalize_katakana(candidate)
     for variant in variants:
-        if target == _normalize_katakana(variant):
+        if target == normalize_katakana(variant):
             return True
     return False
 
@@ -2365,21 +3156,34 @@ def _aligned_variant_for_small_kana(reading: str, variants: set[str]) -> str | N
     return None
 
 
-def _reading_variants_for_base(
-    base: str,
-    accumulator: _ReadingAccumulator,
-    nlp: "NLPBackend",
-) -> set[str]:
-    variants: set[str] = set()
-    if hasattr(nlp, "reading_variants"):
+def _reading_texts(nlp: "NLPBackend | None", texts: Sequence[str]) -> list[str | None]:
+    """
+    Convert ``texts`` with one ``to_reading_text_many`` call where available.
+
+    Backends that only offer ``to_reading_text`` are called per entry, and
+    entries the backend fails on come back as None.
+    """
+    if not texts or nlp is None:
+        return [None] * len(texts)
+    convert_many = getattr(nlp, "to_reading_text_many", None)
+    if convert_many is not None:
         try:
-            raw_variants = nlp.reading_variants(base)
+            return list(convert_many(texts))
         except Exception:
-            raw_variants = set()
-        if raw_variants:
-            variants.update(raw_variants)
-    if not hasattr(nlp, "to_reading_text"):
-        return variants
+            pass
+    convert = getattr(nlp, "to_reading_text", None)
+    if convert is None:
+        return [None] * len(texts)
+    readings: list[str | None] = []
+    for text in texts:
+        try:
+            readings.append(convert(text))
+        except Exception:
+            readings.append(None)
+    return readings
+
+
+def _suffix_contexts(accumulator: _ReadingAccumulator) -> list[str]:
     suffix_entries: list[str] = []
     if accumulator.suffix_samples:
         for suffix in accumulator.suffix_samples:
@@ -2392,15 +3196,35 @@ def _reading_variants_for_base(
         suffix_entries = [
             suffix for suffix, _ in accumulator.suffix_counts.most_common(5) if suffix
         ]
-    seen_suffixes: set[str] = set()
-    for suffix in suffix_entries:
-        if suffix in seen_suffixes:
-            continue
-        seen_suffixes.add(suffix)
-        combined = f"{base}{suffix}"
-        reading = nlp.to_reading_text(combined)
-        reading_norm = _normalize_katakana(_hiragana_to_katakana(reading))
-        suffix_norm = _normalize_katakana(_hiragana_to_katakana(suffix))
+    return suffix_entries
+
+
+def _reading_variants_for_base(
+    base: str,
+    accumulator: _ReadingAccumulator,
+    nlp: "NLPBackend",
+    readings: Mapping[str, str | None],
+) -> set[str]:
+    """
+    Collect the backend readings of ``base`` alone and before its suffixes.
+
+    ``readings`` holds the converted ``base + suffix`` strings, prepared in
+    one batch by :func:`_select_reading_mapping`.
+    """
+    variants: set[str] = set()
+    if hasattr(nlp, "reading_variants"):
+        try:
+            raw_variants = nlp.reading_variants(base)
+        except Exception:
+            raw_variants = set()
+        if raw_variants:
+            variants.update(raw_variants)
+    for suffix in _suffix_contexts(accumulator):
+        reading = readings.get(f"{base}{suffix}")
+        if not reading:
+            continue
+        reading_norm = normalize_katakana(hiragana_to_katakana(reading))
+        suffix_norm = normalize_katakana(hiragana_to_katakana(suffix))
         if suffix_norm and reading_norm.endswith(suffix_norm):
             reading_norm = reading_norm[: -len(suffix_norm)]
         reading_norm = reading_norm.strip()
@@ -2424,6 +3248,7 @@ def _select_reading_mapping(
         if rule:
             context_rules[base] = rule
 
+    candidates: list[tuple[str, _ReadingAccumulator, str, int, float, _ReadingFlags]] = []
     for base, accumulator in accumulators.items():
         if not accumulator.counts:
             continue
@@ -2445,8 +3270,21 @@ def _select_reading_mapping(
             continue
         if alt_share >= 0.3:
             continue
+        candidates.append((base, accumulator, top_reading, total, share, flags))
+
+    # Convert every base+suffix context in one batch instead of one backend
+    # call per string.
+    contexts = list(
+        dict.fromkeys(
+            f"{base}{suffix}"
+            for base, accumulator, *_ in candidates
+            for suffix in _suffix_contexts(accumulator)
+        )
+    )
+    readings = dict(zip(contexts, _reading_texts(nlp, contexts)))
 
-        variants = _reading_variants_for_base(base, accumulator, nlp)
+    for base, accumulator, top_reading, total, share, flags in candidates:
+        variants = _reading_variants_for_base(base, accumulator, nlp, readings)
         if _reading_matches(top_reading, variants):
             tier3[base] = top_reading
             _maybe_register_rule(base, accumulator)
@@ -2464,12 +3302,164 @@ def _select_reading_mapping(
             tier3[base] = top_reading
             _maybe_register_rule(base, accumulator)
 
+    # Keep the decisions in corpus order, as cached mappings were written.
+    tier3 = {base: tier3[base] for base in accumulators if base in tier3}
+    context_rules = {base: context_rules[base] for base in accumulators if base in context_rules}
     return tier3, tier2, context_rules
 
 
-def _build_book_mapping(
+_CORPUS_MAPPING_FORMAT = 1
+_CORPUS_MAPPING_CACHE: dict[str, _CorpusMapping] = {}
+
+
+@dataclass(frozen=True)
+class _CorpusMapping:
+    """Reading decisions for the bundled corpus, independent of any book."""
+
+    tier3: dict[str, str]
+    context_rules: dict[str, _ContextRule]
+    evidence: list[dict[str, object]]
+
+    def to_payload(self) -> dict[str, object]:
+        return {
+            "tier3": [[base, reading] for base, reading in self.tier3.items()],
+            "context_rules": [
+                [base, list(rule.prefixes), rule.max_prefix]
+                for base, rule in self.context_rules.items()
+            ],
+            "evidence": self.evidence,
+        }
+
+    @classmethod
+    def from_payload(cls, payload: Mapping[str, object]) -> _CorpusMapping:
+        tier3 = {str(base): str(reading) for base, reading in payload["tier3"]}
+        context_rules = {
+            str(base): _ContextRule(prefixes=tuple(prefixes), max_prefix=int(max_prefix))
+            for base, prefixes, max_prefix in payload["context_rules"]
+        }
+        evidence = [dict(entry) for entry in payload["evidence"]]
+        return cls(tier3=tier3, context_rules=context_rules, evidence=evidence)
+
+
+def _nk_version() -> str:
+    try:
+        return metadata.version("nk")
+    except metadata.PackageNotFoundError:
+        return "0.0.0+unknown"
+
+
+def _nk_cache_dir() -> Path:
+    env_dir = os.environ.get("NK_CACHE_DIR")
+    if env_dir:
+        return Path(env_dir).expanduser()
+    xdg_dir = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_dir).expanduser() if xdg_dir else Path.home() / ".cache"
+    return base / "nk"
+
+
+def _corpus_mapping_key(nlp: "NLPBackend") -> str | None:
+    dictionary_id = getattr(nlp, "dictionary_id", None)
+    if not isinstance(dictionary_id, str) or not dictionary_id:
+        return None
+    digest = hashlib.sha256()
+    for part in (
+        str(_CORPUS_MAPPING_FORMAT).encode(),
+        _corpus_readings_digest().encode(),
+        dictionary_id.encode("utf-8"),
+        _nk_version().encode("utf-8"),
+    ):
+        digest.update(part)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _compute_corpus_mapping(nlp: "NLPBackend") -> _CorpusMapping:
+    accumulators = _load_corpus_reading_accumulators()
+    tier3, _, context_rules = _select_reading_mapping(accumulators, nlp)
+    evidence = _ruby_evidence_entries(accumulators, nlp)
+    return _CorpusMapping(tier3=tier3, context_rules=context_rules, evidence=evidence)
+
+
+def _corpus_reading_mapping(nlp: "NLPBackend") -> _CorpusMapping:
+    """
+    Return the corpus-only reading decisions for ``nlp``.
+
+    Decisions are cached in memory and under ``NK_CACHE_DIR`` (default
+    ``~/.cache/nk``), keyed by the corpus file hash, the backend's dictionary
+    and the nk version. Backends without a ``dictionary_id`` are never cached.
+    """
+    key = _corpus_mapping_key(nlp)
+    if key is None:
+        return _compute_corpus_mapping(nlp)
+    cached = _CORPUS_MAPPING_CACHE.get(key)
+    if cached is not None:
+        return cached
+    cache_path = _nk_cache_dir() / f"corpus-mapping-{key[:32]}.json"
+    mapping: _CorpusMapping | None = None
+    try:
+        payload = json.loads(cache_path.read_text("utf-8"))
+        if isinstance(payload, dict) and payload.get("key") == key:
+            mapping = _CorpusMapping.from_payload(payload)
+    except (OSError, ValueError, KeyError, TypeError):
+        mapping = None
+    if mapping is None:
+        mapping = _compute_corpus_mapping(nlp)
+        payload = {"key": key, **mapping.to_payload()}
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+    _CORPUS_MAPPING_CACHE[key] = mapping
+    return mapping
+
+
+_WORKER_ZIPFILE: zipfile.ZipFile | None = None
+
+
+def _member_reading_counts_in_worker(task: tuple[str, str, str]) -> dict[str, _ReadingAccumulator]:
+    global _WORKER_ZIPFILE
+    epub_path, name, parser = task
+    if _WORKER_ZIPFILE is None or _WORKER_ZIPFILE.filename != epub_path:
+        if _WORKER_ZIPFILE is not None:
+            _WORKER_ZIPFILE.close()
+        _WORKER_ZIPFILE = zipfile.ZipFile(epub_path, "r")
+    document = _EpubDocument(name, _zip_read_text(_WORKER_ZIPFILE, name), parser)
+    return dict(document.reading_counts())
+
+
+def _iter_member_reading_counts(
     zf: zipfile.ZipFile,
+    names: list[str],
+    session: _EpubSession,
+    jobs: int | None,
+) -> Iterator[dict[str, _ReadingAccumulator]]:
+    """
+    Yield per-member reading counts in ``names`` order.
+
+    With more than one job the members are parsed in worker processes; the
+    session then stays empty and the chapter pass parses members itself.
+    """
+    workers = min(_resolve_jobs(jobs), len(names))
+    if workers <= 1 or not zf.filename:
+        for name in names:
+            yield session.document(name).reading_counts()
+        return
+    epub_path = os.path.abspath(zf.filename)
+    tasks = [(epub_path, name, session.parser) for name in names]
+    with _process_pool(workers) as executor:
+        chunksize = max(1, len(tasks) // (workers * 4))
+        yield from executor.map(_member_reading_counts_in_worker, tasks, chunksize=chunksize)
+
+
+def _build_book_mapping(
+    epub: EpubContainer,
     nlp: "NLPBackend",
+    *,
+    session: _EpubSession | None = None,
+    jobs: int | None = None,
 ) -> tuple[
     dict[str, str],
     dict[str, str],
@@ -2478,174 +3468,822 @@ def _build_book_mapping(
     dict[str, _ContextRule],
     list[dict[str, object]],
 ]:
+    if session is None:
+        session = _EpubSession(epub.zf)
     accumulators: dict[str, _ReadingAccumulator] = defaultdict(_ReadingAccumulator)
     base_sources: dict[str, str] = {}
-    for name in zf.namelist():
-        if not name.lower().endswith(HTML_EXTS):
-            continue
-        html = _zip_read_text(zf, name)
-        original_plain_text = _strip_html_to_text(_soup_from_html(html))
-        soup = _soup_from_html(html)
-        partial = _collect_reading_counts_from_soup(soup)
+    names = epub.html_names
+    # Partial counts are merged in member order whether or not they were
+    # computed in parallel, so the merged evidence is deterministic.
+    for partial in _iter_member_reading_counts(epub.zf, names, session, jobs):
         for base, partial_acc in partial.items():
             accumulators[base].merge_from(partial_acc)
             base_sources.setdefault(base, "propagation")
+    # Bases the book never glosses fall back to the corpus; their decisions
+    # do not depend on the book, so they come precomputed from the corpus
+    # mapping and only the book's own bases are evaluated here.
     corpus_accumulators = _load_corpus_reading_accumulators()
-    if corpus_accumulators:
-        for base, corpus_acc in corpus_accumulators.items():
-            existing = accumulators.get(base)
-            if existing is None:
-                existing = accumulators[base]
-            if existing.total == 0:
-                existing.merge_from(corpus_acc)
-                base_sources.setdefault(base, "nhk")
+    for base, existing in accumulators.items():
+        corpus_acc = corpus_accumulators.get(base)
+        if existing.total == 0 and corpus_acc is not None:
+            existing.merge_from(corpus_acc)
     tier3, tier2, context_rules = _select_reading_mapping(accumulators, nlp)
+    evidence_entries = _ruby_evidence_entries(accumulators, nlp)
+    corpus = _corpus_reading_mapping(nlp)
+    for base, reading in corpus.tier3.items():
+        if base not in accumulators:
+            tier3[base] = reading
+            base_sources[base] = "nhk"
+    for base, rule in corpus.context_rules.items():
+        if base not in accumulators:
+            context_rules[base] = rule
+    for entry in corpus.evidence:
+        if entry["base"] not in accumulators:
+            evidence_entries.append(dict(entry))
     tier3_sources = {base: base_sources.get(base, "propagation") for base in tier3}
     tier2_sources = {base: base_sources.get(base, "propagation") for base in tier2}
-    evidence_payload = _serialize_ruby_evidence(accumulators, nlp=nlp)
+    evidence_payload = _sort_ruby_evidence(evidence_entries)
     return tier3, tier2, tier3_sources, tier2_sources, context_rules, evidence_payload
 
 
-def _serialize_ruby_evidence(
+def _ruby_evidence_entries(
     accumulators: Mapping[str, _ReadingAccumulator],
-    *,
-    nlp: "NLPBackend | None" = None,
+    nlp: "NLPBackend | None",
 ) -> list[dict[str, object]]:
+    glossed = [base for base, accumulator in accumulators.items() if accumulator.counts]
+    readings = _reading_texts(nlp, glossed)
     entries: list[dict[str, object]] = []
-    def _normalized_unidic_reading(base: str) -> str | None:
-        if not nlp:
-            return None
-        try:
-            reading = nlp.to_reading_text(base)
-        except Exception:
-            return None
-        if not isinstance(reading, str) or not reading:
-            return None
-        normalized = _normalize_katakana(_hiragana_to_katakana(reading))
-        return normalized or None
+    for base, reading in zip(glossed, readings):
+        entry = _ruby_evidence_entry(base, accumulators[base], _normalized_unidic_reading(reading))
+        if entry is not None:
+            entries.append(entry)
+    return entries
 
-    for base, accumulator in accumulators.items():
-        if not accumulator.counts:
-            continue
-        top_reading, top_count = accumulator.counts.most_common(1)[0]
-        normalized_reading = top_reading
-        unidic_reading = _normalized_unidic_reading(base)
-        if unidic_reading and _differs_only_by_small_kana(top_reading, unidic_reading):
-            normalized_reading = unidic_reading
-        suffixes: list[dict[str, object]] = []
-        for value, count in accumulator.suffix_counts.most_common(_MAX_SUFFIX_CONTEXTS):
-            suffixes.append({"value": value, "count": count})
-        prefixes: list[dict[str, object]] = []
-        for value, count in accumulator.prefix_counts.most_common(_MAX_PREFIX_CONTEXTS):
-            prefixes.append({"value": value, "count": count})
-        entry: dict[str, object] = {
-            "base": base,
-            "reading": normalized_reading,
-            "count": top_count,
-            "suffix": suffixes[0]["value"] if suffixes else "",
-            "suffixes": suffixes,
-        }
-        if prefixes:
-            entry["prefixes"] = prefixes
-        entries.append(entry)
+
+def _ruby_evidence_entry(
+    base: str,
+    accumulator: _ReadingAccumulator,
+    unidic_reading: str | None,
+) -> dict[str, object] | None:
+    if not accumulator.counts:
+        return None
+    top_reading, top_count = accumulator.counts.most_common(1)[0]
+    normalized_reading = top_reading
+    if unidic_reading and _differs_only_by_small_kana(top_reading, unidic_reading):
+        normalized_reading = unidic_reading
+    suffixes: list[dict[str, object]] = []
+    for value, count in accumulator.suffix_counts.most_common(_MAX_SUFFIX_CONTEXTS):
+        suffixes.append({"value": value, "count": count})
+    prefixes: list[dict[str, object]] = []
+    for value, count in accumulator.prefix_counts.most_common(_MAX_PREFIX_CONTEXTS):
+        prefixes.append({"value": value, "count": count})
+    entry: dict[str, object] = {
+        "base": base,
+        "reading": normalized_reading,
+        "count": top_count,
+        "suffix": suffixes[0]["value"] if suffixes else "",
+        "suffixes": suffixes,
+    }
+    if prefixes:
+        entry["prefixes"] = prefixes
+    return entry
+
+
+def _normalized_unidic_reading(reading: str | None) -> str | None:
+    if not isinstance(reading, str) or not reading:
+        return None
+    normalized = normalize_katakana(hiragana_to_katakana(reading))
+    return normalized or None
+
+
+def _sort_ruby_evidence(entries: list[dict[str, object]]) -> list[dict[str, object]]:
     entries.sort(key=lambda item: (-int(item.get("count", 0)), item.get("base", "")))
     return entries
 
 
-def _replace_outside_ruby_with_readings(
+def _serialize_ruby_evidence(
+    accumulators: Mapping[str, _ReadingAccumulator],
+    *,
+    nlp: "NLPBackend | None" = None,
+) -> list[dict[str, object]]:
+    return _sort_ruby_evidence(_ruby_evidence_entries(accumulators, nlp))
+
+
+_DROPPED_TEXT_TAGS = frozenset({"rp", "script", "style", "title"})
+_MAPPING_SKIP_PARENTS = frozenset({"script", "style", "rt", "rp"})
+_MAIN_CONTENT_STRING_TYPES = (NavigableString, CData)
+
+
+# Characters the cleanup below can act on once the text is NFKC-normalized
+# (NFKC already turns "…" into "...").
+_CLEANUP_TRIGGER_PATTERN = re.compile(r"[\n.〝〟]")
+_TRAILING_BLANKS_PATTERN = re.compile(r"[ \t]+\n")
+_BLANK_LINE_RUN_PATTERN = re.compile(r"\n{3,}")
+
+
+def _clean_extracted_segment(txt: str) -> str:
+    if not unicodedata.is_normalized("NFKC", txt):
+        txt = unicodedata.normalize("NFKC", txt)
+    if _CLEANUP_TRIGGER_PATTERN.search(txt) is None:
+        return txt
+    txt = _TRAILING_BLANKS_PATTERN.sub("\n", txt)
+    txt = txt.replace("〝", '"').replace("〟", '"')
+    txt = _normalize_ellipsis(txt)
+    return _BLANK_LINE_RUN_PATTERN.sub("\n\n", txt)
+
+
+def _clean_extracted_text(txt: str) -> str:
+    return _clean_extracted_segment(txt).strip()
+
+
+def _find_nav_fragment(soup: BeautifulSoup, fragment: str, skip_rt: bool) -> Tag | None:
+    for attrs in ({"id": fragment}, {"name": fragment}):
+        for tag in soup.find_all(attrs=attrs):
+            if skip_rt and (tag.name == "rt" or tag.find_parent("rt") is not None):
+                continue
+            return tag
+    return None
+
+
+def _nav_marker_targets(
     soup: BeautifulSoup,
-    mapping: dict[str, str],
-    source_labels: dict[str, str] | None = None,
-    context_rules: dict[str, _ContextRule] | None = None,
-) -> None:
+    entries: list[_NavPoint],
+    *,
+    skip_rt: bool,
+) -> dict[int, list[tuple[int, bool]]]:
     """
-    Replace text nodes NOT inside ruby/rt/rp/script/style using {base->reading}.
-    Longest-match-first to avoid swallowing shorter substrings.
+    Map node ids to the nav orders whose chapters start just before them.
+
+    The flag on each entry is True when it was placed by the "first child
+    of <body>" fallback, which puts it ahead of any ruby span opening at
+    that node.
     """
-    pat = _build_mapping_pattern(mapping)
-    if pat is None:
-        return
-    for node in list(soup.find_all(string=True)):
-        parent = node.parent if isinstance(node.parent, Tag) else None
-        if parent and parent.name in {"script", "style"}:
-            continue
-        if hasattr(node, "find_parent") and node.find_parent("ruby") is not None:
-            continue
-        if parent and parent.name in {"rt", "rp"}:
-            continue
-        text = unicodedata.normalize("NFKC", str(node))
-        if not text.strip():
+    targets: dict[int, list[tuple[int, bool]]] = {}
+    for entry in entries:
+        target: object | None = None
+        fallback = False
+        if entry.fragment:
+            target = _find_nav_fragment(soup, entry.fragment, skip_rt)
+        if target is None:
+            fallback = True
+            body = soup.find("body")
+            if body is not None:
+                for child in body.contents:
+                    if skip_rt and isinstance(child, Tag) and child.name == "rt":
+                        continue
+                    target = child
+                    break
+            if target is None:
+                target = soup
+        markers = targets.setdefault(id(target), [])
+        if fallback:
+            # The fallback re-resolves "first child of <body>" per entry, so
+            # each later fallback marker lands ahead of everything already
+            # placed there.
+            markers.insert(0, (entry.order, fallback))
+        else:
+            markers.append((entry.order, fallback))
+    return targets
+
+
+def _map_text_node(
+    text: str,
+    mapping_passes: list[tuple[Mapping[str, str], _MappingMatcher | None]],
+    context_rules: Mapping[str, _ContextRule] | None,
+) -> str | None:
+    """Run ``text`` through the mapping passes; None when nothing changed."""
+    replaced: str | None = None
+    for mapping, matcher in mapping_passes:
+        normalized = unicodedata.normalize("NFKC", text)
+        if matcher is None or not normalized.strip():
             continue
-        new_text = _apply_mapping_with_pattern(
-            text,
+        mapped = _apply_mapping_with_matcher(
+            normalized,
             mapping,
-            pat,
-            source_labels=source_labels,
+            matcher,
             context_rules=context_rules,
         )
-        if new_text != text:
-            node.replace_with(new_text)
+        if mapped != normalized:
+            text = mapped
+            replaced = mapped
+    return replaced
 
 
-def _collapse_ruby_to_readings(
-    soup: BeautifulSoup,
+def _chapter_marker_emitter(append: Callable[[str], None]) -> Callable[[int], None]:
+    def emit(order: int) -> None:
+        append(f"\n{CHAPTER_MARKER_PREFIX}{order}{CHAPTER_MARKER_SUFFIX}\n")
+
+    return emit
+
+
+def _emit_open_markers(
+    emit_nav: Callable[[int], None],
+    markers: list[tuple[int, bool]] | None,
+    ruby_tracker: _RubySpanTracker | None,
+    span_id: int | None,
 ) -> None:
+    """Emit the nav boundaries and the ruby span opening that precede a tag."""
+    if span_id is None:
+        for order, _ in markers or ():
+            emit_nav(order)
+        return
+    for order, fallback in markers or ():
+        if fallback:
+            emit_nav(order)
+    ruby_tracker.open_span(span_id)
+    for order, fallback in markers or ():
+        if not fallback:
+            emit_nav(order)
+
+
+def _render_soup_text(
+    soup: BeautifulSoup,
+    nav_entries: list[_NavPoint],
+    *,
+    ruby_tracker: _RubySpanTracker | None = None,
+    mapping_passes: list[tuple[Mapping[str, str], _MappingMatcher | None]] | None = None,
+    context_rules: Mapping[str, _ContextRule] | None = None,
+) -> str:
     """
-    Replace each <ruby> with its reading only (concat of direct <rt> contents).
+    Render a text view of ``soup`` without mutating it.
+
+    With ``ruby_tracker`` the view keeps ruby bases and drops <rt>, and the
+    text, ruby spans and nav boundaries go to the tracker (the return value
+    is then empty). Otherwise each <ruby> collapses to its katakana reading,
+    text outside ruby goes through ``mapping_passes`` and chapter markers for
+    ``nav_entries`` are emitted inline. Block-level line breaks match what
+    the old mutate-then-get_text pipeline produced.
     """
-    for ruby in list(soup.find_all("ruby")):
-        reading = _hiragana_to_katakana(_ruby_reading_text(ruby))
-        reading = _normalize_katakana(reading)
-        ruby.replace_with(reading)
-
-
-def _strip_html_to_text(soup: BeautifulSoup) -> str:
-    for node in list(soup.contents):
-        if isinstance(node, Doctype):
-            node.extract()
-        elif isinstance(node, NavigableString):
-            stripped = str(node).strip()
-            if stripped and stripped.upper().startswith("HTML PUBLIC"):
-                node.extract()
-    # Remove rp/script/style
-    for t in soup.find_all(["rp", "script", "style"]):
-        t.decompose()
-    for t in soup.find_all("title"):
-        t.decompose()
-    # Convert <br> to explicit newlines so they survive text extraction.
-    for br in soup.find_all("br"):
-        br.replace_with("\n")
-    # Ensure block-level elements start on a new line, but avoid double-
-    # counting nested blocks except for the small set that should always break.
-    for tag in soup.find_all(BLOCK_LEVEL_TAGS):
-        if tag.name in FORCE_BREAK_TAGS or not tag.find_parent(BLOCK_LEVEL_TAGS):
-            tag.insert_before("\n")
-    # Generate plain text without inserting extra separators between inline nodes.
-    txt = soup.get_text(separator="")
-    txt = unicodedata.normalize("NFKC", txt)
-    txt = re.sub(r"[ \t]+\n", "\n", txt)
-    txt = txt.replace("〝", '"').replace("〟", '"')
-    txt = _normalize_ellipsis(txt)
-    txt = re.sub(r"\n{3,}", "\n\n", txt).strip()
-    return txt
+    marked = ruby_tracker is not None
+    nav_targets = _nav_marker_targets(soup, nav_entries, skip_rt=marked)
+    parts: list[str] = ruby_tracker.parts if marked else []
+    append = parts.append
+    emit_nav = ruby_tracker.nav if marked else _chapter_marker_emitter(append)
+    for order, _ in nav_targets.get(id(soup), ()):
+        emit_nav(order)
+    stack: list[tuple[Iterator[PageElement], int, int | None]] = [(iter(soup.contents), 0, None)]
+    while stack:
+        children, block_depth, closing = stack[-1]
+        node = next(children, None)
+        if node is None:
+            stack.pop()
+            if closing is not None:
+                ruby_tracker.close_span(closing)
+            continue
+        markers = nav_targets.get(id(node))
+        if isinstance(node, NavigableString):
+            if markers:
+                for order, _ in markers:
+                    emit_nav(order)
+            text = str(node)
+            mapped = None
+            if mapping_passes:
+                parent = node.parent
+                parent_name = parent.name if isinstance(parent, Tag) else None
+                if parent_name not in _MAPPING_SKIP_PARENTS:
+                    mapped = _map_text_node(text, mapping_passes, context_rules)
+            if mapped is not None:
+                text = mapped
+            elif type(node) not in _MAIN_CONTENT_STRING_TYPES:
+                continue
+            if len(stack) == 1 and text.strip().upper().startswith("HTML PUBLIC"):
+                continue
+            append(text)
+            continue
+        if not isinstance(node, Tag):
+            continue
+        name = node.name
+        span_id: int | None = None
+        if marked and name == "ruby":
+            span_id = ruby_tracker.register_span(_ruby_base_text(node), _ruby_reading_text(node))
+        if markers or span_id is not None:
+            _emit_open_markers(emit_nav, markers, ruby_tracker, span_id)
+        if name in _DROPPED_TEXT_TAGS or (marked and name == "rt"):
+            continue
+        if name == "br":
+            append("\n")
+            continue
+        if name == "ruby" and not marked:
+            reading = hiragana_to_katakana(_ruby_reading_text(node))
+            append(normalize_katakana(reading))
+            continue
+        child_depth = block_depth
+        if name in BLOCK_LEVEL_TAGS:
+            if name in FORCE_BREAK_TAGS or block_depth == 0:
+                append("\n")
+            child_depth = block_depth + 1
+        stack.append((iter(node.contents), child_depth, span_id))
+    return "" if marked else "".join(parts)
+
+
+# The fast extraction engine reads lxml.etree trees directly. It mirrors the
+# string model BeautifulSoup builds on top of lxml (whitespace-only strings
+# collapsed to " " or "\n", rt/rp/script/style/template text typed as
+# non-content in HTML documents, comments and processing instructions as
+# strings) so both engines render identical text.
+
+HTML_PARSERS = ("fast", "bs4")
+DEFAULT_HTML_PARSER = "fast"
+
+_BS4_STRING_CONTAINER_TAGS = frozenset({"rt", "rp", "script", "style", "template"})
+_BS4_PRESERVE_WHITESPACE_TAGS = frozenset({"pre", "textarea"})
+_BS4_ASCII_SPACES = " \n\t\f\r"
+_HTML5LIB_AVAILABLE = importlib.util.find_spec("html5lib") is not None
+_DOCTYPE_PATTERN = re.compile(r"<!doctype", re.IGNORECASE)
+
+@dataclass(eq=False)
+class _LxmlTree:
+    root: etree._Element
+    html_mode: bool
+    doctype: str | None = None
+
+
+def _parse_lxml_tree(html: str) -> _LxmlTree | None:
+    """
+    Parse ``html`` with the lxml parser _soup_from_html would pick.
 
+    Returns None when bs4 would use a different parser (html5lib for plain
+    HTML) or lxml cannot build a tree, so callers can fall back to bs4.
+    """
+    xml_mode = _looks_like_xhtml(html)
+    if not xml_mode and _HTML5LIB_AVAILABLE:
+        return None
+    if html.startswith("\ufeff"):
+        html = html[1:]
+    try:
+        if xml_mode:
+            parser = etree.XMLParser(recover=True, strip_cdata=False, encoding="utf-8")
+        else:
+            parser = etree.HTMLParser(recover=True, encoding="utf-8")
+        root = etree.fromstring(html.encode("utf-8"), parser)
+    except (etree.LxmlError, ValueError, UnicodeError):
+        return None
+    if root is None:
+        return None
+    tree = _LxmlTree(root=root, html_mode=not xml_mode)
+    docinfo = root.getroottree().docinfo
+    # lxml's HTML parser invents a doctype when the document has none.
+    if docinfo.doctype and (xml_mode or _DOCTYPE_PATTERN.search(html)):
+        value = docinfo.root_name or ""
+        if docinfo.public_id is not None:
+            value += f' PUBLIC "{docinfo.public_id}"'
+            if docinfo.system_url is not None:
+                value += f' "{docinfo.system_url}"'
+        elif docinfo.system_url is not None:
+            value += f' SYSTEM "{docinfo.system_url}"'
+        tree.doctype = value
+    return tree
+
+
+def _lxml_name(node: etree._Element) -> str | None:
+    tag = node.tag
+    if isinstance(tag, str):
+        return tag.rpartition("}")[2]
+    return None
 
-def epub_to_chapter_texts(
-    inp_epub: str,
-    nlp: "NLPBackend" | None = None,
-    progress: Callable[[dict[str, object]], None] | None = None,
+
+def _lxml_special_string(node: etree._Element) -> str | None:
+    """The bs4 string for a comment or processing instruction node."""
+    tag = node.tag
+    if tag is etree.Comment:
+        return node.text or ""
+    if tag is etree.ProcessingInstruction:
+        return f"{node.target} {node.text or ''}"
+    return None
+
+
+def _bs4_string(text: str, preserve: bool) -> str:
+    if preserve or text.strip(_BS4_ASCII_SPACES):
+        return text
+    return "\n" if "\n" in text else " "
+
+
+def _lxml_contents(
+    element: etree._Element,
+) -> Iterator[etree._Element | tuple[etree._Element, bool]]:
+    """
+    Yield ``element``'s children in bs4 ``contents`` order, with text slots as
+    (owner, True) for ``owner.text`` and (owner, False) for ``owner.tail``.
+    """
+    if element.text:
+        yield (element, True)
+    for child in element:
+        yield child
+        if child.tail:
+            yield (child, False)
+
+
+def _lxml_string_context(element: etree._Element, html_mode: bool) -> tuple[str, bool]:
+    """
+    Return the string container enclosing ``element`` ("" for content) and
+    whether whitespace is preserved there.
+    """
+    if not html_mode:
+        return "", False
+    context = ""
+    preserve = False
+    for ancestor in element.iterancestors():
+        name = _lxml_name(ancestor)
+        if not context and name in _BS4_STRING_CONTAINER_TAGS:
+            context = name
+        if name in _BS4_PRESERVE_WHITESPACE_TAGS:
+            preserve = True
+    return context, preserve
+
+
+def _lxml_stripped_strings(element: etree._Element, context: str, html_mode: bool) -> list[str]:
+    """``Tag.stripped_strings`` for ``element`` inside string ``context``."""
+    name = _lxml_name(element)
+    if html_mode and name in _BS4_STRING_CONTAINER_TAGS:
+        context = wanted = name
+    else:
+        wanted = ""
+    strings: list[str] = []
+
+    def _visit(node: etree._Element, ctx: str) -> None:
+        keep = ctx == wanted
+        if keep and node.text:
+            stripped = node.text.strip()
+            if stripped:
+                strings.append(stripped)
+        for child in node:
+            child_name = _lxml_name(child)
+            if child_name is not None:
+                if html_mode and child_name in _BS4_STRING_CONTAINER_TAGS:
+                    _visit(child, child_name)
+                else:
+                    _visit(child, ctx)
+            if keep and child.tail:
+                stripped = child.tail.strip()
+                if stripped:
+                    strings.append(stripped)
+
+    _visit(element, context)
+    return strings
+
+
+def _lxml_ruby_base_text(ruby: etree._Element, context: str, html_mode: bool) -> str:
+    rbs = [child for child in ruby if _lxml_name(child) == "rb"]
+    if rbs:
+        return "".join("".join(_lxml_stripped_strings(rb, context, html_mode)) for rb in rbs)
+    parts: list[str] = []
+    if ruby.text:
+        parts.append(ruby.text)
+    for child in ruby:
+        name = _lxml_name(child)
+        if name is None:
+            special = _lxml_special_string(child)
+            if special is not None:
+                parts.append(special)
+        elif name not in ("rt", "rp"):
+            parts.append("".join(_lxml_stripped_strings(child, context, html_mode)))
+        if child.tail:
+            parts.append(child.tail)
+    return "".join(parts)
+
+
+def _lxml_ruby_reading_text(ruby: etree._Element, context: str, html_mode: bool) -> str:
+    rts = [child for child in ruby if _lxml_name(child) == "rt"]
+    if rts:
+        return "".join("".join(_lxml_stripped_strings(rt, context, html_mode)) for rt in rts)
+    return "".join(_lxml_stripped_strings(ruby, context, html_mode))
+
+
+def _lxml_kana_suffix(
+    ruby: etree._Element,
+    context: str,
+    html_mode: bool,
+    preserve: bool,
+) -> str:
+    def _following_texts() -> Iterator[str]:
+        if ruby.tail:
+            yield ruby.tail
+        for sibling in ruby.itersiblings():
+            name = _lxml_name(sibling)
+            if name is None:
+                special = _lxml_special_string(sibling)
+                if special is None:
+                    return
+                # An empty comment still reads as a single space in bs4.
+                yield _bs4_string(special, preserve)
+            elif name == "ruby":
+                return
+            elif name not in ("rt", "rp"):
+                yield "".join(_lxml_stripped_strings(sibling, context, html_mode))
+            if sibling.tail:
+                yield sibling.tail
+
+    return _leading_kana(_following_texts())
+
+
+def _lxml_significant_sibling(element: etree._Element, *, forward: bool) -> etree._Element | None:
+    """Nearest sibling element with only whitespace strings in between."""
+    if forward:
+        if element.tail and element.tail.strip():
+            return None
+        siblings = element.itersiblings()
+    else:
+        siblings = element.itersiblings(preceding=True)
+    for sibling in siblings:
+        if not forward and sibling.tail and sibling.tail.strip():
+            return None
+        if _lxml_name(sibling) is not None:
+            return sibling
+        special = _lxml_special_string(sibling)
+        if special is None or special.strip():
+            return None
+        if forward and sibling.tail and sibling.tail.strip():
+            return None
+    return None
+
+
+def _lxml_ruby_nodes(tree: _LxmlTree) -> list[_RubyEvidenceNode]:
+    html_mode = tree.html_mode
+    rubies = [ruby for ruby in tree.root.iter("{*}ruby") if _lxml_name(ruby) == "ruby"]
+    nodes: list[_RubyEvidenceNode] = []
+    for ruby in rubies:
+        context, preserve = _lxml_string_context(ruby, html_mode)
+        nodes.append(
+            _RubyEvidenceNode(
+                base=_normalize_ws(_lxml_ruby_base_text(ruby, context, html_mode)),
+                reading=_lxml_ruby_reading_text(ruby, context, html_mode),
+                suffix=_lxml_kana_suffix(ruby, context, html_mode, preserve),
+            )
+        )
+    by_element = dict(zip(rubies, nodes))
+    for ruby, node in zip(rubies, nodes):
+        prev = _lxml_significant_sibling(ruby, forward=False)
+        if prev is not None and _lxml_name(prev) == "ruby":
+            node.prev_ruby = by_element.get(prev)
+        nxt = _lxml_significant_sibling(ruby, forward=True)
+        if nxt is not None and _lxml_name(nxt) == "ruby":
+            node.next_ruby = by_element.get(nxt)
+    return nodes
+
+
+def _lxml_find_nav_fragment(tree: _LxmlTree, fragment: str, skip_rt: bool) -> etree._Element | None:
+    for attr in ("id", "name"):
+        for element in tree.root.xpath(f"//*[@{attr}=$value]", value=fragment):
+            if skip_rt and (
+                _lxml_name(element) == "rt"
+                or any(_lxml_name(ancestor) == "rt" for ancestor in element.iterancestors())
+            ):
+                continue
+            return element
+    return None
+
+
+def _lxml_nav_marker_targets(
+    tree: _LxmlTree,
+    entries: list[_NavPoint],
     *,
-    transform: str = "partial",
-) -> tuple[list[ChapterText], list[dict[str, object]]]:
+    skip_rt: bool,
+) -> dict[object, list[tuple[int, bool]]]:
+    """lxml counterpart of _nav_marker_targets; None keys the document itself."""
+    targets: dict[object, list[tuple[int, bool]]] = {}
+    for entry in entries:
+        target: object | None = None
+        fallback = False
+        if entry.fragment:
+            target = _lxml_find_nav_fragment(tree, entry.fragment, skip_rt)
+        if target is None:
+            fallback = True
+            body = next(tree.root.iter("{*}body"), None)
+            if body is not None:
+                for item in _lxml_contents(body):
+                    if skip_rt and not isinstance(item, tuple) and _lxml_name(item) == "rt":
+                        continue
+                    target = item
+                    break
+        markers = targets.setdefault(target, [])
+        if fallback:
+            markers.insert(0, (entry.order, fallback))
+        else:
+            markers.append((entry.order, fallback))
+    return targets
+
+
+def _render_lxml_text(
+    tree: _LxmlTree,
+    nav_entries: list[_NavPoint],
+    *,
+    ruby_tracker: _RubySpanTracker | None = None,
+    mapping_passes: list[tuple[Mapping[str, str], _MappingMatcher | None]] | None = None,
+    context_rules: Mapping[str, _ContextRule] | None = None,
+) -> str:
+    """lxml counterpart of _render_soup_text; produces the same text."""
+    marked = ruby_tracker is not None
+    html_mode = tree.html_mode
+    nav_targets = _lxml_nav_marker_targets(tree, nav_entries, skip_rt=marked)
+    parts: list[str] = ruby_tracker.parts if marked else []
+    append = parts.append
+    emit_nav = ruby_tracker.nav if marked else _chapter_marker_emitter(append)
+
+    def _emit_string(text: str, parent_name: str | None, content: bool, top_level: bool) -> None:
+        mapped = None
+        if mapping_passes and parent_name not in _MAPPING_SKIP_PARENTS:
+            mapped = _map_text_node(text, mapping_passes, context_rules)
+        if mapped is not None:
+            text = mapped
+        elif not content:
+            return
+        if top_level and text.strip().upper().startswith("HTML PUBLIC"):
+            return
+        append(text)
+
+    for order, _ in nav_targets.get(None, ()):
+        emit_nav(order)
+    if tree.doctype is not None:
+        _emit_string(tree.doctype, None, False, True)
+    root = tree.root
+    top_level = list(root.itersiblings(preceding=True))
+    top_level.reverse()
+    top_level.append(root)
+    top_level.extend(root.itersiblings())
+    # Frames: (items, block depth, ruby span to close, string context,
+    # preserve whitespace, parent tag name).
+    stack: list[tuple[Iterator, int, int | None, str, bool, str | None]] = [
+        (iter(top_level), 0, None, "", False, None)
+    ]
+    while stack:
+        items, block_depth, closing, context, preserve, parent_name = stack[-1]
+        node = next(items, None)
+        if node is None:
+            stack.pop()
+            if closing is not None:
+                ruby_tracker.close_span(closing)
+            continue
+        markers = nav_targets.get(node)
+        if isinstance(node, tuple):
+            owner, is_text = node
+            if markers:
+                for order, _ in markers:
+                    emit_nav(order)
+            text = owner.text if is_text else owner.tail
+            _emit_string(_bs4_string(text, preserve), parent_name, not context, False)
+            continue
+        name = _lxml_name(node)
+        if name is None:
+            if markers:
+                for order, _ in markers:
+                    emit_nav(order)
+            special = _lxml_special_string(node)
+            if special is not None:
+                _emit_string(_bs4_string(special, preserve), parent_name, False, len(stack) == 1)
+            continue
+        span_id: int | None = None
+        if marked and name == "ruby":
+            span_id = ruby_tracker.register_span(
+                _lxml_ruby_base_text(node, context, html_mode),
+                _lxml_ruby_reading_text(node, context, html_mode),
+            )
+        if markers or span_id is not None:
+            _emit_open_markers(emit_nav, markers, ruby_tracker, span_id)
+        if name in _DROPPED_TEXT_TAGS or (marked and name == "rt"):
+            continue
+        if name == "br":
+            append("\n")
+            continue
+        if name == "ruby" and not marked:
+            reading = hiragana_to_katakana(_lxml_ruby_reading_text(node, context, html_mode))
+            append(normalize_katakana(reading))
+            continue
+        child_depth = block_depth
+        if name in BLOCK_LEVEL_TAGS:
+            if name in FORCE_BREAK_TAGS or block_depth == 0:
+                append("\n")
+            child_depth = block_depth + 1
+        child_context = context
+        child_preserve = preserve
+        if html_mode:
+            if name in _BS4_STRING_CONTAINER_TAGS:
+                child_context = name
+            if name in _BS4_PRESERVE_WHITESPACE_TAGS:
+                child_preserve = True
+        stack.append(
+            (
+                _lxml_contents(node),
+                child_depth,
+                span_id,
+                child_context,
+                child_preserve,
+                name,
+            )
+        )
+    return "" if marked else "".join(parts)
+
+
+class _EpubDocument:
     """
-    Convert an EPUB into chapterized text segments with ruby expansion.
+    One decoded and parsed HTML member of an EPUB.
 
-    Returns the processed spine items in order as ChapterText objects.
+    The tree is parsed once and never mutated; the mapping pass reads it
+    directly and the chapter pass renders its text views from it. The
+    ``fast`` parser reads an lxml.etree tree and falls back to BeautifulSoup
+    when lxml cannot handle the document the way bs4 would.
+    """
+
+    def __init__(self, name: str, html: str, parser: str = DEFAULT_HTML_PARSER) -> None:
+        self.name = name
+        self.tree = _parse_lxml_tree(html) if parser == "fast" else None
+        self.soup = _soup_from_html(html) if self.tree is None else None
+
+    def reading_counts(self) -> dict[str, _ReadingAccumulator]:
+        if self.tree is not None:
+            return _collect_reading_counts(_lxml_ruby_nodes(self.tree))
+        return _collect_reading_counts_from_soup(self.soup)
+
+    def original_view(
+        self, nav_entries: list[_NavPoint]
+    ) -> tuple[str, list[_RubySpan], list[tuple[int, int]]]:
+        """Text with <rt> removed, its ruby spans and (nav order, offset) pairs."""
+        tracker = _RubySpanTracker()
+        if self.tree is not None:
+            _render_lxml_text(self.tree, nav_entries, ruby_tracker=tracker)
+        else:
+            _render_soup_text(self.soup, nav_entries, ruby_tracker=tracker)
+        return tracker.finish()
+
+    def reading_view(
+        self,
+        nav_entries: list[_NavPoint],
+        mapping_passes: list[tuple[Mapping[str, str], _MappingMatcher | None]],
+        context_rules: Mapping[str, _ContextRule] | None = None,
+    ) -> str:
+        """Nav-marked text with ruby collapsed to readings and mappings applied."""
+        if self.tree is not None:
+            text = _render_lxml_text(
+                self.tree,
+                nav_entries,
+                mapping_passes=mapping_passes,
+                context_rules=context_rules,
+            )
+        else:
+            text = _render_soup_text(
+                self.soup,
+                nav_entries,
+                mapping_passes=mapping_passes,
+                context_rules=context_rules,
+            )
+        return _clean_extracted_text(text)
+
+
+class _EpubSession:
+    """Per-conversion cache that reads and parses each zip member once."""
+
+    def __init__(self, zf: zipfile.ZipFile, parser: str = DEFAULT_HTML_PARSER) -> None:
+        self.zf = zf
+        self.parser = parser
+        self._documents: dict[str, _EpubDocument] = {}
+        self._digests: dict[str, str] = {}
+        self._parse_seconds: dict[str, float] = {}
+
+    def document(self, name: str) -> _EpubDocument:
+        document = self._documents.get(name)
+        if document is None:
+            started = time.perf_counter()
+            raw = self.zf.read(name)
+            self._digests[name] = hashlib.sha256(raw).hexdigest()
+            document = _EpubDocument(name, _decode_member_bytes(raw), self.parser)
+            self._documents[name] = document
+            self._parse_seconds[name] = time.perf_counter() - started
+        return document
+
+    def take_parse_times(self) -> dict[str, float]:
+        """Seconds spent reading and parsing each member since the last call."""
+        parse_seconds, self._parse_seconds = self._parse_seconds, {}
+        return parse_seconds
+
+    def digest(self, name: str) -> str:
+        """sha256 of the member's bytes; kept after the document is released."""
+        digest = self._digests.get(name)
+        if digest is None:
+            digest = hashlib.sha256(self.zf.read(name)).hexdigest()
+            self._digests[name] = digest
+        return digest
+
+    def release(self, name: str) -> None:
+        self._documents.pop(name, None)
+
+    def clear(self) -> None:
+        self._documents.clear()
+
+
+def _generate_chapter_texts(
+    inp_epub: str | EpubContainer,
+    backend: "NLPBackend" | None,
+    progress: Callable[[dict[str, object]], None] | None,
+    transform_mode: str,
+    parser_mode: str,
+    jobs: int | None,
+    previous: Mapping[str, ChapterText] | None = None,
+) -> Iterator[list[dict[str, object]] | ChapterText]:
+    """
+    Yield the book's ruby evidence once the mapping is built, then each
+    finished chapter in order. ``ChapterStream`` consumes the evidence.
+    Chapters whose fingerprint is in ``previous`` are taken from there
+    instead of being finalized again.
     """
-    backend = nlp
-    transform_mode = (transform or "partial").strip().lower()
-    if transform_mode not in {"partial", "full"}:
-        raise ValueError("transform must be 'partial' or 'full'")
     def _emit_progress(payload: dict[str, object]) -> None:
         if progress:
             try:
@@ -2653,10 +4291,23 @@ def epub_to_chapter_texts(
             except Exception:
                 pass
     if backend is None:
-        from .nlp import NLPBackend  # Local import to avoid costly dependency during module import.
+        from .nlp import load_backend  # Local import to avoid costly dependency during module import.
 
-        backend = NLPBackend()
-    with zipfile.ZipFile(inp_epub, "r") as zf:
+        backend = load_backend()
+    # A container passed in by the caller stays open for the caller to close.
+    if isinstance(inp_epub, EpubContainer):
+        container = nullcontext(inp_epub)
+    else:
+        container = EpubContainer(inp_epub)
+    def _emit_parse_times() -> float:
+        parse_seconds = session.take_parse_times()
+        for name, seconds in parse_seconds.items():
+            _emit_progress({"event": "stage_timing", "stage": "parse", "source": name, "seconds": seconds})
+        return sum(parse_seconds.values())
+
+    with container as epub:
+        session = _EpubSession(epub.zf, parser_mode)
+        mapping_started = time.perf_counter()
         (
             unique_mapping,
             common_mapping,
@@ -2664,11 +4315,20 @@ def epub_to_chapter_texts(
             common_sources,
             context_rules,
             ruby_evidence,
-        ) = _build_book_mapping(zf, backend)
-        spine = _spine_items(zf)
-        nav_points = _toc_nav_points(zf, spine)
+        ) = _build_book_mapping(epub, backend, session=session, jobs=jobs)
+        mapping_seconds = time.perf_counter() - mapping_started
+        # Members parsed for the mapping are reported as parse time instead.
+        mapping_seconds -= _emit_parse_times()
+        _emit_progress({"event": "stage_timing", "stage": "mapping", "seconds": mapping_seconds})
+        yield ruby_evidence
+        unique_matcher = _build_mapping_matcher(unique_mapping)
+        common_matcher = _build_mapping_matcher(common_mapping)
+        mapping_passes = [(unique_mapping, unique_matcher), (common_mapping, common_matcher)]
+        spine = epub.spine
+        nav_points = epub.nav_points
         nav_buckets: dict[int, dict[str, list[object]]] = {
-            entry.order: {"text_fragments": [], "original_parts": []} for entry in nav_points
+            entry.order: {"text_fragments": [], "original_parts": [], "members": []}
+            for entry in nav_points
         }
         nav_by_spine: dict[int, list[_NavPoint]] = defaultdict(list)
         for entry in nav_points:
@@ -2676,8 +4336,8 @@ def epub_to_chapter_texts(
             nav_by_spine[entry.spine_index].append(entry)
         fallback_segments: list[_FallbackSegment] = []
         fallback_sequence = 0
-        book_title = _get_book_title(zf)
-        book_author = _get_book_author(zf)
+        book_title = epub.title
+        book_author = epub.author
         title_candidates: list[str] = []
         if book_title:
             normalized_title = unicodedata.normalize("NFKC", book_title).strip()
@@ -2685,9 +4345,13 @@ def epub_to_chapter_texts(
                 title_candidates.append(normalized_title)
                 title_variant = unicodedata.normalize(
                     "NFKC",
-                    _apply_mapping_to_plain_text(normalized_title, unique_mapping, context_rules),
+                    _apply_mapping_to_plain_text(
+                        normalized_title, unique_mapping, context_rules, matcher=unique_matcher
+                    ),
+                )
+                title_variant = _apply_mapping_to_plain_text(
+                    title_variant, common_mapping, context_rules, matcher=common_matcher
                 )
-                title_variant = _apply_mapping_to_plain_text(title_variant, common_mapping, context_rules)
                 variant_stripped = title_variant.strip()
                 if variant_stripped and variant_stripped not in title_candidates:
                     title_candidates.append(variant_stripped)
@@ -2702,57 +4366,34 @@ def epub_to_chapter_texts(
         title_seen = False
 
         for spine_index, name in enumerate(spine):
-            if name not in zf.namelist():
-                # Some spines use relative paths; try to resolve simply
-                candidates = [
-                    n for n in zf.namelist() if n.endswith("/" + name) or n.endswith(name)
-                ]
-                if candidates:
-                    name = candidates[0]
-                else:
-                    continue
+            # Some spines use relative paths; resolve them by suffix
+            resolved = epub.resolve(name)
+            if resolved is None:
+                continue
+            name = resolved
             if not name.lower().endswith(HTML_EXTS):
                 continue
-            html = _zip_read_text(zf, name)
             nav_entries_for_file = nav_by_spine.get(spine_index, [])
-            original_soup = _soup_from_html(html)
-            ruby_tracker = _RubySpanTracker()
-            ruby_tracker.mark_soup(original_soup)
-            for rt in original_soup.find_all("rt"):
-                rt.decompose()
-            _insert_nav_markers(original_soup, nav_entries_for_file)
-            original_marked_text = _strip_html_to_text(original_soup)
-            original_plain_text, ruby_spans = ruby_tracker.extract(original_marked_text)
-            soup = _soup_from_html(html)
-            # 1) propagate: replace base outside ruby using the global mapping
-            _replace_outside_ruby_with_readings(
-                soup,
-                unique_mapping,
-                source_labels=unique_sources,
-                context_rules=context_rules,
-            )
-            _replace_outside_ruby_with_readings(
-                soup,
-                common_mapping,
-                source_labels=common_sources,
-                context_rules=context_rules,
-            )
-            _insert_nav_markers(soup, nav_entries_for_file)
-            # 2) drop bases inside ruby, keep only readings
-            _collapse_ruby_to_readings(soup)
-            # 3) strip remaining html to text
-            piece = _strip_html_to_text(soup)
+            document = session.document(name)
+            _emit_parse_times()
+            original_plain_text, ruby_spans, nav_offsets = document.original_view(nav_entries_for_file)
+            # Propagate the book mapping outside ruby, collapse ruby to its
+            # readings, then re-apply the mapping across node boundaries.
+            piece = document.reading_view(nav_entries_for_file, mapping_passes, context_rules)
+            session.release(name)
             piece = _apply_mapping_to_plain_text(
                 piece,
                 unique_mapping,
                 context_rules,
                 source_labels=unique_sources,
+                matcher=unique_matcher,
             )
             piece = _apply_mapping_to_plain_text(
                 piece,
                 common_mapping,
                 context_rules,
                 source_labels=common_sources,
+                matcher=common_matcher,
             )
             filtered_lines: list[str] = []
             skip_blank_after_title = False
@@ -2789,7 +4430,7 @@ def epub_to_chapter_texts(
                 continue
             leading_piece, piece_segments = _split_text_by_markers(raw_piece_text)
             leading_fragment = _TextFragment(text=leading_piece)
-            leading_original, original_segments = _split_text_by_markers(original_plain_text)
+            leading_original, original_segments = _split_text_at_nav_offsets(original_plain_text, nav_offsets)
             original_segment_map = {marker: (segment, start, end) for marker, segment, start, end in original_segments}
             for marker_id, segment_text, _, _ in piece_segments:
                 bucket = nav_buckets.get(marker_id)
@@ -2802,6 +4443,8 @@ def epub_to_chapter_texts(
                 fragment.ruby_spans = _slice_ruby_spans(ruby_spans, seg_start, seg_end)
                 bucket["text_fragments"].append(fragment)
                 bucket["original_parts"].append(original_segment)
+                if name not in bucket["members"]:
+                    bucket["members"].append(name)
             if leading_fragment.text.strip():
                 order = -1 if nav_entries_for_file else 0
                 leading_span_list = _slice_ruby_spans(ruby_spans, 0, len(leading_original))
@@ -2818,6 +4461,7 @@ def epub_to_chapter_texts(
                 )
                 fallback_sequence += 1
 
+        session.clear()
         pending_outputs: list[_PendingChapter] = []
         for segment in fallback_segments:
             fragment_text = segment.fragment.text
@@ -2832,6 +4476,7 @@ def epub_to_chapter_texts(
                     title_hint=None,
                     tokens=list(segment.fragment.tokens),
                     ruby_spans=list(segment.fragment.ruby_spans or []),
+                    members=(segment.source,),
                 )
             )
         for entry in nav_points:
@@ -2853,10 +4498,16 @@ def epub_to_chapter_texts(
                     title_hint=entry.title.strip() if entry.title else None,
                     tokens=fragment_tokens,
                     ruby_spans=fragment_spans,
+                    members=tuple(bucket["members"]),
                 )
             )
 
-        sorted_pending = sorted(pending_outputs, key=lambda item: item.sort_key)
+        fallback_segments.clear()
+        nav_buckets.clear()
+        sorted_pending: list[_PendingChapter | None] = sorted(
+            pending_outputs, key=lambda item: item.sort_key
+        )
+        del pending_outputs
         total_chapters = len(sorted_pending)
         if total_chapters:
             _emit_progress(
@@ -2866,53 +4517,132 @@ def epub_to_chapter_texts(
                     "book_title": book_title,
                 }
             )
-        chapters: list[ChapterText] = []
-        for idx, pending in enumerate(sorted_pending, start=1):
-            original_basis = pending.raw_original if pending.raw_original is not None else pending.raw_text
-            processing_basis = original_basis
-            if not chapters:
-                processing_basis = _ensure_title_author_break(processing_basis)
-            processing_basis = _ensure_paragraph_spacing_plain(processing_basis)
-            normalized_original = processing_basis
-            _emit_progress(
-                {
-                    "event": "chapter_start",
-                    "index": idx,
-                    "total": total_chapters,
-                    "source": pending.source,
-                    "title_hint": pending.title_hint,
-                }
-            )
-            finalized_text, pitch_tokens, chapter_tokens = _finalize_segment_text(
-                pending.raw_text,
-                backend,
-                preset_tokens=pending.tokens,
-                original_text=processing_basis,
-                ruby_spans=pending.ruby_spans,
-                unique_mapping=unique_mapping,
-                common_mapping=common_mapping,
-                unique_sources=unique_sources,
-                common_sources=common_sources,
-                context_rules=context_rules,
-                transform=transform_mode,
-            )
-            if not finalized_text:
+        finalizer = _ChapterFinalizer(
+            unique_mapping=unique_mapping,
+            common_mapping=common_mapping,
+            unique_sources=unique_sources,
+            common_sources=common_sources,
+            context_rules=context_rules,
+            transform=transform_mode,
+            unique_matcher=unique_matcher,
+            common_matcher=common_matcher,
+        )
+        book_key = _book_fingerprint_key(backend, finalizer)
+        member_digests = (
+            {name: session.digest(name) for pending in sorted_pending for name in pending.members}
+            if book_key is not None
+            else {}
+        )
+
+        def _is_carried(pending: _PendingChapter, basis: str) -> bool:
+            if book_key is None or not previous:
+                return False
+            return _chapter_fingerprint(book_key, pending, member_digests, basis) in previous
+
+        workers = min(_resolve_jobs(jobs), total_chapters)
+        executor: ProcessPoolExecutor | None = None
+        futures: dict[int, Future] = {}
+        submitted = 0
+        window = workers * 2
+
+        def _submit_ahead(position: int) -> None:
+            # Keep a bounded number of chapters in flight so finished results
+            # do not pile up when the consumer writes slower than workers run.
+            nonlocal submitted
+            while executor is not None and submitted < min(position + window, total_chapters):
+                pending = sorted_pending[submitted]
+                basis = _chapter_processing_basis(pending, first=submitted == 0)
+                if not _is_carried(pending, basis):
+                    futures[submitted] = executor.submit(
+                        _finalize_chapter_in_worker,
+                        pending.raw_text,
+                        basis,
+                        pending.ruby_spans,
+                    )
+                submitted += 1
+
+        if workers > 1:
+            executor = _process_pool(workers, _init_chapter_worker, finalizer)
+        emitted = 0
+        try:
+            for position in range(total_chapters):
+                idx = position + 1
+                _submit_ahead(position)
+                future = futures.pop(position, None)
+                pending = sorted_pending[position]
+                # Drop the raw text once this chapter is under way.
+                sorted_pending[position] = None
+                first = emitted == 0
+                processing_basis = _chapter_processing_basis(pending, first=first)
+                normalized_original = processing_basis
                 _emit_progress(
                     {
-                        "event": "chapter_done",
+                        "event": "chapter_start",
                         "index": idx,
                         "total": total_chapters,
                         "source": pending.source,
-                        "title": pending.title_hint,
+                        "title_hint": pending.title_hint,
                     }
                 )
-                continue
-            original_title = _first_non_blank_line(normalized_original)
-            processed_title = _first_non_blank_line(finalized_text)
-            title = processed_title or pending.title_hint
-            original_title = original_title or pending.title_hint or title
-            chapters.append(
-                ChapterText(
+                fingerprint = (
+                    _chapter_fingerprint(book_key, pending, member_digests, processing_basis)
+                    if book_key is not None
+                    else None
+                )
+                carried = previous.get(fingerprint) if previous and fingerprint is not None else None
+                if carried is not None and carried.text:
+                    emitted += 1
+                    yield replace(
+                        carried,
+                        source=pending.source,
+                        book_title=book_title,
+                        book_author=book_author,
+                        fingerprint=fingerprint,
+                    )
+                    _emit_progress(
+                        {
+                            "event": "chapter_done",
+                            "index": idx,
+                            "total": total_chapters,
+                            "source": pending.source,
+                            "title": carried.title,
+                            "carried": True,
+                            "timings": {},
+                        }
+                    )
+                    continue
+                # Only the first emitted chapter gets the title/author break,
+                # so workers assume chapter 1 comes first; redo locally any
+                # chapter where that guess turns out wrong.
+                chapter_timings: dict[str, float] = {}
+                if future is not None and first == (idx == 1):
+                    (finalized_text, pitch_tokens, chapter_tokens), chapter_timings = future.result()
+                else:
+                    finalized_text, pitch_tokens, chapter_tokens = finalizer.finalize(
+                        backend,
+                        pending.raw_text,
+                        processing_basis,
+                        pending.ruby_spans,
+                        chapter_timings,
+                    )
+                if not finalized_text:
+                    _emit_progress(
+                        {
+                            "event": "chapter_done",
+                            "index": idx,
+                            "total": total_chapters,
+                            "source": pending.source,
+                            "title": pending.title_hint,
+                            "timings": chapter_timings,
+                        }
+                    )
+                    continue
+                original_title = _first_non_blank_line(normalized_original)
+                processed_title = _first_non_blank_line(finalized_text)
+                title = processed_title or pending.title_hint
+                original_title = original_title or pending.title_hint or title
+                emitted += 1
+                yield ChapterText(
                     source=pending.source,
                     title=title,
                     text=finalized_text,
@@ -2922,33 +4652,305 @@ def epub_to_chapter_texts(
                     book_author=book_author,
                     pitch_data=pitch_tokens,
                     tokens=chapter_tokens,
+                    fingerprint=fingerprint,
                 )
-            )
-            _emit_progress(
-                {
-                    "event": "chapter_done",
-                    "index": idx,
-                    "total": total_chapters,
-                    "source": pending.source,
-                    "title": title,
-                }
-            )
+                _emit_progress(
+                    {
+                        "event": "chapter_done",
+                        "index": idx,
+                        "total": total_chapters,
+                        "source": pending.source,
+                        "title": title,
+                        "timings": chapter_timings,
+                    }
+                )
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
 
-        return chapters, ruby_evidence
 
+class ChapterStream:
+    """
+    Finished chapters of an EPUB, yielded in book order as each completes.
 
-__all__ = ["ChapterText", "CoverImage", "epub_to_chapter_texts", "get_epub_cover"]
-def _insert_text_gap(text: str, insert_at: int, tokens: list[ChapterToken] | None, delta: int = 1) -> tuple[str, list[ChapterToken] | None]:
-    if delta == 0:
-        return text, tokens
-    updated_text = text[:insert_at] + ("\n" * delta) + text[insert_at:]
-    if tokens:
-        for token in tokens:
-            if token.transformed_start is not None and token.transformed_start >= insert_at:
-                token.transformed_start += delta
-            if token.transformed_end is not None and token.transformed_end >= insert_at:
-                token.transformed_end += delta
-    return updated_text, tokens
+    The book mapping is built on construction, so ``ruby_evidence`` is
+    available before the first chapter. The EPUB stays open until the
+    stream is exhausted or closed; use it as a context manager when it may
+    be abandoned early.
+    """
+
+    def __init__(self, chapters: Iterator[list[dict[str, object]] | ChapterText]) -> None:
+        self._chapters = chapters
+        evidence = next(chapters)
+        assert isinstance(evidence, list)
+        self.ruby_evidence: list[dict[str, object]] = evidence
+
+    def __iter__(self) -> ChapterStream:
+        return self
+
+    def __next__(self) -> ChapterText:
+        chapter = next(self._chapters)
+        assert isinstance(chapter, ChapterText)
+        return chapter
+
+    def close(self) -> None:
+        self._chapters.close()
+
+    def __enter__(self) -> ChapterStream:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def iter_epub_chapters(
+    inp_epub: str | EpubContainer,
+    nlp: "NLPBackend" | None = None,
+    progress: Callable[[dict[str, object]], None] | None = None,
+    *,
+    transform: str = "partial",
+    parser: str = DEFAULT_HTML_PARSER,
+    jobs: int | None = None,
+    previous: Mapping[str, ChapterText] | None = None,
+) -> ChapterStream:
+    """
+    Streaming form of ``epub_to_chapter_texts``.
+
+    Returns a ``ChapterStream`` that yields each ChapterText as soon as it is
+    finalized, so callers can write chapters out without holding the whole
+    book; the ruby evidence is on ``stream.ruby_evidence``.
+
+    Each chapter carries a ``fingerprint`` of its spine members' content,
+    the book mapping, the transform mode and the nk/dictionary versions.
+    ``previous`` maps fingerprints from an earlier run to their finished
+    chapters (see ``book_io.load_previous_chapters``); chapters whose
+    fingerprint is found there are carried over instead of recomputed.
+    """
+    transform_mode = (transform or "partial").strip().lower()
+    if transform_mode not in {"partial", "full"}:
+        raise ValueError("transform must be 'partial' or 'full'")
+    parser_mode = (parser or DEFAULT_HTML_PARSER).strip().lower()
+    if parser_mode not in HTML_PARSERS:
+        raise ValueError("parser must be 'fast' or 'bs4'")
+    return ChapterStream(
+        _generate_chapter_texts(
+            inp_epub, nlp, progress, transform_mode, parser_mode, jobs, previous
+        )
+    )
+
+
+def epub_to_chapter_texts(
+    inp_epub: str | EpubContainer,
+    nlp: "NLPBackend" | None = None,
+    progress: Callable[[dict[str, object]], None] | None = None,
+    *,
+    transform: str = "partial",
+    parser: str = DEFAULT_HTML_PARSER,
+    jobs: int | None = None,
+) -> tuple[list[ChapterText], list[dict[str, object]]]:
+    """
+    Convert an EPUB into chapterized text segments with ruby expansion.
+
+    ``parser`` selects the HTML extraction engine: ``fast`` (lxml.etree) or
+    ``bs4`` (BeautifulSoup). Both produce the same text.
+
+    ``jobs`` > 1 collects ruby evidence and finalizes chapters in that many
+    worker processes (<= 0 uses every CPU); chapter workers each build their
+    own default ``NLPBackend``. Chapters, evidence and progress events come
+    back in book order.
+
+    Besides ``chapter_prepare``/``chapter_start``/``chapter_done``, ``progress``
+    receives ``stage_timing`` events with ``stage`` and ``seconds``: one
+    ``mapping`` event for the ruby evidence pass and a ``parse`` event (with
+    ``source``) per member read and parsed. ``chapter_done`` carries the
+    chapter's ``timings`` as seconds per ``tokenize``/``tokens``/``pitch``/
+    ``render`` stage; it is empty for chapters carried over from ``previous``.
+
+    Returns the processed spine items in order as ChapterText objects. Use
+    ``iter_epub_chapters`` to receive them one at a time instead.
+    """
+    with iter_epub_chapters(
+        inp_epub, nlp, progress, transform=transform, parser=parser, jobs=jobs
+    ) as stream:
+        return list(stream), stream.ruby_evidence
+
+
+__all__ = [
+    "ChapterStream",
+    "ChapterText",
+    "CoverImage",
+    "EpubContainer",
+    "epub_to_chapter_texts",
+    "event_stage_seconds",
+    "get_epub_cover",
+    "iter_epub_chapters",
+]
+class _TextEdits:
+    """
+    Non-overlapping edits against one source string, applied in one pass.
+
+    Each edit replaces ``text[start:end]``; inserts are empty ranges. Source
+    offsets inside an edited range map to the start of its replacement and
+    the range end maps to the replacement end, so an insert pushes offsets
+    at its position past the inserted text.
+    """
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self._edits: list[tuple[int, int, str]] = []
+
+    def replace(self, start: int, end: int, replacement: str) -> None:
+        if start != end or replacement:
+            self._edits.append((start, end, replacement))
+
+    def insert(self, position: int, text: str) -> None:
+        self.replace(position, position, text)
+
+    def apply(self, tokens: list[ChapterToken] | None) -> tuple[str, list[ChapterToken] | None]:
+        """Return the edited text, remapping token transformed offsets in place."""
+        if not self._edits:
+            return self.text, tokens
+        edits = sorted(self._edits, key=lambda edit: (edit[0], edit[1]))
+        pieces: list[str] = []
+        starts: list[int] = []
+        ends: list[int] = []
+        out_starts: list[int] = []
+        shifts: list[int] = [0]
+        cursor = 0
+        out_pos = 0
+        for start, end, replacement in edits:
+            pieces.append(self.text[cursor:start])
+            out_pos += start - cursor
+            starts.append(start)
+            ends.append(end)
+            out_starts.append(out_pos)
+            pieces.append(replacement)
+            out_pos += len(replacement)
+            shifts.append(out_pos - end)
+            cursor = end
+        pieces.append(self.text[cursor:])
+        if tokens:
+            length = len(self.text)
+
+            def _map(offset: int) -> int:
+                done = bisect_right(ends, offset)
+                if done < len(starts) and starts[done] <= offset:
+                    return out_starts[done]
+                return offset + shifts[done]
+
+            for token in tokens:
+                if token.transformed_start is not None and 0 <= token.transformed_start <= length:
+                    token.transformed_start = _map(token.transformed_start)
+                if token.transformed_end is not None and 0 <= token.transformed_end <= length:
+                    token.transformed_end = _map(token.transformed_end)
+        return "".join(pieces), tokens
+
+
+def _trim_bounds(text: str) -> tuple[int, int]:
+    left = 0
+    right = len(text)
+    while left < right and text[left] in "\r\n":
+        left += 1
+    while right > left and text[right - 1] in "\r\n":
+        right -= 1
+    return left, right
+
+
+def _title_author_break_offset(text: str, start: int, end: int) -> int | None:
+    """Where ``_ensure_title_author_break`` would add a blank line in ``text[start:end]``."""
+    first: tuple[int, int] | None = None
+    blank_between = False
+    cursor = start
+    while cursor < end:
+        line_end = text.find("\n", cursor, end)
+        if line_end == -1:
+            line_end = end
+        line = text[cursor:line_end]
+        if not line.strip():
+            if first is not None:
+                blank_between = True
+        elif first is None:
+            first = (cursor, line_end)
+        else:
+            if blank_between:
+                return None
+            if _line_looks_like_title_or_author(
+                text[first[0] : first[1]]
+            ) and _line_looks_like_title_or_author(line):
+                return cursor
+            return None
+        cursor = line_end + 1
+    return None
+
+
+def _add_paragraph_spacing_edits(edits: _TextEdits, start: int, end: int, taken: set[int]) -> None:
+    for match in _SINGLE_NEWLINE_PATTERN.finditer(edits.text, start, end):
+        insert_at = match.start(0) + 1
+        if insert_at not in taken:
+            taken.add(insert_at)
+            edits.insert(insert_at, "\n")
+
+
+_ELLIPSIS_RUN_PATTERN = re.compile(r"[.…]{2,}")
+_ELLIPSIS_UNIT_PATTERN = re.compile(r"\.{3,}|…|\.{1,2}")
+
+
+def _add_ellipsis_edits(edits: _TextEdits, start: int, end: int) -> None:
+    # Same result as _normalize_ellipsis: runs of 3+ dots become "…", then
+    # adjacent "…" collapse into one.
+    for run in _ELLIPSIS_RUN_PATTERN.finditer(edits.text, start, end):
+        group: tuple[int, int] | None = None
+        units = 0
+        for unit in _ELLIPSIS_UNIT_PATTERN.finditer(edits.text, run.start(), run.end()):
+            if unit.group(0) == "…" or len(unit.group(0)) >= 3:
+                group = (group[0] if group else unit.start(), unit.end())
+                units += 1
+                continue
+            if group is not None and (units > 1 or group[1] - group[0] > 1):
+                edits.replace(group[0], group[1], "…")
+            group = None
+            units = 0
+        if group is not None and (units > 1 or group[1] - group[0] > 1):
+            edits.replace(group[0], group[1], "…")
+
+
+def _finalize_rendered_text(
+    text: str, tokens: list[ChapterToken] | None
+) -> tuple[str, list[ChapterToken] | None]:
+    """
+    Trim, add the title/author break and paragraph spacing, and normalize
+    ellipses as one set of edits, then remap token offsets once.
+
+    Equivalent to running the trim, title/author, paragraph-spacing and
+    ellipsis passes in that order.
+    """
+    if not text:
+        return "", tokens
+    edits = _TextEdits(text)
+    left, right = _trim_bounds(text)
+    edits.replace(0, left, "")
+    edits.replace(right, len(text), "")
+    taken: set[int] = set()
+    title_break = _title_author_break_offset(text, left, right)
+    if title_break is not None:
+        taken.add(title_break)
+        edits.insert(title_break, "\n")
+    _add_paragraph_spacing_edits(edits, left, right, taken)
+    _add_ellipsis_edits(edits, left, right)
+    return edits.apply(tokens)
+
+
+def _trim_transformed_text_and_tokens(
+    text: str,
+    tokens: list[ChapterToken] | None,
+) -> tuple[str, list[ChapterToken] | None]:
+    if not text:
+        return "", tokens
+    edits = _TextEdits(text)
+    left, right = _trim_bounds(text)
+    edits.replace(0, left, "")
+    edits.replace(right, len(text), "")
+    return edits.apply(tokens)
 
 
 def _ensure_title_author_break_with_tokens(
@@ -2956,38 +4958,11 @@ def _ensure_title_author_break_with_tokens(
 ) -> tuple[str, list[ChapterToken] | None]:
     if not text:
         return text, tokens
-    lines: list[tuple[int, str]] = []
-    start = 0
-    length = len(text)
-    while start <= length:
-        end = text.find("\n", start)
-        if end == -1:
-            lines.append((start, text[start:]))
-            break
-        lines.append((start, text[start:end]))
-        start = end + 1
-        if start >= length:
-            break
-    first_idx = second_idx = -1
-    for idx, (_, line) in enumerate(lines):
-        if line.strip():
-            if first_idx == -1:
-                first_idx = idx
-            else:
-                second_idx = idx
-                break
-    if first_idx == -1 or second_idx == -1:
-        return text, tokens
-    if not (
-        _line_looks_like_title_or_author(lines[first_idx][1])
-        and _line_looks_like_title_or_author(lines[second_idx][1])
-    ):
-        return text, tokens
-    has_blank = any(not lines[idx][1].strip() for idx in range(first_idx + 1, second_idx))
-    if has_blank:
-        return text, tokens
-    insert_at = lines[second_idx][0]
-    return _insert_text_gap(text, insert_at, tokens, delta=1)
+    edits = _TextEdits(text)
+    insert_at = _title_author_break_offset(text, 0, len(text))
+    if insert_at is not None:
+        edits.insert(insert_at, "\n")
+    return edits.apply(tokens)
 
 
 def _ensure_paragraph_spacing_plain(text: str) -> str:
@@ -3001,12 +4976,6 @@ def _ensure_paragraph_spacing_with_tokens(
 ) -> tuple[str, list[ChapterToken] | None]:
     if not text:
         return text, tokens
-    cursor = 0
-    while True:
-        match = _SINGLE_NEWLINE_PATTERN.search(text, cursor)
-        if not match:
-            break
-        insert_at = match.start(0) + 1
-        text, tokens = _insert_text_gap(text, insert_at, tokens, delta=1)
-        cursor = insert_at + 1
-    return text, tokens
+    edits = _TextEdits(text)
+    _add_paragraph_spacing_edits(edits, 0, len(text), set())
+    return edits.apply(tokens)
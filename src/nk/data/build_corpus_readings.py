@@ -21,12 +21,13 @@ SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
+from nk.chars import is_cjk_char, is_kana_string, normalize_katakana  # noqa: E402
 from nk.core import (  # noqa: E402
-    _is_kana_string,
-    _normalize_katakana,
+    _corpus_accumulators_from_entries,
     _ruby_base_text,
     _ruby_reading_text,
     _soup_from_html,
+    _write_corpus_reading_index,
 )
 
 
@@ -35,7 +36,7 @@ def normalize_base(text: str) -> str:
 
 
 def normalize_reading(text: str) -> str:
-    return _normalize_katakana(unicodedata.normalize("NFKC", "".join((text or "").split())))
+    return normalize_katakana(unicodedata.normalize("NFKC", "".join((text or "").split())))
 
 
 @dataclass
@@ -46,28 +47,11 @@ class RubyRecord:
     prefix: str
 
 
-def _is_cjk_char(ch: str) -> bool:
-    if not ch:
-        return False
-    code = ord(ch)
-    return (
-        0x4E00 <= code <= 0x9FFF
-        or 0x3400 <= code <= 0x4DBF
-        or 0x20000 <= code <= 0x2A6DF
-        or 0x2A700 <= code <= 0x2B73F
-        or 0x2B740 <= code <= 0x2B81F
-        or 0x2B820 <= code <= 0x2CEAF
-        or 0x2CEB0 <= code <= 0x2EBEF
-        or 0x30000 <= code <= 0x3134F
-        or ch in "々〆ヵヶ"
-    )
-
-
 def _is_single_kanji(text: str) -> bool:
     stripped = text.strip()
     if not stripped:
         return False
-    cjk_chars = [ch for ch in stripped if _is_cjk_char(ch)]
+    cjk_chars = [ch for ch in stripped if is_cjk_char(ch)]
     return len(cjk_chars) == 1 and len(cjk_chars) == len(stripped)
 
 
@@ -156,7 +140,7 @@ def iter_ruby_records(epub: Path) -> Iterable[RubyRecord]:
                             continue
                         reading_raw = _ruby_reading_text(child)
                         reading_norm = normalize_reading(reading_raw)
-                        if not reading_norm or not _is_kana_string(reading_norm):
+                        if not reading_norm or not is_kana_string(reading_norm):
                             continue
                         start = cursor
                         append(base_raw)
@@ -196,7 +180,7 @@ def iter_ruby_records(epub: Path) -> Iterable[RubyRecord]:
                     continue
                 combined_base = normalize_base("".join(item[3] for item in group))
                 combined_reading = normalize_reading("".join(item[4] for item in group))
-                if not combined_reading or not _is_kana_string(combined_reading):
+                if not combined_reading or not is_kana_string(combined_reading):
                     idx += 1
                     continue
                 yield RubyRecord(
@@ -272,6 +256,13 @@ def filter_records(
     return results
 
 
+def write_index(json_path: Path, index_path: Path) -> int:
+    source = json_path.read_bytes()
+    accumulators = _corpus_accumulators_from_entries(json.loads(source.decode("utf-8")))
+    _write_corpus_reading_index(accumulators, index_path, source=source)
+    return len(accumulators)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
@@ -286,15 +277,32 @@ def main() -> None:
         default=ROOT / "src" / "nk" / "data" / "nhk_easy_readings.json",
         help="Where to write the aggregated readings JSON.",
     )
+    parser.add_argument(
+        "--index-output",
+        type=Path,
+        default=None,
+        help="Where to write the binary index (default: next to --output, with an .idx suffix).",
+    )
+    parser.add_argument(
+        "--index-only",
+        action="store_true",
+        help="Rebuild only the binary index from the existing JSON.",
+    )
     parser.add_argument("--min-total", type=int, default=3, help="Minimum occurrences required for inclusion.")
     parser.add_argument("--min-dominance", type=float, default=0.9, help="Minimum share for the dominant reading (0-1).")
     args = parser.parse_args()
-    if not args.epub.exists():
-        sys.exit(f"Corpus EPUB not found: {args.epub}")
-    aggregated = aggregate(args.epub)
-    filtered = filter_records(aggregated, args.min_total, args.min_dominance)
-    args.output.write_text(json.dumps(filtered, ensure_ascii=False, indent=2))
-    print(f"Wrote {len(filtered)} entries to {args.output}")
+    index_output = args.index_output or args.output.with_suffix(".idx")
+    if not args.index_only:
+        if not args.epub.exists():
+            sys.exit(f"Corpus EPUB not found: {args.epub}")
+        aggregated = aggregate(args.epub)
+        filtered = filter_records(aggregated, args.min_total, args.min_dominance)
+        args.output.write_text(json.dumps(filtered, ensure_ascii=False, indent=2))
+        print(f"Wrote {len(filtered)} entries to {args.output}")
+    elif not args.output.exists():
+        sys.exit(f"Readings JSON not found: {args.output}")
+    count = write_index(args.output, index_output)
+    print(f"Wrote {count} indexed bases to {index_output}")
 
 
 if __name__ == "__main__":
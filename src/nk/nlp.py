@@ -1,18 +1,27 @@
 from __future__ import annotations
 
+import importlib.util
+import os
 import shlex
-import unicodedata
+import threading
 import warnings
 import re
-from dataclasses import dataclass
-from typing import Callable, Optional
-
-from .deps import get_unidic_dicdir
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional
+
+from .chars import contains_cjk, hiragana_to_katakana, is_cjk_char, normalize_katakana
+from .deps import UNIDIC_VERSION, get_unidic_dicdir
 from .pitch import PitchToken
 
 __all__ = [
     "NLPBackend",
+    "NLPBackendPool",
     "NLPBackendUnavailableError",
+    "load_backend",
+    "shared_backend_pool",
 ]
 
 
@@ -20,54 +29,6 @@ class NLPBackendUnavailableError(RuntimeError):
     """Raised when the optional NLP backend cannot be initialized."""
 
 
-def _is_cjk_char(ch: str) -> bool:
-    if not ch:
-        return False
-    code = ord(ch)
-    return (
-        0x4E00 <= code <= 0x9FFF
-        or 0x3400 <= code <= 0x4DBF
-        or 0x20000 <= code <= 0x2A6DF
-        or 0x2A700 <= code <= 0x2B73F
-        or 0x2B740 <= code <= 0x2B81F
-        or 0x2B820 <= code <= 0x2CEAF
-        or 0x2CEB0 <= code <= 0x2EBEF
-        or 0x30000 <= code <= 0x3134F
-        or 0xF900 <= code <= 0xFAFF
-        or 0x2F800 <= code <= 0x2FA1F
-        or ch in "々〆ヵヶ"
-    )
-
-
-def _contains_cjk(text: str) -> bool:
-    return any(_is_cjk_char(ch) for ch in text)
-
-
-def _hiragana_to_katakana(text: str) -> str:
-    result = []
-    for ch in text:
-        code = ord(ch)
-        if 0x3041 <= code <= 0x3096:
-            result.append(chr(code + 0x60))
-        elif ch == "ゝ":
-            result.append("ヽ")
-        elif ch == "ゞ":
-            result.append("ヾ")
-        elif ch == "ゟ":
-            result.append("ヿ")
-        else:
-            result.append(ch)
-    return "".join(result)
-
-
-def _normalize_katakana(text: str) -> str:
-    text = unicodedata.normalize("NFKC", text)
-    text = text.replace("ヂ", "ジ").replace("ヅ", "ズ")
-    text = text.replace("ヮ", "ワ").replace("ヵ", "カ").replace("ヶ", "ケ")
-    text = text.replace("ゕ", "カ").replace("ゖ", "ケ")
-    return text
-
-
 HONORIFIC_PREFIX_SET = {"お", "御", "ご"}
 HONORIFIC_SUFFIX_SET = {
     "さん",
@@ -134,7 +95,25 @@ _OTHER_PREVIOUS_HINTS = {
 }
 
 
-@dataclass
+# Inputs up to this many characters (bases, suffix probes, titles, gap
+# segments) are memoized per backend; chapter-length text is not.
+_TOKEN_CACHE_MAX_TEXT = 32
+_TOKEN_CACHE_SIZE = 32_768
+
+# Text longer than this is tagged in windows of about this many
+# characters, re-tagging the last _TOKENIZE_OVERLAP characters of each
+# window so runs can be stitched where they agree.
+_TOKENIZE_WINDOW = 20_000
+_TOKENIZE_OVERLAP = 512
+
+_KAKASI_MISSING = "Advanced mode requires 'pykakasi' for fallback readings."
+
+# Fallback readings of single kanji, per dictionary and shared by every
+# backend in the process. Entries never change once computed.
+_CHAR_READINGS: dict[str, dict[str, str]] = {}
+
+
+@dataclass(slots=True)
 class _Token:
     surface: str
     reading: str
@@ -145,6 +124,79 @@ class _Token:
     pos: str | None
 
 
+class _Morpheme(NamedTuple):
+    """
+    Tagger output for one node, copied out of the MeCab lattice.
+
+    A tuple of plain values, so the collector stops tracking it and a
+    window's worth of morphemes adds nothing to collection passes.
+    """
+
+    surface: str
+    start: int
+    reading: str
+    lemma: str | None
+    pos: str | None
+    accent_type: int | None
+    accent_connection: str | None
+
+
+def _stitch_point(
+    previous: list[_Morpheme],
+    restart: int,
+    following: list[_Morpheme],
+) -> tuple[int, int]:
+    """
+    Find where a re-tagged window agrees with the run it overlaps.
+
+    ``following`` was tagged from ``previous[restart].start``. Returns
+    ``(cut, resume)`` such that ``previous[:cut] + following[resume:]`` is
+    the stitched sequence: the first position after the restart where both
+    runs produce the same two consecutive morphemes. Runs that never agree
+    are cut at the restart point.
+    """
+    i, j = restart + 1, 1
+    while i < len(previous) and j < len(following):
+        ours, theirs = previous[i], following[j]
+        if ours.start < theirs.start:
+            i += 1
+        elif theirs.start < ours.start:
+            j += 1
+        else:
+            if ours == theirs and previous[i - 1] == following[j - 1]:
+                return i, j
+            i += 1
+            j += 1
+    return restart, 0
+
+
+def _dictionary_identity(dicdir: Path | None) -> str:
+    """
+    Describe the dictionary a tagger was built from, for keying derived caches.
+
+    The version marker shipped with UniDic builds is preferred; custom builds
+    without one are identified by path and the size/mtime of ``sys.dic``.
+    """
+    if dicdir is None:
+        return "mecab-default"
+    version = None
+    try:
+        version = (dicdir / "version").read_text(encoding="utf-8").strip() or None
+    except OSError:
+        pass
+    if version is None and UNIDIC_VERSION in dicdir.as_posix():
+        version = UNIDIC_VERSION
+    identity = f"unidic:{version or 'unknown'}:{dicdir.resolve()}"
+    if version is None:
+        try:
+            stat = (dicdir / "sys.dic").stat()
+        except OSError:
+            pass
+        else:
+            identity += f":{stat.st_size}:{stat.st_mtime_ns}"
+    return identity
+
+
 class NLPBackend:
     """Fugashi-based backend for reading verification and kana conversion."""
 
@@ -177,7 +229,28 @@ class NLPBackend:
                 stacklevel=2,
             )
             self._tagger = Tagger()
-        self._kakasi_converter = self._build_kakasi_converter()
+        self.dictionary_id = _dictionary_identity(dicdir)
+        if importlib.util.find_spec("pykakasi") is None:
+            raise NLPBackendUnavailableError(_KAKASI_MISSING)
+        # pykakasi loads its dictionaries on construction (most of the
+        # backend's startup), so it is built only once a character needs it.
+        self._kakasi_converter: Optional[Callable[[str], str]] = None
+        self._char_readings = _CHAR_READINGS.setdefault(self.dictionary_id, {})
+        self._init_token_cache()
+
+    def _init_token_cache(self) -> None:
+        self._token_cache: OrderedDict[str, tuple[_Token, ...]] = OrderedDict()
+        self._token_cache_hits = 0
+        self._token_cache_misses = 0
+
+    def token_cache_stats(self) -> dict[str, int]:
+        """Hits, misses and current size of the short-input tokenization cache."""
+        return {
+            "hits": self._token_cache_hits,
+            "misses": self._token_cache_misses,
+            "size": len(self._token_cache),
+            "max_size": _TOKEN_CACHE_SIZE,
+        }
 
     def reading_variants(self, text: str) -> set[str]:
         tokens = self._tokenize(text)
@@ -185,116 +258,215 @@ class NLPBackend:
             return set()
         pieces: list[str] = []
         for token in tokens:
-            if _contains_cjk(token.surface):
+            if contains_cjk(token.surface):
                 pieces.append(token.reading)
             else:
                 pieces.append(token.surface)
         reading = "".join(pieces)
-        return {_normalize_katakana(reading)}
+        return {normalize_katakana(reading)}
 
     def to_reading_text(self, text: str) -> str:
-        tokens = self._tokenize(text)
-        if not tokens:
-            return text
         pieces: list[str] = []
         pos = 0
-        for token in tokens:
+        for token in self._token_stream(text):
             if token.start > pos:
                 pieces.append(text[pos:token.start])
-            if _contains_cjk(token.surface):
+            if contains_cjk(token.surface):
                 pieces.append(token.reading)
             else:
                 pieces.append(token.surface)
             pos = token.end
+        if not pieces:
+            return text
         if pos < len(text):
             pieces.append(text[pos:])
         result = "".join(pieces)
-        return _normalize_katakana(result)
+        return normalize_katakana(result)
 
     def tokenize(self, text: str) -> list[_Token]:
-        return self._tokenize(text)
+        tokens = self._tokenize(text)
+        if len(text) > _TOKEN_CACHE_MAX_TEXT:
+            return tokens
+        # Short inputs are served from the cache; callers get their own copies.
+        return [replace(token) for token in tokens]
+
+    def iter_tokens(self, text: str) -> Iterator[_Token]:
+        """
+        Yield the tokens of ``text`` in order, as :meth:`tokenize` returns them.
+
+        Text longer than ``_TOKENIZE_WINDOW`` characters is tagged a window
+        at a time, so MeCab nodes and tokens for the whole text are never
+        held at once.
+        """
+        if len(text) <= _TOKEN_CACHE_MAX_TEXT:
+            return iter(self.tokenize(text))
+        return self._iter_tokens(text)
+
+    def tokenize_many(self, texts: Iterable[str]) -> list[list[_Token]]:
+        """Tokenize each of ``texts``; the result lists line up with the inputs."""
+        return [self.tokenize(text) for text in texts]
+
+    def to_reading_text_many(self, texts: Iterable[str]) -> list[str]:
+        """
+        Convert each of ``texts`` like :meth:`to_reading_text`.
+
+        Every input is tagged on its own so readings never depend on the
+        neighbouring entries; repeated inputs are converted once.
+        """
+        converted: dict[str, str] = {}
+        readings: list[str] = []
+        for text in texts:
+            reading = converted.get(text)
+            if reading is None:
+                reading = converted[text] = self.to_reading_text(text)
+            readings.append(reading)
+        return readings
 
     def _tokenize(self, text: str) -> list[_Token]:
-        tokens: list[_Token] = []
+        """
+        Tokenize ``text``, memoizing short inputs in a bounded LRU.
+
+        Cached tokens are shared between calls and must not be mutated.
+        """
+        if not text or len(text) > _TOKEN_CACHE_MAX_TEXT:
+            return self._tokenize_uncached(text)
+        cache = self._token_cache
+        cached = cache.get(text)
+        if cached is not None:
+            self._token_cache_hits += 1
+            cache.move_to_end(text)
+            return list(cached)
+        self._token_cache_misses += 1
+        tokens = self._tokenize_uncached(text)
+        cache[text] = tuple(tokens)
+        if len(cache) > _TOKEN_CACHE_SIZE:
+            cache.popitem(last=False)
+        return tokens
+
+    def _token_stream(self, text: str) -> Iterable[_Token]:
+        """Read-only tokens of ``text``: cached for short input, streamed otherwise."""
+        if len(text) <= _TOKEN_CACHE_MAX_TEXT:
+            return self._tokenize(text)
+        return self._iter_tokens(text)
+
+    def _tokenize_uncached(self, text: str) -> list[_Token]:
         if not text:
-            return tokens
-        raw_tokens = list(self._tagger(text))
-        pos = 0
+            return []
+        return list(self._iter_tokens(text))
+
+    def _iter_tokens(self, text: str) -> Iterator[_Token]:
         previous_surface = ""
         previous_reading = ""
         previous_lemma = ""
-        for idx, raw in enumerate(raw_tokens):
-            surface = raw.surface
-            if not surface:
-                continue
-            start = text.find(surface, pos)
-            if start == -1:
-                start = pos
-            if start > pos:
-                pos = start
-            next_surface = ""
-            if idx + 1 < len(raw_tokens):
-                next_surface = raw_tokens[idx + 1].surface
-            reading = self._reading_for_token(
-                raw,
-                surface,
-                previous_surface,
-                previous_lemma,
-                next_surface,
-                previous_reading,
-            )
-            end = start + len(surface)
-            accent_type = self._extract_accent_type(raw)
-            accent_connection = self._extract_accent_connection(raw)
-            pos_label = self._extract_pos(raw)
-            tokens.append(
-                _Token(
+        # Length of the all-digit tokens right before the current one.
+        digit_run = 0
+        morphemes = self._iter_morphemes(text)
+        current = next(morphemes, None)
+        while current is not None:
+            following = next(morphemes, None)
+            surface = current.surface
+            if surface:
+                next_surface = following.surface if following is not None else ""
+                reading = self._reading_for_token(
+                    current.reading,
+                    surface,
+                    current.lemma,
+                    current.pos,
+                    previous_surface,
+                    previous_lemma,
+                    next_surface,
+                    previous_reading,
+                )
+                token = _Token(
                     surface=surface,
                     reading=reading,
-                    start=start,
-                    end=end,
-                    accent_type=accent_type,
-                    accent_connection=accent_connection,
-                    pos=pos_label,
+                    start=current.start,
+                    end=current.start + len(surface),
+                    accent_type=current.accent_type,
+                    accent_connection=current.accent_connection,
+                    pos=current.pos,
                 )
-            )
-            pos = end
-            if _contains_cjk(surface) and reading:
-                previous_surface = surface
-                previous_reading = reading
-                previous_lemma = self._extract_lemma(raw) or surface
-            else:
+                # A 日 after a number of two or more digits is the day
+                # counter (ニチ), not the カ of 一日 to 十日.
+                if (
+                    surface == "日"
+                    and digit_run >= 2
+                    and reading
+                    and normalize_katakana(reading) == "カ"
+                ):
+                    token.reading = "ニチ"
+                digit_run = digit_run + len(surface) if surface.isdigit() else 0
                 previous_surface = surface
-                previous_reading = ""
-                previous_lemma = self._extract_lemma(raw) or surface
-        self._adjust_day_suffix_tokens(tokens)
-        return tokens
-
-    def _adjust_day_suffix_tokens(self, tokens: list[_Token]) -> None:
-        if not tokens:
+                previous_reading = reading if reading and contains_cjk(surface) else ""
+                previous_lemma = current.lemma or surface
+                yield token
+            current = following
+
+    def _iter_morphemes(self, text: str) -> Iterator[_Morpheme]:
+        if len(text) <= _TOKENIZE_WINDOW:
+            yield from self._tag(text, 0)
             return
-        for idx, token in enumerate(tokens):
-            if token.surface != "日":
+        window_start = 0
+        morphemes, end = self._tag_window(text, window_start)
+        while end < len(text):
+            # Re-tag from a boundary inside the overlap; MeCab's choices near
+            # a window edge depend on what lies past it, so the old run is
+            # trusted until both runs agree again.
+            restart = len(morphemes) - 1
+            while restart > 0 and morphemes[restart].start > end - _TOKENIZE_OVERLAP:
+                restart -= 1
+            if restart == 0 or morphemes[restart].start <= window_start:
+                # A single morpheme spans the overlap; cut at the window end.
+                yield from morphemes
+                window_start = end
+                morphemes, end = self._tag_window(text, window_start)
                 continue
-            reading = token.reading
-            if not reading or _normalize_katakana(reading) != "カ":
-                continue
-            digit_run = 0
-            j = idx - 1
-            while j >= 0:
-                prev_surface = tokens[j].surface
-                if prev_surface and all(ch.isdigit() for ch in prev_surface):
-                    digit_run += len(prev_surface)
-                    j -= 1
-                    continue
-                break
-            if digit_run >= 2:
-                token.reading = "ニチ"
+            window_start = morphemes[restart].start
+            following, end = self._tag_window(text, window_start)
+            cut, resume = _stitch_point(morphemes, restart, following)
+            yield from morphemes[:cut]
+            morphemes = following[resume:]
+        yield from morphemes
+
+    def _tag_window(self, text: str, start: int) -> tuple[list[_Morpheme], int]:
+        end = min(len(text), start + _TOKENIZE_WINDOW)
+        if end < len(text):
+            newline = text.rfind("\n", start + _TOKENIZE_WINDOW // 2, end)
+            if newline != -1:
+                end = newline + 1
+        return self._tag(text[start:end], start), end
+
+    def _tag(self, text: str, offset: int) -> list[_Morpheme]:
+        """
+        Run the tagger over ``text`` and copy out what tokenization needs.
+
+        fugashi reads node features lazily from MeCab's lattice, which the
+        next tagger call reuses, so no node may outlive this call.
+        """
+        morphemes: list[_Morpheme] = []
+        pos = 0
+        for raw in self._tagger(text):
+            surface = raw.surface
+            start = pos
+            if surface:
+                start = text.find(surface, pos)
+                if start == -1:
+                    start = pos
+                pos = start + len(surface)
+            morphemes.append(
+                _Morpheme(
+                    surface=surface,
+                    start=offset + start,
+                    reading=self._extract_reading(raw),
+                    lemma=self._extract_lemma(raw),
+                    pos=self._extract_pos(raw),
+                    accent_type=self._extract_accent_type(raw),
+                    accent_connection=self._extract_accent_connection(raw),
+                )
+            )
+        return morphemes
 
     def to_reading_with_pitch(self, text: str) -> tuple[str, list[PitchToken]]:
-        tokens = self._tokenize(text)
-        if not tokens:
-            return text, []
         pieces: list[str] = []
         pitch_tokens: list[PitchToken] = []
         pos = 0
@@ -309,12 +481,14 @@ class NLPBackend:
             out_pos += len(normalized_fragment)
             return normalized_fragment
 
-        for token in tokens:
+        seen_tokens = False
+        for token in self._token_stream(text):
+            seen_tokens = True
             if token.start > pos:
                 gap = text[pos:token.start]
                 _append_piece(gap)
-            segment = token.reading if _contains_cjk(token.surface) else token.surface
-            segment = _normalize_katakana(segment)
+            segment = token.reading if contains_cjk(token.surface) else token.surface
+            segment = normalize_katakana(segment)
             if segment:
                 start_out = out_pos
                 normalized_segment = _append_piece(segment)
@@ -323,7 +497,7 @@ class NLPBackend:
                 start_out = out_pos
                 end_out = out_pos
                 normalized_segment = segment
-            if _contains_cjk(token.surface) and token.reading:
+            if contains_cjk(token.surface) and token.reading:
                 pitch_tokens.append(
                     PitchToken(
                         surface=token.surface,
@@ -337,21 +511,24 @@ class NLPBackend:
                     )
                 )
             pos = token.end
+        if not seen_tokens:
+            return text, []
         if pos < len(text):
             _append_piece(text[pos:])
-        reading = _normalize_katakana("".join(pieces))
+        reading = normalize_katakana("".join(pieces))
         return reading, pitch_tokens
 
     def _reading_for_token(
         self,
-        token,
+        dictionary_reading: str,
         surface: str,
+        lemma: str | None,
+        pos_label: str | None,
         previous_surface: str,
         previous_lemma: str,
         next_surface: str,
         previous_reading: str,
     ) -> str:
-        lemma = self._extract_lemma(token)
         cleaned_surface = surface.strip()
         base = lemma or cleaned_surface
         if base in HONORIFIC_OVERRIDES and next_surface in HONORIFIC_SUFFIX_SET:
@@ -367,9 +544,8 @@ class NLPBackend:
             and cleaned_surface in HONORIFIC_SUFFIX_REPLACEMENTS
         ):
             return HONORIFIC_SUFFIX_REPLACEMENTS[cleaned_surface]
-        reading = self._extract_reading(token)
-        if reading and not _contains_cjk(reading):
-            pos_label = self._extract_pos(token)
+        reading = dictionary_reading
+        if reading and not contains_cjk(reading):
             override = self._resolve_contextual_override(
                 base,
                 pos_label,
@@ -384,7 +560,7 @@ class NLPBackend:
         # Fallback: break surface into characters and resolve individually.
         chars: list[str] = []
         for ch in surface:
-            if _is_cjk_char(ch):
+            if is_cjk_char(ch):
                 if ch == "々" and previous_reading:
                     chars.append(previous_reading)
                 else:
@@ -433,7 +609,7 @@ class NLPBackend:
         normalized_next = (next_surface or "").strip()
         if not normalized_next:
             return True
-        if not _contains_cjk(normalized_next):
+        if not contains_cjk(normalized_next):
             return True
         normalized_prev_surface = (previous_surface or "").strip()
         normalized_prev_lemma = (previous_lemma or "").strip()
@@ -454,15 +630,23 @@ class NLPBackend:
         return base_reading
 
     def _reading_for_char(self, ch: str) -> str:
+        reading = self._char_readings.get(ch)
+        if reading is None:
+            reading = self._char_readings[ch] = self._lookup_char_reading(ch)
+        return reading
+
+    def _lookup_char_reading(self, ch: str) -> str:
         # Try re-tokenizing the single character to get dictionary reading.
         for raw in self._tagger(ch):
             reading = self._extract_reading(raw)
-            if reading and not _contains_cjk(reading):
+            if reading and not contains_cjk(reading):
                 return reading
+        if self._kakasi_converter is None:
+            self._kakasi_converter = self._build_kakasi_converter()
         if self._kakasi_converter is not None:
             converted = self._kakasi_converter(ch)
             if converted:
-                return _normalize_katakana(_hiragana_to_katakana(converted))
+                return normalize_katakana(hiragana_to_katakana(converted))
         return ch
 
     def _extract_reading(self, token) -> str:
@@ -484,7 +668,7 @@ class NLPBackend:
                 break
         if not value:
             return ""
-        return _normalize_katakana(_hiragana_to_katakana(str(value)))
+        return normalize_katakana(hiragana_to_katakana(str(value)))
 
     def _extract_lemma(self, token) -> str | None:
         feature = getattr(token, "feature", None)
@@ -555,9 +739,7 @@ class NLPBackend:
         try:
             from pykakasi import kakasi  # type: ignore
         except ImportError as exc:
-            raise NLPBackendUnavailableError(
-                "Advanced mode requires 'pykakasi' for fallback readings."
-            ) from exc
+            raise NLPBackendUnavailableError(_KAKASI_MISSING) from exc
 
         with warnings.catch_warnings():
             warnings.filterwarnings("ignore", category=DeprecationWarning)
@@ -577,6 +759,139 @@ class NLPBackend:
             return str(result)
 
         return _convert
+
+
+_BACKEND_POOL_SIZE_ENV = "NK_NLP_POOL_SIZE"
+_DEFAULT_BACKEND_POOL_SIZE = 2
+_MAX_BACKEND_POOL_SIZE = 8
+
+
+def _backend_pool_size(size: int | None) -> int:
+    if size is None:
+        size = _DEFAULT_BACKEND_POOL_SIZE
+        env_size = os.getenv(_BACKEND_POOL_SIZE_ENV)
+        if env_size:
+            try:
+                parsed = int(env_size)
+            except ValueError:
+                parsed = 0
+            if parsed > 0:
+                size = parsed
+    return max(1, min(size, _MAX_BACKEND_POOL_SIZE))
+
+
+class NLPBackendPool:
+    """
+    Thread-safe pool of warm :class:`NLPBackend` instances.
+
+    Backends are built on demand up to ``size`` (``NK_NLP_POOL_SIZE``,
+    default 2) and reused afterwards, so callers skip the tagger and
+    pykakasi setup. A backend is only ever used by one borrower at a time;
+    when all of them are checked out, :meth:`borrow` waits for one to be
+    returned.
+    """
+
+    def __init__(
+        self,
+        size: int | None = None,
+        factory: Callable[[], NLPBackend] | None = None,
+    ) -> None:
+        self.size = _backend_pool_size(size)
+        self._factory = factory or load_backend
+        self._idle: list[NLPBackend] = []
+        self._created = 0
+        self._condition = threading.Condition()
+
+    @contextmanager
+    def borrow(self) -> Iterator[NLPBackend]:
+        backend = self._checkout()
+        try:
+            yield backend
+        finally:
+            with self._condition:
+                self._idle.append(backend)
+                self._condition.notify()
+
+    def warm(self, count: int | None = None) -> None:
+        """Build idle backends until ``count`` (default: ``size``) exist."""
+        target = self.size if count is None else max(0, min(count, self.size))
+        while True:
+            with self._condition:
+                if self._created >= target:
+                    return
+                self._created += 1
+            backend = self._build()
+            with self._condition:
+                self._idle.append(backend)
+                self._condition.notify()
+
+    def warm_in_background(self, count: int | None = None) -> threading.Thread:
+        """
+        Run :meth:`warm` on a daemon thread.
+
+        A backend that cannot be built is not reported here; the first
+        :meth:`borrow` raises the error instead.
+        """
+
+        def _warm() -> None:
+            try:
+                self.warm(count)
+            except NLPBackendUnavailableError:
+                pass
+
+        thread = threading.Thread(target=_warm, name="nk-nlp-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def _checkout(self) -> NLPBackend:
+        with self._condition:
+            while not self._idle and self._created >= self.size:
+                self._condition.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._created += 1
+        return self._build()
+
+    def _build(self) -> NLPBackend:
+        # The tagger is loaded outside the lock so borrowers of already
+        # warm backends are not held up.
+        try:
+            return self._factory()
+        except BaseException:
+            with self._condition:
+                self._created -= 1
+                self._condition.notify()
+            raise
+
+
+def load_backend() -> NLPBackend:
+    """
+    Return a backend for this process.
+
+    When an ``nk nlpd`` service is listening, the result is a thin client
+    that tokenizes through it; otherwise the tagger is loaded in-process.
+    """
+    from .nlpd import connect_service
+
+    client = connect_service()
+    if client is not None:
+        return client
+    return NLPBackend()
+
+
+_SHARED_POOL: NLPBackendPool | None = None
+_SHARED_POOL_LOCK = threading.Lock()
+
+
+def shared_backend_pool() -> NLPBackendPool:
+    """Return the process-wide :class:`NLPBackendPool`."""
+    global _SHARED_POOL
+    with _SHARED_POOL_LOCK:
+        if _SHARED_POOL is None:
+            _SHARED_POOL = NLPBackendPool()
+        return _SHARED_POOL
+
+
 _ELLIPSIS_DOTS = re.compile(r"\.{3,}")
 _ELLIPSIS_REPEAT = re.compile(r"…{2,}")
 
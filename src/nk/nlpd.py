@@ -0,0 +1,427 @@
+"""
+Local tokenization service shared by nk processes (``nk nlpd``).
+
+The service owns a pool of warm UniDic taggers together with their
+tokenization caches, and warms the on-disk corpus reading mapping once at
+startup. Clients talk to it over a Unix socket with one JSON object per
+line:
+
+    {"op": "hello"}                -> protocol, nk version, dictionary id
+    {"op": "tokenize", "texts": [...]}  -> one token row list per text
+    {"op": "stream", "text": "..."}     -> {"rows": [...]} lines, then {"done": true}
+
+Chapter-length text is streamed a chunk of rows at a time over its own
+connection, so neither side holds a whole chapter's tokens.
+
+:func:`nk.nlp.load_backend` returns a :class:`NLPServiceClient` when the
+socket answers and speaks the same nk version, so ``nk play``, its reader
+companion and their upload jobs stop loading a tagger each. ``--jobs``
+chapter and book workers keep in-process taggers so their parallelism is
+not limited by the service's pool.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import socket
+import socketserver
+import threading
+import warnings
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from .core import _corpus_reading_mapping, _nk_cache_dir, _nk_version
+from .nlp import _TOKEN_CACHE_MAX_TEXT, NLPBackend, NLPBackendPool, _Token, _TOKENIZE_WINDOW
+
+__all__ = [
+    "NLPService",
+    "NLPServiceClient",
+    "connect_service",
+    "service_socket_path",
+    "start_service",
+]
+
+_SOCKET_ENV = "NK_NLPD_SOCKET"
+_SOCKET_FILENAME = "nlpd.sock"
+_PROTOCOL = 2
+_CONNECT_TIMEOUT = 1.0
+# Texts per request when a client prefetches a batch; longer texts are streamed.
+_REQUEST_BATCH = 512
+_REQUEST_CHARS = _TOKENIZE_WINDOW
+# Token rows per line of a streamed response.
+_STREAM_ROWS = 1024
+
+
+def service_socket_path() -> Path:
+    """Socket path from ``NK_NLPD_SOCKET``, else ``nlpd.sock`` in the nk cache dir."""
+    env_path = os.environ.get(_SOCKET_ENV)
+    if env_path:
+        return Path(env_path).expanduser()
+    return _nk_cache_dir() / _SOCKET_FILENAME
+
+
+def _encode(message: object) -> bytes:
+    return json.dumps(message, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _token_row(token: _Token) -> list[object]:
+    return [
+        token.surface,
+        token.reading,
+        token.start,
+        token.end,
+        token.accent_type,
+        token.accent_connection,
+        token.pos,
+    ]
+
+
+def _token_from_row(row: list[object]) -> _Token:
+    surface, reading, start, end, accent_type, accent_connection, pos = row
+    return _Token(
+        surface=surface,
+        reading=reading,
+        start=start,
+        end=end,
+        accent_type=accent_type,
+        accent_connection=accent_connection,
+        pos=pos,
+    )
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: NLPService
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.connections_lock:
+            self.server.connections.add(self.request)
+
+    def finish(self) -> None:
+        with self.server.connections_lock:
+            self.server.connections.discard(self.request)
+        super().finish()
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                if isinstance(request, dict) and request.get("op") == "stream":
+                    self._stream(request)
+                    continue
+                response = {"ok": True, "result": self.server.dispatch(request)}
+            except OSError:
+                # The client went away mid-response.
+                return
+            except Exception as exc:
+                response = _error_response(exc)
+            try:
+                self._send(response)
+            except OSError:
+                return
+
+    def _stream(self, request: dict[str, object]) -> None:
+        try:
+            # Closing the generator returns the borrowed tagger even when
+            # the client hangs up halfway.
+            with closing(self.server.stream(request)) as chunks:
+                for rows in chunks:
+                    self._send({"ok": True, "rows": rows})
+        except OSError:
+            raise
+        except Exception as exc:
+            self._send(_error_response(exc))
+            return
+        self._send({"ok": True, "done": True})
+
+    def _send(self, response: dict[str, object]) -> None:
+        self.wfile.write(_encode(response))
+        self.wfile.flush()
+
+
+def _error_response(exc: Exception) -> dict[str, object]:
+    return {"ok": False, "error": f"{exc.__class__.__name__}: {exc}"}
+
+
+class NLPService(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix-socket server answering tokenization requests from a backend pool."""
+
+    daemon_threads = True
+
+    def __init__(self, path: Path, pool: NLPBackendPool, dictionary_id: str) -> None:
+        self.path = path
+        self.pool = pool
+        self.dictionary_id = dictionary_id
+        self.connections: set[socket.socket] = set()
+        self.connections_lock = threading.Lock()
+        super().__init__(str(path), _RequestHandler)
+
+    def dispatch(self, request: dict[str, object]) -> object:
+        op = request.get("op")
+        if op == "hello":
+            return {
+                "protocol": _PROTOCOL,
+                "version": _nk_version(),
+                "dictionary_id": self.dictionary_id,
+                "pid": os.getpid(),
+            }
+        if op == "tokenize":
+            texts = request.get("texts")
+            if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+                raise ValueError("texts must be a list of strings.")
+            with self.pool.borrow() as backend:
+                return [[_token_row(token) for token in backend._tokenize(text)] for text in texts]
+        raise ValueError(f"Unknown op: {op!r}")
+
+    def stream(self, request: dict[str, object]) -> Iterator[list[list[object]]]:
+        """Yield the token rows of ``request["text"]`` a chunk at a time."""
+        text = request.get("text")
+        if not isinstance(text, str):
+            raise ValueError("text must be a string.")
+        with self.pool.borrow() as backend:
+            tokens = iter(backend._token_stream(text))
+            while chunk := [_token_row(token) for token in itertools.islice(tokens, _STREAM_ROWS)]:
+                yield chunk
+
+    def close(self) -> None:
+        """Stop listening, drop open client connections and remove the socket."""
+        self.server_close()
+        with self.connections_lock:
+            connections = list(self.connections)
+        for connection in connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def start_service(path: Path | None = None, *, pool_size: int | None = None) -> NLPService:
+    """
+    Warm the taggers and the corpus mapping, then bind the service socket.
+
+    Raises RuntimeError when another service already answers on ``path``;
+    a stale socket file left by a crashed service is replaced.
+    """
+    path = path or service_socket_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists():
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        probe.settimeout(_CONNECT_TIMEOUT)
+        try:
+            probe.connect(str(path))
+        except OSError:
+            path.unlink()
+        else:
+            raise RuntimeError(f"nk nlpd is already running at {path}")
+        finally:
+            probe.close()
+    # The service's own backends are always in-process.
+    pool = NLPBackendPool(pool_size, factory=NLPBackend)
+    pool.warm()
+    with pool.borrow() as backend:
+        dictionary_id = backend.dictionary_id
+        _corpus_reading_mapping(backend)
+    # Bind under a restrictive umask so the socket is never reachable by
+    # other users, not even between bind() and a chmod.
+    previous_umask = os.umask(0o177)
+    try:
+        service = NLPService(path, pool, dictionary_id)
+    finally:
+        os.umask(previous_umask)
+    return service
+
+
+class NLPServiceClient(NLPBackend):
+    """
+    :class:`NLPBackend` that tokenizes through a running ``nk nlpd``.
+
+    Readings, pitch tokens and the short-input cache come from the
+    ``NLPBackend`` methods; only tagging crosses the socket. If the service
+    goes away mid-run the client loads a tagger in-process and carries on.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._socket: socket.socket | None = None
+        self._stream = None
+        self._local: NLPBackend | None = None
+        self._prefetched: dict[str, list[_Token]] = {}
+        self._init_token_cache()
+        self._connect()
+        hello = self._request({"op": "hello"})
+        if hello.get("protocol") != _PROTOCOL or hello.get("version") != _nk_version():
+            self._disconnect()
+            raise ValueError(
+                f"nk nlpd at {path} runs nk {hello.get('version')}, not {_nk_version()}"
+            )
+        self.dictionary_id = hello["dictionary_id"]
+
+    def tokenize_many(self, texts: Iterable[str]) -> list[list[_Token]]:
+        texts = list(texts)
+        self._prefetch(texts)
+        try:
+            return super().tokenize_many(texts)
+        finally:
+            self._prefetched.clear()
+
+    def to_reading_text_many(self, texts: Iterable[str]) -> list[str]:
+        texts = list(texts)
+        self._prefetch(texts)
+        try:
+            return super().to_reading_text_many(texts)
+        finally:
+            self._prefetched.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            self._disconnect()
+
+    def _iter_tokens(self, text: str) -> Iterator[_Token]:
+        if len(text) > _REQUEST_CHARS:
+            return self._stream_tokens(text)
+        return iter(self._tokenize_uncached(text))
+
+    def _tokenize_uncached(self, text: str) -> list[_Token]:
+        tokens = self._prefetched.pop(text, None)
+        if tokens is not None:
+            return tokens
+        if not text:
+            return []
+        if len(text) > _REQUEST_CHARS:
+            return list(self._stream_tokens(text))
+        return self._remote_tokenize([text])[0]
+
+    def _prefetch(self, texts: list[str]) -> None:
+        """Tag the uncached entries of a batch in as few round trips as possible."""
+        cache = self._token_cache
+        missing = dict.fromkeys(
+            text
+            for text in texts
+            if text
+            and len(text) <= _REQUEST_CHARS
+            and not (len(text) <= _TOKEN_CACHE_MAX_TEXT and text in cache)
+        )
+        chunk: list[str] = []
+        chunk_chars = 0
+        for text in missing:
+            if chunk and (len(chunk) >= _REQUEST_BATCH or chunk_chars + len(text) > _REQUEST_CHARS):
+                self._prefetched.update(zip(chunk, self._remote_tokenize(chunk)))
+                chunk, chunk_chars = [], 0
+            chunk.append(text)
+            chunk_chars += len(text)
+        if chunk:
+            self._prefetched.update(zip(chunk, self._remote_tokenize(chunk)))
+
+    def _stream_tokens(self, text: str) -> Iterator[_Token]:
+        """
+        Yield the tokens of a long text as the service streams them.
+
+        Each stream gets its own connection, so other requests made while
+        it is being consumed never interleave with it.
+        """
+        yielded = 0
+        if self._local is None:
+            try:
+                sock = self._open_socket()
+            except OSError as exc:
+                self._lose_service(exc)
+            else:
+                try:
+                    with sock, sock.makefile("rwb") as stream:
+                        stream.write(_encode({"op": "stream", "text": text}))
+                        stream.flush()
+                        while True:
+                            result = _read_response(stream)
+                            if result.get("done"):
+                                return
+                            for row in result["rows"]:
+                                yield _token_from_row(row)
+                                yielded += 1
+                except (OSError, ValueError) as exc:
+                    self._lose_service(exc)
+        # Tagging is deterministic, so the local run resumes where the
+        # service stopped.
+        yield from itertools.islice(self._local._iter_tokens(text), yielded, None)
+
+    def _remote_tokenize(self, texts: list[str]) -> list[list[_Token]]:
+        if self._local is None:
+            try:
+                rows = self._request({"op": "tokenize", "texts": texts})
+                return [[_token_from_row(row) for row in token_rows] for token_rows in rows]
+            except (OSError, ValueError) as exc:
+                self._lose_service(exc)
+        return [self._local._tokenize_uncached(text) for text in texts]
+
+    def _lose_service(self, exc: Exception) -> None:
+        warnings.warn(
+            f"nk nlpd unavailable ({exc}); tokenizing in-process.",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+        self.close()
+        if self._local is None:
+            self._local = NLPBackend()
+
+    def _open_socket(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(_CONNECT_TIMEOUT)
+        try:
+            sock.connect(str(self.path))
+        except OSError:
+            sock.close()
+            raise
+        # Chapter-length requests may wait for a free tagger; no read timeout.
+        sock.settimeout(None)
+        return sock
+
+    def _connect(self) -> None:
+        self._socket = self._open_socket()
+        self._stream = self._socket.makefile("rwb")
+
+    def _disconnect(self) -> None:
+        if self._stream is not None:
+            try:
+                self._stream.close()
+            except OSError:
+                pass
+            self._stream = None
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def _request(self, message: dict[str, object]) -> Any:
+        with self._lock:
+            if self._stream is None:
+                raise ConnectionError("not connected to nk nlpd")
+            self._stream.write(_encode(message))
+            self._stream.flush()
+            return _read_response(self._stream)["result"]
+
+
+def _read_response(stream) -> dict[str, Any]:
+    line = stream.readline()
+    if not line:
+        raise ConnectionError("nk nlpd closed the connection")
+    response = json.loads(line)
+    if not response.get("ok"):
+        raise ValueError(response.get("error") or "nk nlpd request failed")
+    return response
+
+
+def connect_service(path: Path | None = None) -> NLPServiceClient | None:
+    """Return a client for the service at ``path``, or None when none answers."""
+    path = path or service_socket_path()
+    if not path.exists():
+        return None
+    try:
+        return NLPServiceClient(path)
+    except (OSError, ValueError, KeyError):
+        return None
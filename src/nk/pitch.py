@@ -7,7 +7,7 @@ __all__ = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class PitchToken:
     surface: str
     reading: str
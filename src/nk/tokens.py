@@ -13,7 +13,7 @@ __all__ = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class ChapterToken:
     """
     Canonical representation of a kanji/ruby span inside the original text.
@@ -28,6 +28,7 @@ from .book_io import (
     load_book_metadata,
     load_token_metadata,
 )
+from .chars import contains_ideograph
 from .pitch import PitchToken
 from .tokens import tokens_to_pitch_tokens
 
@@ -1315,24 +1316,6 @@ def _normalize_kana(text: str | None) -> str:
     return "".join(result)
 
 
-def _contains_kanji(text: str | None) -> bool:
-    if not text:
-        return False
-    for char in text:
-        code = ord(char)
-        if (
-            0x4E00 <= code <= 0x9FFF
-            or 0x3400 <= code <= 0x4DBF
-            or 0xF900 <= code <= 0xFAFF
-            or 0x20000 <= code <= 0x2A6DF
-            or 0x2A700 <= code <= 0x2B73F
-            or 0x2B740 <= code <= 0x2B81F
-            or 0x2B820 <= code <= 0x2CEAF
-        ):
-            return True
-    return False
-
-
 def _voicevox_accent_type_from_phrases(accent_phrases: object) -> int | None:
     if not isinstance(accent_phrases, list) or not accent_phrases:
         return None
@@ -1410,7 +1393,7 @@ def _enrich_pitch_tokens_with_voicevox(
             continue
         if not token.sources or "unidic" not in token.sources:
             continue
-        if not _contains_kanji(token.surface):
+        if not contains_ideograph(token.surface):
             continue
         normalized_reading = _normalize_kana(token.reading)
         if not normalized_reading:
@@ -11,9 +11,9 @@ from pathlib import Path
 from typing import Mapping
 from uuid import uuid4
 
-from .book_io import write_book_package
-from .core import epub_to_chapter_texts, get_epub_cover
-from .nlp import NLPBackend, NLPBackendUnavailableError
+from .book_io import load_previous_chapters, write_book_package
+from .core import EpubContainer, event_stage_seconds, iter_epub_chapters
+from .nlp import NLPBackendPool, NLPBackendUnavailableError, shared_backend_pool
 from .refine import OverrideRule, load_override_config, load_refine_config, refine_book
 
 _INVALID_BOOK_CHARS = set('<>:"/\\|?*')
@@ -119,6 +119,7 @@ class UploadJob:
         self.progress_total: int | None = None
         self.progress_label: str | None = None
         self.progress_event: str | None = None
+        self.stage_timings: dict[str, float] = {}
         self.book_dir_rel: str | None = None
         self.created_at = datetime.now(timezone.utc)
         self.updated_at = self.created_at
@@ -168,6 +169,13 @@ class UploadJob:
                 self.message = label
             self._touch()
 
+    def add_stage_timings(self, timings: Mapping[str, float]) -> None:
+        if not timings:
+            return
+        with self.lock:
+            for stage, seconds in timings.items():
+                self.stage_timings[stage] = self.stage_timings.get(stage, 0.0) + seconds
+
     def mark_success(self) -> None:
         with self.lock:
             if self.timed_out:
@@ -193,12 +201,15 @@ class UploadJob:
                     self.progress_label,
                     self.progress_event,
                 )
-            ):
+            ) or self.stage_timings:
                 progress_payload = {
                     "index": self.progress_index,
                     "total": self.progress_total,
                     "label": self.progress_label,
                     "event": self.progress_event,
+                    "timings": {
+                        stage: round(seconds, 3) for stage, seconds in self.stage_timings.items()
+                    },
                 }
             return {
                 "id": self.id,
@@ -230,8 +241,14 @@ class UploadJob:
 
 
 class UploadManager:
-    def __init__(self, root: Path, max_workers: int = 2) -> None:
+    def __init__(
+        self,
+        root: Path,
+        max_workers: int = 2,
+        backend_pool: NLPBackendPool | None = None,
+    ) -> None:
         self.root = root
+        self.backend_pool = backend_pool or shared_backend_pool()
         self.lock = threading.Lock()
         workers = max_workers
         env_workers = os.getenv("NK_UPLOAD_WORKERS")
@@ -293,13 +310,6 @@ class UploadManager:
 
     def _run_job(self, job: UploadJob) -> None:
         job.set_status("running", "Preparing upload…")
-        try:
-            backend = NLPBackend()
-        except NLPBackendUnavailableError as exc:
-            job.set_error(str(exc))
-            job.cleanup()
-            return
-
         chapter_total_hint: int | None = None
         total_steps: int | None = None
         completed_steps = 0
@@ -307,6 +317,9 @@ class UploadManager:
         def _progress_callback(event: Mapping[str, object]) -> None:
             nonlocal chapter_total_hint, total_steps
             try:
+                job.add_stage_timings(event_stage_seconds(event))
+                if event.get("event") == "stage_timing":
+                    return
                 total = event.get("total")
                 if not isinstance(total, int) or total <= 0:
                     total = None
@@ -338,30 +351,26 @@ class UploadManager:
 
         try:
             job.set_status("running", "Chapterizing…")
-            chapters, ruby_evidence = epub_to_chapter_texts(
-                str(job.temp_path),
+            # Each chapter is written as soon as it is finalized.
+            with self.backend_pool.borrow() as backend, EpubContainer(
+                job.temp_path
+            ) as epub, iter_epub_chapters(
+                epub,
                 nlp=backend,
                 progress=_progress_callback,
-            )
-            base_total = len(chapters) if chapters else (chapter_total_hint or 0)
+                previous=load_previous_chapters(job.output_dir),
+            ) as chapters:
+                package = write_book_package(
+                    job.output_dir,
+                    chapters,
+                    source_epub=job.temp_path,
+                    cover_image=epub.cover,
+                    ruby_evidence=chapters.ruby_evidence,
+                    apply_overrides=False,
+                )
+            chapter_count = len(package.chapter_records)
+            base_total = chapter_count if chapter_count else (chapter_total_hint or 0)
             total_steps = (base_total or 0) + 1  # writing step
-            completed_steps = base_total
-            job.update_progress(
-                completed_steps,
-                total_steps,
-                f"{job.book_label} · writing chapters…",
-                "writing",
-            )
-            job.set_status("running", "Writing chapters…")
-            cover = get_epub_cover(str(job.temp_path))
-            write_book_package(
-                job.output_dir,
-                chapters,
-                source_epub=job.temp_path,
-                cover_image=cover,
-                ruby_evidence=ruby_evidence,
-                apply_overrides=False,
-            )
             completed_steps = base_total + 1
             job.update_progress(
                 completed_steps,
@@ -451,6 +460,8 @@ class UploadManager:
                     job.set_status("running", f"Overrides skipped: {exc}")
 
             job.mark_success()
+        except NLPBackendUnavailableError as exc:
+            job.set_error(str(exc))
         except Exception as exc:
             job.set_error(f"{exc.__class__.__name__}: {exc}")
         finally:
@@ -12,6 +12,7 @@ from PIL import Image
 from nk.book_io import (
     TOKEN_METADATA_VERSION,
     load_book_metadata,
+    load_previous_chapters,
     load_token_metadata,
     update_book_tts_defaults,
     write_book_package,
@@ -74,6 +75,60 @@ def test_write_book_package_emits_metadata_and_cover(tmp_path: Path) -> None:
     assert original_path.read_text(encoding="utf-8") == chapters[0].original_text
 
 
+def test_write_book_package_writes_streamed_chapters_as_they_arrive(tmp_path: Path) -> None:
+    output_dir = tmp_path / "Book"
+
+    def _chapters():
+        yield ChapterText(source="a.xhtml", title="One", text="一", book_title="Streamed")
+        # The first chapter is on disk before the second is produced.
+        assert (output_dir / "001_One.txt").read_text(encoding="utf-8") == "一"
+        yield ChapterText(source="b.xhtml", title="Two", text="二")
+
+    package = write_book_package(output_dir, _chapters())
+    assert [record.path.name for record in package.chapter_records] == ["001_One.txt", "002_Two.txt"]
+    assert package.book_title == "Streamed"
+    assert package.chapter_records[0].chapter.text == ""
+    loaded = load_book_metadata(output_dir)
+    assert loaded is not None
+    assert list(loaded.chapters) == ["001_One.txt", "002_Two.txt"]
+
+
+def test_previous_chapters_are_keyed_by_fingerprint(tmp_path: Path) -> None:
+    output_dir = tmp_path / "Book"
+    tokens = [ChapterToken(surface="一", start=0, end=1, reading="イチ")]
+    chapter = ChapterText(
+        source="a.xhtml",
+        title="One",
+        text="一",
+        original_text="壱",
+        book_title="Fingerprinted",
+        tokens=tokens,
+        fingerprint="f1",
+    )
+    package = write_book_package(output_dir, [chapter], apply_overrides=False)
+    chapter_path = package.chapter_records[0].path
+    loaded = load_book_metadata(output_dir)
+    assert loaded is not None
+    assert loaded.chapters[chapter_path.name].fingerprint == "f1"
+
+    previous = load_previous_chapters(output_dir)
+    assert list(previous) == ["f1"]
+    carried = previous["f1"]
+    assert (carried.text, carried.original_text, carried.source) == ("一", "壱", "a.xhtml")
+    assert carried.tokens == tokens
+    assert previous.get("other") is None
+
+    # An unchanged fingerprint leaves the chapter's files alone.
+    chapter_path.write_text("edited", encoding="utf-8")
+    write_book_package(output_dir, [chapter], apply_overrides=False)
+    assert chapter_path.read_text(encoding="utf-8") == "edited"
+
+    # Carried text already has overrides applied, so editing them drops reuse.
+    custom_path = output_dir / "custom_token.json"
+    custom_path.write_text('{"overrides": []}', encoding="utf-8")
+    assert len(load_previous_chapters(output_dir)) == 0
+
+
 def test_cover_is_padded_to_square(tmp_path: Path) -> None:
     rectangular = tmp_path / "cover_raw.png"
     original = Image.new("RGB", (640, 960), (20, 100, 160))
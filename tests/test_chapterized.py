@@ -9,6 +9,7 @@ pytest.importorskip("fugashi")
 
 from nk.core import (
     epub_to_chapter_texts,
+    iter_epub_chapters,
     _fill_missing_accent_on_chapter_tokens,
     _flag_unidic_ambiguous_tokens,
     _token_should_preserve_surface,
@@ -105,6 +106,151 @@ def test_chapterized_output_matches_join(tmp_path: Path, backend: NLPBackend) ->
         assert first_line == chapters[idx].title
 
 
+def test_each_spine_document_is_parsed_once(
+    tmp_path: Path, backend: NLPBackend, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import nk.core as core
+
+    parsed: list[str] = []
+
+    class _CountingDocument(core._EpubDocument):
+        def __init__(self, name: str, html: str, parser: str = "fast") -> None:
+            parsed.append(name)
+            super().__init__(name, html, parser)
+
+    monkeypatch.setattr(core, "_EpubDocument", _CountingDocument)
+    epub_path = _build_simple_epub(tmp_path)
+    chapters, _ = epub_to_chapter_texts(str(epub_path), nlp=backend)
+    assert len(chapters) == 3
+    for name in ("OEBPS/ch1.xhtml", "OEBPS/ch2.xhtml"):
+        assert parsed.count(name) == 1
+
+
+def test_epub_container_reads_package_once(
+    tmp_path: Path, backend: NLPBackend, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import nk.core as core
+
+    reads: list[str] = []
+    original_read_text = core._zip_read_text
+
+    def _counting_read_text(zf: zipfile.ZipFile, name: str) -> str:
+        reads.append(name)
+        return original_read_text(zf, name)
+
+    monkeypatch.setattr(core, "_zip_read_text", _counting_read_text)
+    epub_path = _build_simple_epub(tmp_path)
+    expected, _ = epub_to_chapter_texts(str(epub_path), nlp=backend)
+    reads.clear()
+    with core.EpubContainer(epub_path) as epub:
+        assert epub.resolve("ch1.xhtml") == "OEBPS/ch1.xhtml"
+        assert epub.resolve("missing.xhtml") is None
+        assert epub.cover is None
+        with iter_epub_chapters(epub, nlp=backend) as stream:
+            chapters = list(stream)
+        assert epub.zf.fp is not None
+    assert epub.zf.fp is None
+    assert [ch.text for ch in chapters] == [ch.text for ch in expected]
+    assert reads.count("META-INF/container.xml") == 1
+    assert reads.count("OEBPS/content.opf") == 1
+
+
+def test_parallel_chapters_match_serial_output(tmp_path: Path, backend: NLPBackend) -> None:
+    epub_path = _build_simple_epub(tmp_path)
+    runs = []
+    for jobs in (1, 2):
+        events: list[tuple[object, object]] = []
+        chapters, _ = epub_to_chapter_texts(
+            str(epub_path),
+            nlp=backend,
+            progress=lambda event: events.append((event.get("event"), event.get("index"))),
+            jobs=jobs,
+        )
+        # Stage timings depend on where members were parsed; see the timing test.
+        events = [event for event in events if event[0] != "stage_timing"]
+        runs.append(([(ch.title, ch.text, ch.original_text, ch.tokens) for ch in chapters], events))
+    assert runs[0] == runs[1]
+    _, events = runs[1]
+    assert events[0] == ("chapter_prepare", None)
+    assert events[1:] == [
+        (name, index) for index in (1, 2, 3) for name in ("chapter_start", "chapter_done")
+    ]
+
+
+def test_progress_reports_stage_timings(tmp_path: Path, backend: NLPBackend) -> None:
+    epub_path = _build_simple_epub(tmp_path)
+    for jobs in (1, 2):
+        events: list[dict[str, object]] = []
+        epub_to_chapter_texts(str(epub_path), nlp=backend, progress=events.append, jobs=jobs)
+        stage_events = [event for event in events if event["event"] == "stage_timing"]
+        assert [event["stage"] for event in stage_events].count("mapping") == 1
+        parsed = [event["source"] for event in stage_events if event["stage"] == "parse"]
+        assert sorted(parsed) == ["OEBPS/ch1.xhtml", "OEBPS/ch2.xhtml", "OEBPS/toc.xhtml"]
+        assert all(event["seconds"] >= 0 for event in stage_events)
+        # Every stage event arrives before the chapters are finalized.
+        prepare = next(i for i, event in enumerate(events) if event["event"] == "chapter_prepare")
+        assert events.index(stage_events[-1]) < prepare
+        done = [event for event in events if event["event"] == "chapter_done"]
+        assert len(done) == 3
+        for event in done:
+            assert set(event["timings"]) == {"tokenize", "tokens", "pitch", "render"}
+
+
+def test_chapter_stream_yields_chapters_incrementally(tmp_path: Path, backend: NLPBackend) -> None:
+    epub_path = _build_simple_epub(tmp_path)
+    expected, expected_evidence = epub_to_chapter_texts(str(epub_path), nlp=backend, jobs=2)
+    events: list[object] = []
+    with iter_epub_chapters(
+        str(epub_path), nlp=backend, progress=lambda event: events.append(event.get("event")), jobs=2
+    ) as stream:
+        # The mapping stage is done up front; no chapter has been finalized yet.
+        assert stream.ruby_evidence == expected_evidence
+        assert "chapter_start" not in events
+        first = next(stream)
+        assert events.count("chapter_start") == 1
+        rest = list(stream)
+    streamed = [first, *rest]
+    assert [(ch.title, ch.text, ch.tokens) for ch in streamed] == [
+        (ch.title, ch.text, ch.tokens) for ch in expected
+    ]
+
+
+def test_reprocess_carries_over_unchanged_chapters(tmp_path: Path, backend: NLPBackend) -> None:
+    from nk.book_io import load_book_metadata, load_previous_chapters, write_book_package
+
+    epub_path = _build_simple_epub(tmp_path)
+    book_dir = tmp_path / "book"
+    with iter_epub_chapters(str(epub_path), nlp=backend) as stream:
+        write_book_package(book_dir, stream, apply_overrides=False)
+    before = load_book_metadata(book_dir)
+    assert before is not None
+    assert all(chapter.fingerprint for chapter in before.chapters.values())
+
+    edited_path = tmp_path / "edited.epub"
+    with zipfile.ZipFile(epub_path) as src, zipfile.ZipFile(edited_path, "w") as dst:
+        for info in src.infolist():
+            data = src.read(info.filename)
+            if info.filename == "OEBPS/ch2.xhtml":
+                data = data.replace(b"second chapter", b"revised second chapter")
+            dst.writestr(info, data)
+
+    events: list[dict[str, object]] = []
+    with iter_epub_chapters(
+        str(edited_path),
+        nlp=backend,
+        progress=events.append,
+        previous=load_previous_chapters(book_dir),
+    ) as stream:
+        rechaptered = list(stream)
+    carried = [event["source"] for event in events if event.get("carried")]
+    assert carried == [ch.source for ch in rechaptered[:2]]
+    assert "revised second chapter" in rechaptered[2].text
+    fresh, _ = epub_to_chapter_texts(str(edited_path), nlp=backend)
+    assert [(ch.title, ch.text, ch.tokens or [], ch.fingerprint) for ch in rechaptered] == [
+        (ch.title, ch.text, ch.tokens or [], ch.fingerprint) for ch in fresh
+    ]
+
+
 def test_repeated_dialogue_lines_are_preserved(tmp_path: Path, backend: NLPBackend) -> None:
     epub_path = tmp_path / "repeat.epub"
     repeat_line = "「……。そうか」"
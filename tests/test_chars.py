@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from nk.chars import (
+    contains_cjk,
+    contains_hiragana,
+    contains_ideograph,
+    hiragana_to_katakana,
+    is_cjk_char,
+    is_kana_char,
+    is_kana_string,
+    normalize_katakana,
+)
+
+
+def test_cjk_classification_covers_extensions_and_marks() -> None:
+    assert is_cjk_char("漢")
+    assert is_cjk_char("㐂")  # Extension A
+    assert is_cjk_char("\U00020b9f")  # Extension B
+    assert is_cjk_char("々")
+    assert not is_cjk_char("あ")
+    assert not is_cjk_char("")
+    assert contains_cjk("ひと々")
+    assert not contains_cjk("ひらがなカタカナ")
+    assert contains_ideograph("\U00020b9f")
+    assert not contains_ideograph("々")
+    assert not contains_ideograph(None)
+
+
+def test_kana_classification() -> None:
+    assert is_kana_char("ー")
+    assert not is_kana_char("゠")
+    assert is_kana_string("カタ・かな ー")
+    assert is_kana_string("")
+    assert not is_kana_string("カナ漢")
+    assert contains_hiragana("カナか")
+    assert not contains_hiragana("カナ")
+
+
+def test_kana_conversion_tables() -> None:
+    assert hiragana_to_katakana("ひらがなゝゞ・ABC") == "ヒラガナヽヾ・ABC"
+    assert normalize_katakana("ﾁﾞヂヅヮヵヶゕゖ") == "ジジズワカケカケ"
+    assert normalize_katakana("カタカナ") == "カタカナ"
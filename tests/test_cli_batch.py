@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+import nk.cli as cli
+
+
+def test_directory_run_continues_past_failed_book(monkeypatch, tmp_path, capsys):
+    for name in ("a.epub", "b.epub", "c.epub"):
+        (tmp_path / name).write_bytes(b"")
+
+    chapterized: list[str] = []
+
+    def _fake_chapterize(epub_path: Path, backend, **kwargs) -> None:
+        if epub_path.name == "b.epub":
+            raise ValueError("not a zip file")
+        chapterized.append(epub_path.name)
+
+    monkeypatch.setattr(cli, "load_backend", lambda: object())
+    monkeypatch.setattr(cli, "_chapterize_epub", _fake_chapterize)
+
+    exit_code = cli.main([str(tmp_path), "--jobs", "1"])
+    output = capsys.readouterr().out
+
+    assert exit_code == 1
+    assert chapterized == ["a.epub", "c.epub"]
+    assert "1 of 3 book(s) failed: b.epub" in output
+
+
+def test_single_book_failure_still_raises(monkeypatch, tmp_path):
+    epub = tmp_path / "a.epub"
+    epub.write_bytes(b"")
+
+    def _fake_chapterize(epub_path: Path, backend, **kwargs) -> None:
+        raise ValueError("not a zip file")
+
+    monkeypatch.setattr(cli, "load_backend", lambda: object())
+    monkeypatch.setattr(cli, "_chapterize_epub", _fake_chapterize)
+
+    with pytest.raises(ValueError, match="not a zip file"):
+        cli.main([str(epub)])
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from nk.core import (
+    _EpubDocument,
+    _NavPoint,
+    _build_mapping_matcher,
+    epub_to_chapter_texts,
+)
+
+
+def _xhtml(body: str, head: str = "") -> str:
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        f"{head}"
+        '<html xmlns="http://www.w3.org/1999/xhtml">\n'
+        "<head><title>T</title></head>\n"
+        f"<body>\n{body}\n</body>\n</html>\n"
+    )
+
+
+def _html(body: str) -> str:
+    return f"<!DOCTYPE html>\n<html><head><title>T</title></head><body>{body}</body></html>"
+
+
+_BODIES = [
+    # Fixtures from test_ruby.py.
+    "<p><ruby><rb>温</rb><rt>ぬく</rt></ruby><ruby><rb>水</rb><rt>みず</rt></ruby>がいる。\n"
+    "  <ruby><rb>温</rb><rt>ぬく</rt></ruby><ruby><rb>水</rb><rt>みず</rt></ruby>も来た。</p>",
+    "<p>\n  <ruby><rb>馬締</rb><rt>まじめ</rt></ruby>が来た。\n</p>",
+    "<p><ruby><rb>東</rb><rt>あずま</rt></ruby><ruby><rb>京</rb><rt>きょう</rt></ruby>は。</p>",
+    # Ruby shapes.
+    "<p><ruby>温水<rp>(</rp><rt>ぬくみず</rt><rp>)</rp></ruby>さん</p>",
+    "<p><ruby>東<!--c-->京<rt>とう<!--x-->きょう</rt></ruby>へ</p>",
+    "<p><ruby><span>五</span><rt><span>ご</span></rt></ruby><ruby>六</ruby></p>",
+    "<p><ruby>外<ruby>内<rt>うち</rt></ruby><rt>そと</rt></ruby></p>",
+    "<p><ruby>一<rt>いち</rt></ruby> <ruby>二<rt>に</rt></ruby><!-- --><ruby>三<rt>さん</rt></ruby>する</p>",
+    "<p><ruby>空<rt></rt></ruby><ruby>JUN<rt>じゅん</rt></ruby>　かな</p>",
+    # Stray ruby text and non-content containers.
+    "<rt>東京</rt><rt><span>温水</span></rt><rp>(</rp><script>温水</script><style>p{}</style>",
+    "<template>温水</template><rt><ruby>七<rt>なな</rt></ruby></rt>",
+    # Whitespace, comments, processing instructions and entities.
+    "<pre>  温水 <b> </b>\n </pre><textarea> \n</textarea>  \n  ",
+    "<p>a<!---->b<?php 温水?>c&amp;d&#12354;<![CDATA[温水]]></p>",
+    # Layout.
+    "<div>外<p>内</p><div>深</div></div><ul><li>項</li></ul><table><tr><td>表</td></tr></table>",
+    "<h2 id='c'>見出し</h2>本文<br/>次<span id='a'>x</span><a name='b'>y</a>",
+    "〝引用〟...……",
+]
+
+_DOCUMENTS = (
+    [_xhtml(body) for body in _BODIES]
+    + [_html(body) for body in _BODIES]
+    + [
+        _xhtml(
+            "<p>本文</p>",
+            head='<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.1//EN" '
+            '"http://www.w3.org/TR/xhtml11/DTD/xhtml11.dtd">\n<!--top-->\n',
+        ),
+        "<p>断片<ruby>水<rt>みず</rt></ruby></p>",
+    ]
+)
+
+_MAPPING = {"温水": "ヌクミズ", "東京": "トウキョウ", "水": "ミズ", "html": "エイチ"}
+
+
+def _nav(*fragments: str | None) -> list[_NavPoint]:
+    return [
+        _NavPoint(order=index, path="x", spine_index=0, fragment=fragment, title=None)
+        for index, fragment in enumerate(fragments)
+    ]
+
+
+def _render(html: str, parser: str, nav: list[_NavPoint]) -> tuple[object, ...]:
+    document = _EpubDocument("x.xhtml", html, parser)
+    text, spans, nav_offsets = document.original_view(nav)
+    reading = document.reading_view(nav, [(_MAPPING, _build_mapping_matcher(_MAPPING))])
+    counts = {
+        base: (dict(acc.counts), dict(acc.suffix_counts), acc.total)
+        for base, acc in document.reading_counts().items()
+    }
+    return text, [(s.start, s.end, s.base, s.reading) for s in spans], nav_offsets, reading, counts
+
+
+@pytest.mark.parametrize("html", _DOCUMENTS)
+@pytest.mark.parametrize(
+    "nav",
+    [_nav(), _nav(None), _nav("c", "missing", None), _nav("a", "b")],
+    ids=["no-nav", "file", "fallbacks", "fragments"],
+)
+def test_fast_parser_matches_bs4(html: str, nav: list[_NavPoint]) -> None:
+    fast = _EpubDocument("x.xhtml", html, "fast")
+    assert fast.tree is not None
+    assert _render(html, "fast", nav) == _render(html, "bs4", nav)
+
+
+def test_fast_parser_falls_back_to_bs4_for_unparseable_input() -> None:
+    document = _EpubDocument("x.xhtml", "", "fast")
+    assert document.tree is None
+    assert document.original_view([]) == ("", [], [])
+
+
+@pytest.mark.parametrize("parser", ["fast", "bs4"])
+def test_original_view_records_spans_and_nav_offsets(parser: str) -> None:
+    html = _xhtml(
+        "<p>前<ruby>東京<rt>とうきょう</rt></ruby>…</p>"
+        "<h2 id='c'>章</h2><p><ruby>外<ruby>内<rt>うち</rt></ruby><rt>そと</rt></ruby>[[NKR:1]]</p>"
+    )
+    document = _EpubDocument("x.xhtml", html, parser)
+
+    text, spans, nav_offsets = document.original_view(_nav("c"))
+
+    # Nested ruby folds into the outer span and literal marker-like text
+    # in the document is left alone.
+    assert text == "前東京…\n\n\n章\n外内[[NKR:1]]"
+    assert [(text[s.start : s.end], s.reading) for s in spans] == [("東京", "トウキョウ"), ("外内", "ソト")]
+    assert nav_offsets == [(0, 5)]
+
+
+def test_unknown_parser_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        epub_to_chapter_texts("missing.epub", parser="html5")
+
+
+def test_fast_parser_matches_bs4_on_example_book() -> None:
+    pytest.importorskip("fugashi")
+    from nk.nlp import NLPBackend
+
+    backend = NLPBackend()
+    epub_path = Path("example/[夏目漱石] 夢十夜.epub")
+    results = []
+    for parser in ("fast", "bs4"):
+        chapters, evidence = epub_to_chapter_texts(str(epub_path), nlp=backend, parser=parser)
+        results.append(
+            (
+                [(ch.title, ch.text, ch.original_text, ch.pitch_data) for ch in chapters],
+                evidence,
+            )
+        )
+    assert results[0] == results[1]
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+
+
+def test_service_client_matches_in_process_backend(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytest.importorskip("fugashi")
+    import nk.core as core
+    from nk.nlp import NLPBackend, load_backend
+    import nk.nlpd as nlpd
+    from nk.nlpd import NLPServiceClient, start_service
+
+    socket_path = tmp_path / "nlpd.sock"
+    monkeypatch.setenv("NK_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("NK_NLPD_SOCKET", str(socket_path))
+    assert isinstance(load_backend(), NLPBackend)
+    assert not isinstance(load_backend(), NLPServiceClient)
+
+    service = start_service(pool_size=1)
+    thread = threading.Thread(target=service.serve_forever, daemon=True)
+    thread.start()
+    try:
+        assert socket_path.stat().st_mode & 0o777 == 0o600
+        client = load_backend()
+        assert isinstance(client, NLPServiceClient)
+        local = NLPBackend()
+        assert client.dictionary_id == local.dictionary_id
+        texts = ["他は", "父親は", "吾輩は猫である。名前はまだ無い。" * 3, "他は"]
+        assert client.to_reading_text_many(texts) == local.to_reading_text_many(texts)
+        assert client.to_reading_with_pitch(texts[2]) == local.to_reading_with_pitch(texts[2])
+        # Long text is streamed a chunk of rows at a time.
+        monkeypatch.setattr(nlpd, "_REQUEST_CHARS", 40)
+        monkeypatch.setattr(nlpd, "_STREAM_ROWS", 4)
+        stream = client.iter_tokens(texts[2])
+        assert not isinstance(stream, list)
+        assert list(stream) == local.tokenize(texts[2])
+        assert client.to_reading_with_pitch(texts[2]) == local.to_reading_with_pitch(texts[2])
+        next(client.iter_tokens(texts[2] * 2))  # abandoned mid-stream
+        assert client.to_reading_text_many(texts) == local.to_reading_text_many(texts)
+        # --jobs workers keep their own tagger instead of queueing on the service.
+        core._init_chapter_worker(None)
+        assert core._WORKER_BACKEND.__class__ is NLPBackend
+        core._WORKER_BACKEND = None
+    finally:
+        service.shutdown()
+        service.close()
+        thread.join(timeout=5)
+    assert not socket_path.exists()
+
+    # With the service gone the client keeps working in-process.
+    with pytest.warns(RuntimeWarning, match="nk nlpd unavailable"):
+        assert client.to_reading_text("自転車") == local.to_reading_text("自転車")
+    assert load_backend().__class__ is NLPBackend
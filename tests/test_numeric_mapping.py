@@ -1,4 +1,13 @@
-from nk.core import _apply_mapping_to_plain_text
+import random
+import re
+
+from nk.core import (
+    _ContextRule,
+    _MappingMatcher,
+    _apply_mapping_to_plain_text,
+    _build_mapping_matcher,
+    _iter_mapping_matches,
+)
 
 
 def test_numeric_mapping_skips_longer_numbers() -> None:
@@ -20,3 +29,35 @@ def test_digit_prefixed_base_skips_when_part_of_larger_number() -> None:
     text = "17日"
     result = _apply_mapping_to_plain_text(text, mapping, context_rules=None, source_labels={"7日": "nhk"})
     assert result == "17日"
+
+
+def test_matcher_agrees_with_longest_first_alternation() -> None:
+    rng = random.Random(7)
+    alphabet = "東京都人日一3４a\n-]^\\"
+    for _ in range(500):
+        bases = {
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+            for _ in range(rng.randint(1, 10))
+        }
+        text = "".join(rng.choice(alphabet + "xy") for _ in range(rng.randint(0, 40)))
+        pattern = re.compile("|".join(re.escape(b) for b in sorted(bases, key=len, reverse=True)))
+        expected = [(m.start(), m.end(), m.group(0)) for m in pattern.finditer(text)]
+        assert list(_MappingMatcher(bases).finditer(text)) == expected
+
+
+def test_rejected_match_is_not_retried_with_a_shorter_base() -> None:
+    mapping = {"1日": "ツイタチ", "日": "ニチ"}
+    matcher = _build_mapping_matcher(mapping)
+    assert list(matcher.finditer("11日")) == [(1, 3, "1日")]
+    # 1日 is rejected inside a longer number and 日 is not tried in its place.
+    assert _apply_mapping_to_plain_text("11日", mapping, matcher=matcher) == "11日"
+    assert _apply_mapping_to_plain_text("1日", mapping, matcher=matcher) == "ツイタチ"
+
+
+def test_context_rule_applies_with_prebuilt_matcher() -> None:
+    mapping = {"十日": "トオカ", "日": "ニチ"}
+    matcher = _build_mapping_matcher(mapping)
+    rules = {"日": _ContextRule(prefixes=("3",), max_prefix=1)}
+    assert _apply_mapping_to_plain_text("3日と4日", mapping, rules, matcher=matcher) == "3ニチと4日"
+    matches = _iter_mapping_matches("3日と十日", mapping, rules, matcher)
+    assert [(start, base) for start, _, base, _ in matches] == [(1, "日"), (3, "十日")]
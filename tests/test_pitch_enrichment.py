@@ -1,10 +1,15 @@
+import itertools
 from collections.abc import Iterable
 
-from nk.core import _fill_missing_pitch_from_surface
+import nk.core as core
+from nk.core import _fill_missing_accent_on_chapter_tokens, _fill_missing_pitch_from_surface
+from nk.tokens import ChapterToken
 from nk.pitch import PitchToken
 
 
 class DummyBackend:
+    dictionary_id: str | None = None
+
     def __init__(self, responses: dict[str, tuple[str, Iterable[PitchToken]]]):
         self._responses = responses
         self.calls: list[str] = []
@@ -87,3 +92,62 @@ def test_fill_missing_pitch_skips_unidic_sources() -> None:
     _fill_missing_pitch_from_surface(tokens, backend)
     assert tokens[0].accent_type is None
     assert backend.calls == []
+
+
+def test_surface_pitch_cache_persists_across_backends(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("NK_CACHE_DIR", str(tmp_path))
+    responses = {
+        "自分": ("ジブン", [_pitch_token("自分", "ジブン", 0, "C2", "名詞")]),
+        "子供": ("コドモ", [_pitch_token("子供", "コドモ", None, None, "名詞")]),
+    }
+
+    def _backend() -> DummyBackend:
+        backend = DummyBackend(responses)
+        backend.dictionary_id = "unidic:test"
+        return backend
+
+    def _tokens() -> list[ChapterToken]:
+        return [
+            ChapterToken(surface="自分", start=0, end=2, reading="ジブン", reading_source="nhk"),
+            ChapterToken(surface="子供", start=2, end=4, reading="コドモ", reading_source="nhk"),
+        ]
+
+    first = _backend()
+    tokens = _tokens()
+    _fill_missing_accent_on_chapter_tokens(tokens, first)
+    core._SurfacePitchCache.for_backend(first).close()
+    assert first.calls == ["自分", "子供"]
+    assert (tokens[0].accent_type, tokens[0].accent_connection) == (0, "C2")
+
+    # Another backend on the same dictionary answers both surfaces from disk,
+    # including the one without an accent.
+    second = _backend()
+    tokens = _tokens()
+    _fill_missing_accent_on_chapter_tokens(tokens, second)
+    assert second.calls == []
+    assert (tokens[0].accent_type, tokens[0].pos) == (0, "名詞")
+    assert tokens[1].accent_type is None and not tokens[1].reading_validated
+
+    # A different dictionary does not share rows.
+    other = _backend()
+    other.dictionary_id = "unidic:other"
+    _fill_missing_accent_on_chapter_tokens(_tokens(), other)
+    assert other.calls == ["自分", "子供"]
+
+
+def test_surface_pitch_cache_drops_least_recently_used_rows(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(core, "_SURFACE_PITCH_PRUNE_INTERVAL", 1)
+    clock = itertools.count(1_000)
+    monkeypatch.setattr(core.time, "time", lambda: next(clock))
+    backend = DummyBackend(
+        {surface: (surface, [_pitch_token(surface, "ア", 1)]) for surface in ("甲", "乙", "丙")}
+    )
+    cache = core._SurfacePitchCache(tmp_path / "cache.sqlite3", "unidic:test", max_entries=2)
+    for surface in ("甲", "乙", "丙"):
+        cache.lookup(surface, backend)
+        cache.flush()
+    cache.close()
+    reopened = core._SurfacePitchCache(tmp_path / "cache.sqlite3", "unidic:test", max_entries=2)
+    reopened.lookup("甲", backend)
+    reopened.lookup("丙", backend)
+    assert backend.calls == ["甲", "乙", "丙", "甲"]
@@ -1,10 +1,28 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import zipfile
+from pathlib import Path
+
 from bs4 import BeautifulSoup
 from types import SimpleNamespace
 
-from nk.core import _collect_reading_counts_from_soup, _select_reading_mapping
+import nk.core as core
+from nk.core import (
+    HTML_EXTS,
+    _EpubSession,
+    _collect_reading_counts_from_soup,
+    _CorpusReadingIndex,
+    _compute_corpus_mapping,
+    _corpus_accumulators_from_entries,
+    _corpus_reading_mapping,
+    _iter_member_reading_counts,
+    _load_corpus_reading_accumulators,
+    _select_reading_mapping,
+    _write_corpus_reading_index,
+)
 
 import pytest
 
@@ -110,6 +128,106 @@ def test_suffix_context_allows_nlp_confirmation() -> None:
     assert unique.get("東京") == "アズマキョウ"
 
 
+def test_parallel_member_reading_counts_match_serial() -> None:
+    epub_path = Path("example/[夏目漱石] 夢十夜.epub")
+    with zipfile.ZipFile(epub_path) as zf:
+        names = [name for name in zf.namelist() if name.lower().endswith(HTML_EXTS)]
+        runs = [
+            [
+                {base: vars(acc) for base, acc in partial.items()}
+                for partial in _iter_member_reading_counts(zf, names, _EpubSession(zf), jobs)
+            ]
+            for jobs in (1, 2)
+        ]
+    assert len(runs[0]) == len(names)
+    assert any(runs[0])
+    assert runs[0] == runs[1]
+
+
+def test_corpus_index_materializes_json_accumulators(tmp_path) -> None:
+    entries = [
+        {
+            "base": "刑務所",
+            "reading": "けいむしょ",
+            "count": 5,
+            "suffixes": [{"value": "に", "count": 3}, {"value": "", "count": 2}],
+        },
+        {"base": "ＡＩ", "reading": "エーアイ", "count": 4, "suffix": "を"},
+        {
+            "base": "人",
+            "reading": "にん",
+            "count": 7,
+            "prefixes": [{"value": "３", "count": 6}, {"value": "十", "count": 1}],
+        },
+        {"base": "AI", "reading": "えーあい", "count": 9},
+        {"base": "", "reading": "ない", "count": 1},
+    ]
+    source = json.dumps(entries, ensure_ascii=False).encode("utf-8")
+    expected = _corpus_accumulators_from_entries(entries)
+    index_path = tmp_path / "readings.idx"
+    _write_corpus_reading_index(expected, index_path, source=source)
+
+    index = _CorpusReadingIndex(index_path.read_bytes())
+    assert index.source_digest == hashlib.sha256(source).hexdigest()
+    assert list(index) == list(expected) == ["刑務所", "AI", "人"]
+    for base, accumulator in expected.items():
+        assert vars(index[base]) == vars(accumulator)
+    assert index.get("所") is None
+    assert "人" in index and "刑務" not in index
+
+
+def test_corpus_index_is_ignored_after_same_size_json_edit(tmp_path, monkeypatch) -> None:
+    entries = [{"base": "刑務所", "reading": "けいむしょ", "count": 5}]
+    source = json.dumps(entries, ensure_ascii=False).encode("utf-8")
+    _write_corpus_reading_index(
+        _corpus_accumulators_from_entries(entries),
+        tmp_path / "nhk_easy_readings.idx",
+        source=source,
+    )
+    json_path = tmp_path / "nhk_easy_readings.json"
+    json_path.write_bytes(source)
+    monkeypatch.setattr(core.resources, "files", lambda package: tmp_path)
+    assert isinstance(core._open_corpus_reading_index(), _CorpusReadingIndex)
+
+    json_path.write_bytes(source.replace(b'"count": 5', b'"count": 6'))
+    assert json_path.stat().st_size == len(source)
+    assert core._open_corpus_reading_index() is None
+
+
+def test_shipped_corpus_index_matches_json() -> None:
+    index = _load_corpus_reading_accumulators()
+    assert isinstance(index, _CorpusReadingIndex)
+    source = Path("src/nk/data/nhk_easy_readings.json").read_bytes()
+    assert index.source_digest == hashlib.sha256(source).hexdigest()
+    assert len(index) == len(_corpus_accumulators_from_entries(json.loads(source)))
+
+
+def test_corpus_mapping_is_cached_on_disk(tmp_path, monkeypatch) -> None:
+    class _CachedMock(_MockNLP):
+        dictionary_id = "unidic:test"
+
+    monkeypatch.setenv("NK_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(core, "_CORPUS_MAPPING_CACHE", {})
+    expected = _compute_corpus_mapping(_CachedMock())
+    assert expected.tier3
+
+    assert _corpus_reading_mapping(_CachedMock()) == expected
+    cache_files = list(tmp_path.glob("corpus-mapping-*.json"))
+    assert len(cache_files) == 1
+
+    # A fresh process reads the decisions back from disk without selecting.
+    monkeypatch.setattr(core, "_CORPUS_MAPPING_CACHE", {})
+    monkeypatch.setattr(core, "_compute_corpus_mapping", None)
+    assert _corpus_reading_mapping(_CachedMock()) == expected
+
+    # A different nk version is a different cache entry.
+    monkeypatch.setattr(core, "_CORPUS_MAPPING_CACHE", {})
+    monkeypatch.setattr(core, "_compute_corpus_mapping", _compute_corpus_mapping)
+    monkeypatch.setattr(core, "_nk_version", lambda: "999.0")
+    _corpus_reading_mapping(_CachedMock())
+    assert len(list(tmp_path.glob("corpus-mapping-*.json"))) == 2
+
+
 def test_nlp_backend_preserves_and_reports_kana_forms() -> None:
     pytest.importorskip("fugashi")
     from nk.nlp import NLPBackend
@@ -120,6 +238,123 @@ def test_nlp_backend_preserves_and_reports_kana_forms() -> None:
     assert "ギョウジヨサン" in reading
 
 
+def test_nlp_backend_memoizes_short_tokenizations() -> None:
+    pytest.importorskip("fugashi")
+    from nk.nlp import NLPBackend
+
+    backend = NLPBackend()
+    reading = backend.to_reading_text("行事予算")
+    assert backend.token_cache_stats()["misses"] == 1
+    assert backend.to_reading_text("行事予算") == reading
+    assert backend.token_cache_stats()["hits"] == 1
+    # Callers of tokenize() get copies, so edits do not leak into the cache.
+    backend.tokenize("行事予算")[0].reading = "ダミー"
+    assert backend.to_reading_text("行事予算") == reading
+    # Chapter-length input bypasses the cache.
+    backend.tokenize("行事予算" * 20)
+    stats = backend.token_cache_stats()
+    assert (stats["misses"], stats["size"]) == (1, 1)
+
+
+def test_nlp_backend_batch_api_matches_single_calls() -> None:
+    pytest.importorskip("fugashi")
+    from nk.nlp import NLPBackend
+
+    backend = NLPBackend()
+    texts = ["他は", "その他", "父親は", "他は", ""]
+    assert backend.to_reading_text_many(texts) == [backend.to_reading_text(t) for t in texts]
+    batched = backend.tokenize_many(texts)
+    assert [[t.reading for t in tokens] for tokens in batched] == [
+        [t.reading for t in backend.tokenize(text)] for text in texts
+    ]
+    assert batched[0] is not batched[3]
+
+
+def test_nlp_backend_char_fallback_is_memoized_and_kakasi_lazy(monkeypatch) -> None:
+    pytest.importorskip("fugashi")
+    import nk.nlp as nlp
+    from nk.nlp import NLPBackend
+
+    monkeypatch.setattr(nlp, "_CHAR_READINGS", {})
+    backend = NLPBackend()
+    assert backend._kakasi_converter is None
+    assert backend._reading_for_char("枕") == "マクラ"
+    assert backend._kakasi_converter is None
+    # UniDic has no reading for 綯 on its own; pykakasi is built on demand.
+    assert backend._reading_for_char("綯") == "トウ"
+    assert backend._kakasi_converter is not None
+
+    def _no_tagger(text: str):
+        raise AssertionError("single-character reading was not memoized")
+
+    other = NLPBackend()
+    other._tagger = _no_tagger
+    assert other._reading_for_char("綯") == "トウ"
+    assert other._kakasi_converter is None
+
+
+def test_nlp_backend_windowed_tokenization_matches_whole_text(monkeypatch) -> None:
+    pytest.importorskip("fugashi")
+    import nk.nlp as nlp
+    from nk.nlp import NLPBackend
+
+    chapter = Path("example/[夏目漱石] 夢十夜/004_第三夜.original.txt").read_text(encoding="utf-8")
+    text = chapter + "今年の12日と20日、御父上様に会う。\n" * 30
+    backend = NLPBackend()
+    whole = backend.tokenize(text)
+    whole_pitch = backend.to_reading_with_pitch(text)
+
+    monkeypatch.setattr(nlp, "_TOKENIZE_WINDOW", 300)
+    monkeypatch.setattr(nlp, "_TOKENIZE_OVERLAP", 100)
+    streamed = backend.iter_tokens(text)
+    assert not isinstance(streamed, list)
+    assert list(streamed) == whole
+    assert backend.to_reading_with_pitch(text) == whole_pitch
+    assert any(token.surface == "日" and token.reading == "ニチ" for token in whole)
+
+
+def test_backend_pool_reuses_and_limits_backends() -> None:
+    import threading
+
+    from nk.nlp import NLPBackendPool, NLPBackendUnavailableError
+
+    built: list[object] = []
+    failures = [NLPBackendUnavailableError("no tagger")]
+
+    def _factory() -> object:
+        if failures:
+            raise failures.pop()
+        built.append(object())
+        return built[-1]
+
+    pool = NLPBackendPool(size=1, factory=_factory)
+    with pytest.raises(NLPBackendUnavailableError):
+        with pool.borrow():
+            pass
+    pool.warm()
+    with pool.borrow() as first:
+        pass
+    with pool.borrow() as second:
+        assert second is first
+        waiter_got: list[object] = []
+        waiter = threading.Thread(
+            target=lambda: waiter_got.append(pool.borrow().__enter__())
+        )
+        waiter.start()
+        waiter.join(timeout=0.2)
+        assert waiter.is_alive()
+    waiter.join(timeout=5)
+    assert waiter_got == [first]
+    assert len(built) == 1
+
+    # Warming a larger pool to one backend leaves the rest to borrow().
+    lazy = NLPBackendPool(size=2, factory=_factory)
+    lazy.warm_in_background(1).join(timeout=5)
+    assert len(built) == 2
+    with lazy.borrow(), lazy.borrow():
+        assert len(built) == 3
+
+
 def test_nlp_backend_prefers_hoka_for_independent_ta() -> None:
     pytest.importorskip("fugashi")
     from nk.nlp import NLPBackend
@@ -2,8 +2,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from nk.core import _RubySpan, _build_chapter_tokens_from_original, _render_text_from_tokens
-from nk.tokens import ChapterToken
+from nk.core import (
+    _CoverageIndex,
+    _RubySpan,
+    _SurfaceOccurrences,
+    _build_chapter_tokens_from_original,
+    _finalize_rendered_text,
+    _render_text_from_tokens,
+)
+from nk.tokens import ChapterToken, tokens_to_pitch_tokens
 
 
 @dataclass
@@ -161,3 +168,53 @@ def test_conflict_between_ruby_and_unidic_blocks_surface_preservation() -> None:
     assert "蛙" not in rendered
     assert "カエル" in rendered
     assert "カワズ" in rendered
+
+
+def test_finalize_rendered_text_remaps_tokens_once() -> None:
+    text = "\nタイトル\n著者\n本文です......\n次の行…….\n"
+    tokens = [
+        ChapterToken(surface="著者", start=0, end=2, transformed_start=6, transformed_end=8),
+        ChapterToken(surface="次", start=0, end=1, transformed_start=20, transformed_end=21),
+    ]
+    rendered, remapped = _finalize_rendered_text(text, tokens)
+    assert rendered == "タイトル\n\n著者\n\n本文です…\n\n次の行…."
+    assert remapped is tokens
+    assert rendered[tokens[0].transformed_start : tokens[0].transformed_end] == "著者"
+    assert rendered[tokens[1].transformed_start : tokens[1].transformed_end] == "次"
+
+
+def test_coverage_index_reports_overlaps() -> None:
+    coverage = _CoverageIndex()
+    coverage.add(10, 20)
+    coverage.add(0, 5)
+    assert coverage.is_free(5, 10)
+    assert not coverage.is_free(4, 6)
+    assert not coverage.is_free(19, 25)
+    assert not coverage.is_free(12, 12)
+    assert coverage.is_free(20, 20)
+
+
+def test_surface_occurrences_are_non_overlapping() -> None:
+    occurrences = _SurfaceOccurrences("ああああ漢字ああ")
+    assert occurrences.positions("ああ") == [0, 2, 6]
+    assert occurrences.positions("漢字") == [4]
+    assert occurrences.positions("字あ") == [5]
+    assert occurrences.positions("") == []
+
+
+def test_chapter_tokens_are_slotted_and_convert_to_pitch_tokens() -> None:
+    token = ChapterToken(
+        surface="漢字",
+        start=3,
+        end=5,
+        reading="カンジ",
+        reading_source="unidic",
+        transformed_start=3,
+        transformed_end=6,
+    )
+    pitch = tokens_to_pitch_tokens([token])[0]
+    shifted = pitch.with_offsets(10, 13)
+    for instance in (token, pitch, shifted):
+        assert not hasattr(instance, "__dict__")
+    assert (pitch.reading, pitch.start, pitch.end, pitch.sources) == ("カンジ", 3, 6, ("unidic",))
+    assert (shifted.start, shifted.end, shifted.original_start) == (10, 13, 3)